@@ -0,0 +1,50 @@
+"""
+Example usage of ChromaStore against an on-disk Chroma database in ./chroma_test_data (requires chromadb).
+
+    python examples/chroma_store_demo.py
+"""
+import asyncio
+from datetime import datetime, timezone
+
+from tethercore_engine.memory_graph.chroma_store import ChromaStore
+from tethercore_engine.memory_graph.models import EchoCreate
+
+async def main():
+    store = ChromaStore(path="./chroma_test_data") # Use a test path
+    try:
+        await store.connect()
+
+        new_echo_data = EchoCreate(
+            content="A test Echo for ChromaDB!",
+            tags=["test", "chroma"],
+            user_id="user_chroma_test",
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
+        )
+        created_echo = await store.add_echo(new_echo_data)
+        print(f"Chroma - Created Echo: {created_echo}")
+
+        if created_echo:
+            retrieved_echo = await store.get_echo(created_echo.id)
+            print(f"Chroma - Retrieved Echo: {retrieved_echo}")
+
+            all_echos = await store.list_echos(limit=5)
+            print(f"Chroma - Listed Echos: {all_echos}")
+
+            # Text search (ensure your collection has an appropriate embedding function)
+            # search_results = await store.search_echos_by_text("test Chroma", limit=2)
+            # print(f"Chroma - Search results (text): {search_results}")
+
+            # await store.delete_echo(created_echo.id)
+            # print(f"Chroma - Echo deleted: {await store.get_echo(created_echo.id) is None}")
+
+    except Exception as e:
+        print(f"An error occurred in Chroma example: {e}")
+    finally:
+        await store.disconnect()
+        # Clean up test data directory if needed
+        # import shutil
+        # shutil.rmtree("./chroma_test_data", ignore_errors=True)
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,67 @@
+"""
+Demonstrates how load_app_config layers YAML, .env and environment variables.
+Runs in a temporary directory so it never touches a real config/tether_config.yaml or .env.
+
+    python examples/config_loader_demo.py
+"""
+import os
+import tempfile
+
+from tethercore_engine.core.config_loader import load_app_config
+
+DUMMY_YAML_CONTENT = """
+app_name: "TetherCore (from YAML)"
+environment: "test_yaml"
+debug_mode: false # Overridden by env var if TETHER_DEBUG_MODE is set
+
+llm_router:
+  default_model: "ollama/phi-3-from-yaml"
+  available_models:
+    - "ollama/phi-3-from-yaml"
+    - "ollama/mistral-from-yaml"
+
+vector_store:
+  provider: "chroma"
+  chroma_path: "./test_chroma_data_yaml"
+"""
+
+DUMMY_ENV_CONTENT = """
+TETHER_DEBUG_MODE=True
+TETHERCORE__LLM_ROUTER__DEFAULT_MODEL="ollama/mistral-from-env"
+TETHERCORE__VECTOR_STORE__WEAVIATE_URL="http://localhost:9090"
+# TETHER_ADMIN_EMAIL="admin_from_env@example.com"
+"""
+
+def main():
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            os.makedirs("config")
+            os.makedirs("test_chroma_data_yaml") # chroma_path must point to an existing directory
+            yaml_path = "config/tether_config.yaml"
+            with open(yaml_path, 'w') as f:
+                f.write(DUMMY_YAML_CONTENT)
+            with open(".env", 'w') as f:
+                f.write(DUMMY_ENV_CONTENT)
+
+            config = load_app_config(config_file_path=yaml_path)
+            print("\n--- Loaded Config ---")
+            print(config.model_dump_json(indent=2))
+
+            print(f"\nApp Name: {config.app_name}") # Should be from YAML
+            print(f"Environment: {config.environment}") # Should be from YAML
+            print(f"Debug Mode: {config.debug_mode}") # Should be True (from .env)
+            print(f"LLM Default Model: {config.llm_router['default_model']}") # Should be from .env
+            print(f"LLM Available Models: {config.llm_router['available_models']}") # Should be from YAML
+            print(f"Vector Store Provider: {config.vector_store['provider']}") # Should be from YAML
+            print(f"Chroma Path: {config.vector_store['chroma_path']}") # Should be from YAML
+            print(f"Weaviate URL: {config.vector_store['weaviate_url']}") # Should be from .env
+            # print(f"Admin Email: {config.TETHER_ADMIN_EMAIL}") # Should be from .env
+        except Exception as e:
+            print(f"Error in example: {e}")
+        finally:
+            os.chdir(original_cwd)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""
+Example usage of LLMRouterService (requires an async context to run acompletion).
+
+    python examples/llm_router_demo.py
+"""
+import asyncio
+
+from tethercore_engine.llm_router.service import LLMRouterService
+
+async def main():
+    router = LLMRouterService(config={"default_model": "ollama/mistral"}) # Ensure Ollama is running
+    models = router.list_available_models()
+    print(f"Available models: {models}")
+
+    try:
+        response_text = await router.query("Hello, world! Tell me a joke.")
+        print(f"LLM Response: {response_text}")
+    except Exception as e:
+        print(f"Error during example query: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""
+Shows how the memory graph models (EchoCreate, Echo, EchoFilter) are built and serialized.
+
+    python examples/models_demo.py
+"""
+import uuid
+from datetime import datetime, timezone
+
+from tethercore_engine.memory_graph.models import Echo, EchoCreate, EchoFilter
+
+def main():
+    # Create an Echo
+    echo_to_create = EchoCreate(
+        content="This is my first thought for TetherCore's memory graph!",
+        tags=["project-tether", "idea", "memory-graph"],
+        user_id="user_cj_taylor"
+    )
+    print("Echo to Create:")
+    print(echo_to_create.model_dump_json(indent=2))
+    print(f"Created at (UTC): {echo_to_create.created_at}")
+
+    # Simulate an Echo retrieved from DB
+    retrieved_echo_data = {
+        "id": str(uuid.uuid4()),
+        "content": "Retrieved thought about AI ethics.",
+        "tags": ["ai", "ethics", "important"],
+        "user_id": "user_cj_taylor",
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc),
+        "metadata": {"source": "manual_entry", "priority": "high"}
+    }
+    retrieved_echo = Echo(**retrieved_echo_data)
+    print("\nRetrieved Echo:")
+    print(retrieved_echo.model_dump_json(indent=2))
+
+    # Filter example
+    echo_filter = EchoFilter(
+        tags_include_any=["idea", "important"],
+        user_id="user_cj_taylor",
+        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    print("\nEcho Filter:")
+    print(echo_filter.model_dump_json(indent=2))
+
+if __name__ == "__main__":
+    main()
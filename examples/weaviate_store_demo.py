@@ -0,0 +1,54 @@
+"""
+Example usage of WeaviateStore, typically called from a service layer (requires a running Weaviate instance).
+
+    python examples/weaviate_store_demo.py
+"""
+import asyncio
+from datetime import datetime, timezone
+
+from tethercore_engine.memory_graph.weavite_store import WeaviateStore
+from tethercore_engine.memory_graph.models import EchoCreate
+
+async def main():
+    store = WeaviateStore()
+    try:
+        await store.connect()
+        # Ensure schema
+        # await store.ensure_schema() # connect calls this
+
+        # Add an Echo
+        new_echo_data = EchoCreate(
+            content="This is a test Echo from WeaviateStore example!",
+            tags=["test", "weaviate"],
+            user_id="user123",
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)
+        )
+        created_echo = await store.add_echo(new_echo_data)
+        print(f"Created Echo: {created_echo}")
+
+        if created_echo:
+            # Get the Echo
+            retrieved_echo = await store.get_echo(created_echo.id)
+            print(f"Retrieved Echo: {retrieved_echo}")
+
+            # List Echos
+            all_echos = await store.list_echos(limit=5)
+            print(f"Listed Echos: {all_echos}")
+
+            # Search Echos (requires a vector or text if using text2vec module)
+            # If Weaviate generates vectors, you might not need to provide one explicitly for text search
+            # search_results_text = await store.search_echos_by_text("test Echo", limit=2)
+            # print(f"Search results (text): {search_results_text}")
+
+            # Delete Echo
+            # deleted = await store.delete_echo(created_echo.id)
+            # print(f"Echo deleted: {deleted}")
+
+    except Exception as e:
+        print(f"An error occurred in Weaviate example: {e}")
+    finally:
+        await store.disconnect()
+
+if __name__ == "__main__":
+    asyncio.run(main())
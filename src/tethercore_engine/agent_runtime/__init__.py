@@ -1,6 +1,6 @@
 # This file makes 'agent_runtime' a Python sub-package.
 
 from .runner_service import AgentRunnerService
-from .manifest_parser import AgentManifest, parse_agent_manifest
+from .manifest_parser import AgentManifest, parse_agent_manifest, dump_manifest
 
-__all__ = ["AgentRunnerService", "AgentManifest", "parse_agent_manifest"]
+__all__ = ["AgentRunnerService", "AgentManifest", "parse_agent_manifest", "dump_manifest"]
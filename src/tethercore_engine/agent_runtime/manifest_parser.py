@@ -1,7 +1,19 @@
-from pydantic import BaseModel, Field, validator, HttpUrl
-from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, Field, TypeAdapter, field_validator, HttpUrl
+from typing import Callable, List, Optional, Dict, Any, Union
+import functools
+import os
+import re
 import yaml
-import json
+
+# Prefer the libyaml-backed loader when PyYAML was built against it; same output, much faster parse.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_AGENT_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+try:
+    import orjson # Optional: faster JSON encoding for manifest dumps
+except ImportError:
+    orjson = None
 
 class AgentRuntimeConfig(BaseModel):
     """Configuration for the agent's runtime environment."""
@@ -46,17 +58,39 @@ class AgentManifest(BaseModel):
     tags: Optional[List[str]] = Field(default_factory=list, description="Keywords or tags for categorizing the agent.")
     custom_config: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Agent-specific custom configuration parameters.")
 
-    @validator('agent_id')
-    def agent_id_format(cls, value):
-        # Example validator: agent_id should be simple, no spaces
-        if not value.isalnum() and '_' not in value and '-' not in value:
+    @field_validator('agent_id', mode="after")
+    @classmethod
+    def agent_id_format(cls, value: str) -> str:
+        # agent_id should be simple: letters, digits, underscores or hyphens, no spaces
+        if not _AGENT_ID_RE.match(value):
             raise ValueError("agent_id must be alphanumeric with optional underscores/hyphens.")
         return value.lower()
 
+# Built once; reused for every manifest so validation goes straight to the prebuilt core validator.
+_MANIFEST_ADAPTER = TypeAdapter(AgentManifest)
+
+def _load_yaml_manifest(file_path: str) -> AgentManifest:
+    with open(file_path, 'r') as f:
+        manifest_data = yaml.load(f, Loader=Loader)
+    return _MANIFEST_ADAPTER.validate_python(manifest_data)
+
+def _load_json_manifest(file_path: str) -> AgentManifest:
+    with open(file_path, 'rb') as f:
+        # Validate the raw bytes directly; pydantic-core parses JSON without an intermediate dict.
+        return _MANIFEST_ADAPTER.validate_json(f.read())
+
+# Lower-cased file suffix -> loader. Add new manifest formats here.
+_MANIFEST_LOADERS: Dict[str, Callable[[str], AgentManifest]] = {
+    ".yaml": _load_yaml_manifest,
+    ".yml": _load_yaml_manifest,
+    ".json": _load_json_manifest,
+}
 
 def parse_agent_manifest(file_path: str) -> Optional[AgentManifest]:
     """
     Parses an agent manifest file (JSON or YAML) into an AgentManifest object.
+    Results are cached per (path, mtime, size), so repeated loads of an unchanged
+    manifest skip the read/parse/validate work. Treat the returned object as read-only.
 
     Args:
         file_path (str): The path to the manifest file.
@@ -64,27 +98,42 @@ def parse_agent_manifest(file_path: str) -> Optional[AgentManifest]:
     Returns:
         Optional[AgentManifest]: The parsed AgentManifest object, or None if parsing fails.
     """
+    loader = _MANIFEST_LOADERS.get(os.path.splitext(file_path)[1].lower())
+    if loader is None:
+        print(f"Unsupported manifest file format: {file_path}. Please use JSON or YAML.")
+        return None
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        print(f"Manifest file not found: {file_path}")
+        return None
+    return _parse_agent_manifest_cached(file_path, st.st_mtime_ns, st.st_size, loader)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_agent_manifest_cached(file_path: str, mtime_ns: int, size: int, loader: Callable[[str], AgentManifest]) -> Optional[AgentManifest]:
+    """Reads and validates a manifest; mtime_ns/size only participate in the cache key."""
     try:
-        with open(file_path, 'r') as f:
-            if file_path.endswith(".yaml") or file_path.endswith(".yml"):
-                manifest_data = yaml.safe_load(f)
-            elif file_path.endswith(".json"):
-                manifest_data = json.load(f)
-            else:
-                print(f"Unsupported manifest file format: {file_path}. Please use JSON or YAML.")
-                return None
-        
-        return AgentManifest(**manifest_data)
+        return loader(file_path)
     except FileNotFoundError:
         print(f"Manifest file not found: {file_path}")
         return None
-    except (yaml.YAMLError, json.JSONDecodeError) as e:
+    except yaml.YAMLError as e:
         print(f"Error parsing manifest file {file_path}: {e}")
         return None
-    except Exception as pydantic_e: # Catch Pydantic validation errors
+    except Exception as pydantic_e: # Catch Pydantic validation errors (including malformed JSON)
         print(f"Validation error in manifest file {file_path}: {pydantic_e}")
         return None
 
+def dump_manifest(manifest: AgentManifest) -> bytes:
+    """
+    Serializes a manifest to indented JSON bytes (e.g., for debugging or exporting).
+    Callers that need a str can decode() the result once.
+    """
+    if orjson is not None:
+        return orjson.dumps(manifest.model_dump(mode="json"), option=orjson.OPT_INDENT_2)
+    return manifest.model_dump_json(indent=2).encode('utf-8')
+
 # Example Usage
 if __name__ == "__main__":
     # Create a dummy YAML manifest file for testing
@@ -121,7 +170,7 @@ custom_config:
     parsed_manifest = parse_agent_manifest(dummy_yaml_path)
     if parsed_manifest:
         print("Successfully parsed agent manifest:")
-        print(parsed_manifest.model_dump_json(indent=2))
+        print(dump_manifest(parsed_manifest).decode())
         print(f"\nAgent Name: {parsed_manifest.name}")
         print(f"Runtime Image: {parsed_manifest.runtime.image}")
         if parsed_manifest.permissions_requested:
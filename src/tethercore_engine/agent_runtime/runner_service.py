@@ -1,16 +1,63 @@
-import docker # Docker SDK for Python
-from docker.errors import NotFound, APIError
-from typing import Dict, Any, Optional, List
+import asyncio
+import functools
+import logging
+import time
+import types
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional, List, Set, Tuple, Union
 from .manifest_parser import AgentManifest # Assuming manifest_parser.py is in the same directory
 
+if TYPE_CHECKING:
+    import docker # Docker SDK for Python; imported lazily at runtime since it pulls in requests/urllib3/websocket
+
+logger = logging.getLogger(__name__)
+
 # Configuration
 DOCKER_CLIENT_TIMEOUT = 120 # Seconds
+AGENT_LABEL = "tethercore.agent_id" # Label set on containers started for TetherCore agents
+RUNNING_AGENTS_CACHE_TTL = 1.0 # Seconds; list_running_agents is typically polled
+DEFAULT_LOG_MAX_BYTES = 64 * 1024 # Cap on bytes returned by get_agent_logs
+LOG_ONE_SHOT_TAIL_LINES = 1000 # Tails up to this many lines are fetched in a single request
+
+# Shared read-only stand-in for omitted dict arguments; never mutate it, copy first.
+_EMPTY_DICT: Mapping[str, Any] = types.MappingProxyType({})
+
+# Shared Docker clients keyed by socket URL (None = environment default).
+# Building a client and pinging the daemon is only done once per URL per process.
+_docker_clients: Dict[Optional[str], "docker.DockerClient"] = {}
+
+def _get_docker_client(docker_socket_url: Optional[str]) -> "docker.DockerClient":
+    """Returns the shared, already-pinged Docker client for the given socket URL."""
+    client = _docker_clients.get(docker_socket_url)
+    if client is None:
+        import docker
+        if docker_socket_url:
+            client = docker.DockerClient(base_url=docker_socket_url, timeout=DOCKER_CLIENT_TIMEOUT)
+        else:
+            client = docker.from_env(timeout=DOCKER_CLIENT_TIMEOUT)
+        client.ping() # Check connection; failures are not cached so the next caller retries
+        _docker_clients[docker_socket_url] = client
+    return client
+
+def close_docker_clients():
+    """Closes all shared Docker clients. New AgentRunnerService instances will reconnect."""
+    while _docker_clients:
+        _, client = _docker_clients.popitem()
+        client.close()
+
+async def _to_thread(func, *args, **kwargs):
+    """Runs a blocking docker-py call in the default executor so it doesn't stall the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+# Last list_running_agents result per Docker client: id(client) -> (monotonic timestamp, result)
+_running_agents_cache: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
 
 class AgentRunnerService:
     """
     Service for running and managing Mindscape Agents in isolated environments (e.g., Docker containers).
+    Instances share one Docker client per socket URL, so creating several of them is cheap.
     """
-    client: Optional[docker.DockerClient] = None
+    client: Optional["docker.DockerClient"] = None
 
     def __init__(self, docker_socket_url: Optional[str] = None):
         """
@@ -19,21 +66,39 @@ class AgentRunnerService:
             docker_socket_url (str, optional): URL for the Docker daemon socket.
                                                Defaults to system default if None.
         """
+        # Deferred so that importing this module (e.g., for manifest-only tooling) doesn't load the Docker SDK.
+        from docker.errors import NotFound, APIError, ImageNotFound
+        self._NotFound = NotFound
+        self._APIError = APIError
+        self._ImageNotFound = ImageNotFound
+
+        # Image references confirmed to exist locally, filled lazily by _image_available and dropped again
+        # when Docker reports the image missing (e.g. removed since it was seen).
+        self._known_images: Set[str] = set()
         try:
-            if docker_socket_url:
-                self.client = docker.DockerClient(base_url=docker_socket_url, timeout=DOCKER_CLIENT_TIMEOUT)
-            else:
-                self.client = docker.from_env(timeout=DOCKER_CLIENT_TIMEOUT)
-            self.client.ping() # Check connection
-            print("AgentRunnerService: Successfully connected to Docker daemon.")
+            self.client = _get_docker_client(docker_socket_url)
+            logger.info("AgentRunnerService: Successfully connected to Docker daemon.")
         except APIError as e:
-            print(f"AgentRunnerService: Failed to connect to Docker daemon: {e}")
-            print("Please ensure Docker is running and accessible.")
+            logger.error("AgentRunnerService: Failed to connect to Docker daemon: %s. Please ensure Docker is running and accessible.", e)
             self.client = None # Ensure client is None if connection failed
         except Exception as e_gen:
-            print(f"AgentRunnerService: An unexpected error occurred while connecting to Docker: {e_gen}")
+            logger.error("AgentRunnerService: An unexpected error occurred while connecting to Docker: %s", e_gen)
             self.client = None
 
+    def _image_available(self, image_name: str) -> bool:
+        """Cheap local check that an image exists, so missing images fail fast instead of going through containers.run."""
+        if image_name in self._known_images:
+            return True
+        try:
+            self.client.images.get(image_name) # Local lookup only, no registry round-trip
+        except self._ImageNotFound:
+            return False
+        self._known_images.add(image_name)
+        return True
+
+    def close(self):
+        """Detaches this service from the shared Docker client (the client itself stays open for other instances)."""
+        self.client = None
 
     async def deploy_agent(self, manifest: AgentManifest) -> Dict[str, Any]:
         """
@@ -50,9 +115,10 @@ class AgentRunnerService:
         if not self.client:
             return {"status": "error", "message": "Docker client not available."}
 
-        print(f"AgentRunnerService: Deploying agent '{manifest.agent_id}' (version {manifest.version})")
-        print(f"  Image: {manifest.runtime.image if manifest.runtime else 'N/A'}")
-        print(f"  Entrypoint: {manifest.runtime.entrypoint if manifest.runtime else 'N/A'}")
+        runtime = manifest.runtime
+        logger.info("AgentRunnerService: Deploying agent '%s' (version %s). Image: %s, Entrypoint: %s",
+                    manifest.agent_id, manifest.version,
+                    runtime.image if runtime else 'N/A', runtime.entrypoint if runtime else 'N/A')
 
         # Placeholder: Actual image pulling/building logic would go here.
         # if manifest.runtime and manifest.runtime.image:
@@ -60,7 +126,7 @@ class AgentRunnerService:
         #         print(f"Pulling image: {manifest.runtime.image}...")
         #         self.client.images.pull(manifest.runtime.image)
         #         print("Image pulled successfully.")
-        #     except APIError as e:
+        #     except self._APIError as e:
         #         print(f"Error pulling image {manifest.runtime.image}: {e}")
         #         return {"status": "error", "message": f"Failed to pull image: {e}"}
 
@@ -83,9 +149,10 @@ class AgentRunnerService:
         if not self.client:
             return {"status": "error", "message": "Docker client not available."}
 
-        print(f"AgentRunnerService: Running task for agent '{agent_id}': '{task_description}'")
-        image_name = agent_config.get("runtime", {}).get("image") if agent_config else f"tether_agent_{agent_id}" # Example image name
-        entrypoint_cmd = agent_config.get("runtime", {}).get("entrypoint", []) if agent_config else []
+        logger.info("AgentRunnerService: Running task for agent '%s': '%s'", agent_id, task_description)
+        runtime_config = agent_config.get("runtime", _EMPTY_DICT) if agent_config else _EMPTY_DICT
+        image_name = runtime_config.get("image") if agent_config else f"tether_agent_{agent_id}" # Example image name
+        entrypoint_cmd = runtime_config.get("entrypoint", [])
         
         if not image_name:
             return {"status": "error", "message": f"No image specified for agent '{agent_id}'."}
@@ -94,58 +161,107 @@ class AgentRunnerService:
         # For example, it might be an argument to the entrypoint.
         command_to_run = entrypoint_cmd + [task_description] # Simplistic example
 
-        env = environment_vars or {}
+        # Build a fresh dict rather than writing into the caller's environment_vars.
+        env = {**environment_vars} if environment_vars is not None else {}
         env["TETHER_TASK_DESCRIPTION"] = task_description # Example of passing task via env var
 
         try:
-            print(f"Attempting to run container from image: {image_name} with command: {command_to_run}")
-            container = self.client.containers.run(
+            if not await _to_thread(self._image_available, image_name):
+                logger.error("Docker image '%s' not found for agent '%s'.", image_name, agent_id)
+                return {"status": "error", "message": f"Image '{image_name}' not found."}
+
+            logger.debug("Attempting to run container from image: %s with command: %s", image_name, command_to_run)
+            container = await _to_thread(
+                self.client.containers.run,
                 image=image_name,
                 command=command_to_run,
                 environment=env,
+                labels={AGENT_LABEL: agent_id}, # list_running_agents finds agent containers by this label
                 detach=True,  # Run in detached mode
                 # network_mode="host", # Or a specific bridge network for controlled communication
                 # volumes={...}, # If agents need persistent storage or access to host files (use with caution)
                 # remove=True # Automatically remove container when it exits (for short-lived tasks)
             )
-            print(f"Agent '{agent_id}' task started in container: {container.short_id}")
+            _running_agents_cache.pop(id(self.client), None) # The cached list no longer includes this container
+            logger.info("Agent '%s' task started in container: %s", agent_id, container.short_id)
             return {"status": "success", "agent_id": agent_id, "container_id": container.short_id, "message": "Task started."}
-        except NotFound:
-            print(f"Error: Docker image '{image_name}' not found for agent '{agent_id}'.")
+        except self._NotFound:
+            self._known_images.discard(image_name) # Removed after it was cached; check again next time
+            logger.error("Docker image '%s' not found for agent '%s'.", image_name, agent_id)
             return {"status": "error", "message": f"Image '{image_name}' not found."}
-        except APIError as e:
-            print(f"Error running agent '{agent_id}' container: {e}")
+        except self._APIError as e:
+            logger.error("Error running agent '%s' container: %s", agent_id, e)
             return {"status": "error", "message": f"Docker API error: {e}"}
         except Exception as e_gen:
-            print(f"An unexpected error occurred while running agent '{agent_id}': {e_gen}")
+            logger.exception("An unexpected error occurred while running agent '%s': %s", agent_id, e_gen)
             return {"status": "error", "message": f"Unexpected error: {e_gen}"}
 
 
-    async def get_agent_logs(self, container_id: str, tail: int = 100) -> Optional[str]:
+    async def get_agent_logs(self, container_id: str, tail: int = 100, max_bytes: int = DEFAULT_LOG_MAX_BYTES, decode: bool = False) -> Optional[Union[bytes, str]]:
         """
         Retrieves logs from a specific agent container.
 
         Args:
             container_id (str): The ID of the container.
             tail (int): The number of log lines to retrieve from the end.
+            max_bytes (int): Upper bound on the bytes read from the daemon; output beyond it is dropped.
+            decode (bool): Return a UTF-8 decoded str instead of the raw bytes.
 
         Returns:
-            Optional[str]: The container logs as a string, or None if an error occurs.
+            Optional[Union[bytes, str]]: The container logs (bytes unless decode=True), or None if an error occurs.
         """
         if not self.client:
-            print("Docker client not available.")
+            logger.warning("Docker client not available.")
             return None
         try:
-            container = self.client.containers.get(container_id)
-            logs = container.logs(tail=tail, timestamps=True).decode('utf-8')
-            return logs
-        except NotFound:
-            print(f"Error: Container '{container_id}' not found.")
+            raw = await _to_thread(self._read_logs_sync, container_id, tail, max_bytes)
+            if decode:
+                return raw.decode('utf-8', errors='replace') # A multi-byte character may be cut at the cap
+            return raw
+        except self._NotFound:
+            logger.error("Container '%s' not found.", container_id)
             return None
-        except APIError as e:
-            print(f"Error retrieving logs for container '{container_id}': {e}")
+        except self._APIError as e:
+            logger.error("Error retrieving logs for container '%s': %s", container_id, e)
             return None
 
+    def _read_logs_sync(self, container_id: str, tail: int, max_bytes: int) -> bytes:
+        """Blocking log fetch for get_agent_logs, returning at most max_bytes."""
+        container = self.client.containers.get(container_id)
+        if tail <= LOG_ONE_SHOT_TAIL_LINES:
+            raw = container.logs(tail=tail, timestamps=True)
+        else:
+            # Stream large tails and stop reading once max_bytes is reached instead of buffering everything.
+            # follow=False: docker-py otherwise follows a streamed log until the container exits.
+            stream = container.logs(tail=tail, timestamps=True, stream=True, follow=False)
+            buffer = bytearray()
+            try:
+                for chunk in stream:
+                    buffer += chunk
+                    if len(buffer) >= max_bytes:
+                        break
+            finally:
+                stream.close()
+            raw = bytes(buffer)
+        return raw[:max_bytes] if len(raw) > max_bytes else raw
+
+    def _stop_sync(self, container_id: str, timeout: int = 10, remove: bool = False) -> bool:
+        """Blocking stop (and optional removal) of one container; run via _to_thread from async code."""
+        try:
+            container = self.client.containers.get(container_id)
+            container.stop(timeout=timeout) # Wait up to `timeout` seconds for graceful stop
+            _running_agents_cache.pop(id(self.client), None) # The cached list may still include this container
+            if remove:
+                container.remove()
+            logger.info("Stopped container: %s", container_id)
+            return True
+        except self._NotFound:
+            logger.warning("Container '%s' not found for stopping (might have already exited).", container_id)
+            return True # Consider it success if not found
+        except self._APIError as e:
+            logger.error("Error stopping container '%s': %s", container_id, e)
+            return False
+
     async def stop_agent_task(self, container_id: str) -> bool:
         """
         Stops a running agent task (container).
@@ -157,42 +273,73 @@ class AgentRunnerService:
             bool: True if stopping was successful or container already stopped, False otherwise.
         """
         if not self.client:
-            print("Docker client not available.")
-            return False
-        try:
-            container = self.client.containers.get(container_id)
-            container.stop(timeout=10) # Wait up to 10 seconds for graceful stop
-            # container.remove() # Optionally remove after stopping
-            print(f"Stopped container: {container_id}")
-            return True
-        except NotFound:
-            print(f"Warning: Container '{container_id}' not found for stopping (might have already exited).")
-            return True # Consider it success if not found
-        except APIError as e:
-            print(f"Error stopping container '{container_id}': {e}")
+            logger.warning("Docker client not available.")
             return False
+        return await _to_thread(self._stop_sync, container_id, 10)
+
+    async def stop_agents(self, container_ids: List[str], timeout: int = 10, remove: bool = False) -> Dict[str, bool]:
+        """
+        Stops several agent containers concurrently, so shutting down N agents takes roughly
+        one graceful-stop timeout instead of N of them.
+
+        Args:
+            container_ids (List[str]): IDs of the containers to stop.
+            timeout (int): Seconds to wait for each container to stop gracefully.
+            remove (bool): Also remove each container once it has stopped.
+
+        Returns:
+            Dict[str, bool]: Per-container result, as returned by stop_agent_task.
+        """
+        if not self.client:
+            logger.warning("Docker client not available.")
+            return {container_id: False for container_id in container_ids}
+        results = await asyncio.gather(
+            *(_to_thread(self._stop_sync, container_id, timeout, remove) for container_id in container_ids),
+            return_exceptions=True,
+        )
+        stopped = {}
+        for container_id, result in zip(container_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("Unexpected error stopping container '%s': %s", container_id, result)
+                result = False
+            stopped[container_id] = result
+        return stopped
 
     async def list_running_agents(self) -> List[Dict[str, Any]]:
-        """Lists all currently running agent containers managed by this runtime (conceptually)."""
+        """
+        Lists all currently running agent containers managed by this runtime.
+        Results are cached for RUNNING_AGENTS_CACHE_TTL seconds to absorb polling.
+        """
         if not self.client:
             return []
-        
+
+        cache_key = id(self.client)
+        cached = _running_agents_cache.get(cache_key)
+        now = time.monotonic()
+        if cached and now - cached[0] < RUNNING_AGENTS_CACHE_TTL:
+            return list(cached[1])
+
         running_agent_containers = []
         try:
-            # This lists all containers; you might need specific labels to identify TetherCore agents
-            for container in self.client.containers.list(filters={"status": "running"}):
-                # Assuming TetherCore agents have a specific label, e.g., "tethercore.agent_id"
-                agent_id = container.labels.get("tethercore.agent_id", "unknown")
+            # Let the daemon filter on status and the TetherCore agent label instead of iterating everything here.
+            # The low-level API returns one summary dict per container in a single request, whereas
+            # containers.list() inspects every container individually to build its Container objects.
+            summaries = await _to_thread(
+                self.client.api.containers, all=False, filters={"status": "running", "label": AGENT_LABEL}
+            )
+            for summary in summaries:
+                names = summary.get('Names') or ()
                 running_agent_containers.append({
-                    "container_id": container.short_id,
-                    "image": container.attrs['Config']['Image'],
-                    "status": container.status,
-                    "name": container.name,
-                    "agent_id": agent_id # You'd need to set this label when running the container
+                    "container_id": summary['Id'][:12], # Same as Container.short_id
+                    "image": summary.get('Image'),
+                    "status": summary.get('State'),
+                    "name": names[0].lstrip('/') if names else "",
+                    "agent_id": (summary.get('Labels') or {}).get(AGENT_LABEL, "unknown"),
                 })
-            return running_agent_containers
-        except APIError as e:
-            print(f"Error listing running agent containers: {e}")
+            _running_agents_cache[cache_key] = (now, running_agent_containers)
+            return list(running_agent_containers)
+        except self._APIError as e:
+            logger.error("Error listing running agent containers: %s", e)
             return []
 
 # Example Usage
@@ -234,7 +381,7 @@ async def _agent_runner_example():
             time.sleep(2)
 
             # 3. Get logs
-            logs = await runner.get_agent_logs(container_id, tail=10)
+            logs = await runner.get_agent_logs(container_id, tail=10, decode=True)
             print(f"\nLogs for {container_id}:\n{logs}")
 
             # 4. Stop task (hello-world usually exits on its own, but good to test stop)
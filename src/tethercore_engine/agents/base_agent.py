@@ -1,5 +1,7 @@
+import logging
+import types
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, List
 
 # Potentially import service interfaces if agents interact directly
 # from ..memory_graph.store_interface import VectorStoreInterface
@@ -7,11 +9,21 @@ from typing import Dict, Any, Optional, List
 # from ..tether_chain.service import TetherChainService
 # from ..agent_runtime.manifest_parser import AgentManifest # For agent's own manifest
 
+logger = logging.getLogger(__name__)
+
+# Shared read-only stand-in for omitted dict arguments, so no throwaway dict is allocated per call.
+# Code that wants to mutate one of these mappings must copy it first (e.g., dict(ctx.agent_custom_config)).
+_EMPTY_DICT: Mapping[str, Any] = types.MappingProxyType({})
+
 class AgentContext:
     """
     Provides context to the agent during its execution.
     This might include access to TetherCore services, configuration, user info, etc.
     """
+    # Fixed attribute set: slots avoid a per-instance __dict__ for these short-lived objects.
+    # Add new service handles (memory_graph, llm_router, tether_chain) here when they are wired in.
+    __slots__ = ("agent_id", "user_id", "agent_manifest", "agent_custom_config")
+
     def __init__(
         self,
         agent_id: str,
@@ -27,13 +39,13 @@ class AgentContext:
         # self.memory_graph = memory_graph
         # self.llm_router = llm_router
         # self.tether_chain = tether_chain
-        self.agent_manifest = agent_manifest or {}
-        self.agent_custom_config = agent_custom_config or {}
-        print(f"AgentContext created for agent: {agent_id}, user: {user_id}")
+        self.agent_manifest = agent_manifest if agent_manifest is not None else _EMPTY_DICT
+        self.agent_custom_config = agent_custom_config if agent_custom_config is not None else _EMPTY_DICT
+        logger.debug("AgentContext created for agent: %s, user: %s", agent_id, user_id)
 
     async def log_to_tether_chain(self, event_type: str, details: Dict[str, Any], target_id: Optional[str] = None):
         """Helper method to log agent actions to TetherChain."""
-        print(f"Agent '{self.agent_id}' logging to TetherChain: Event '{event_type}', Target '{target_id or 'N/A'}'")
+        logger.debug("Agent '%s' logging to TetherChain: Event '%s', Target '%s'", self.agent_id, event_type, target_id or 'N/A')
         # if self.tether_chain:
         #     await self.tether_chain.add_entry(
         #         event_type=event_type,
@@ -60,7 +72,7 @@ class BaseAgent(ABC):
         self.context = context
         self.agent_id = context.agent_id
         self.user_id = context.user_id
-        print(f"BaseAgent (ID: {self.agent_id}) initialized for user: {self.user_id}.")
+        logger.debug("BaseAgent (ID: %s) initialized for user: %s.", self.agent_id, self.user_id)
 
     @abstractmethod
     async def setup(self, config: Optional[Dict[str, Any]] = None):
@@ -70,7 +82,7 @@ class BaseAgent(ABC):
         Args:
             config (Optional[Dict[str, Any]]): Agent-specific configuration.
         """
-        print(f"Agent '{self.agent_id}': Setup method called.")
+        logger.debug("Agent '%s': Setup method called.", self.agent_id)
         pass
 
     @abstractmethod
@@ -88,7 +100,7 @@ class BaseAgent(ABC):
                             which might include status, output data, and any errors.
                             Should ideally conform to an output schema.
         """
-        print(f"Agent '{self.agent_id}': Executing task '{task_description}' with params: {task_parameters}")
+        logger.info("Agent '%s': Executing task '%s' with params: %s", self.agent_id, task_description, task_parameters)
         pass
 
     async def on_heartbeat(self):
@@ -96,7 +108,7 @@ class BaseAgent(ABC):
         Optional: Called periodically if the agent runtime supports heartbeats for long-running agents.
         Can be used for periodic checks, updates, or cleanup.
         """
-        print(f"Agent '{self.agent_id}': Heartbeat received (placeholder).")
+        logger.debug("Agent '%s': Heartbeat received (placeholder).", self.agent_id)
         pass
 
     async def on_shutdown(self):
@@ -104,13 +116,13 @@ class BaseAgent(ABC):
         Optional: Called when the agent is being shut down.
         Use this to release resources, save state, etc.
         """
-        print(f"Agent '{self.agent_id}': Shutdown method called.")
+        logger.debug("Agent '%s': Shutdown method called.", self.agent_id)
         pass
 
     # Helper methods agents might use (examples)
     async def _get_llm_response(self, prompt: str, preferred_models: Optional[List[str]]=None) -> Optional[str]:
         """Helper to interact with the LLM router via context."""
-        print(f"Agent '{self.agent_id}': Requesting LLM response for prompt: '{prompt[:30]}...'")
+        logger.debug("Agent '%s': Requesting LLM response for prompt: '%.30s...'", self.agent_id, prompt)
         # if self.context.llm_router:
         #     models_to_try = preferred_models or self.context.agent_manifest.get("llm_config", {}).get("preferred_models", [])
         #     # Basic logic to try preferred models
@@ -129,10 +141,9 @@ class BaseAgent(ABC):
 
     async def _save_to_memory_graph(self, content: str, tags: Optional[List[str]] = None, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """Helper to save an Echo to the memory graph via context."""
-        from ..memory_graph.models import EchoCreate # Local import to avoid circularity if services use agents
-        
-        print(f"Agent '{self.agent_id}': Saving to memory graph. Content: '{content[:30]}...' Tags: {tags}")
+        logger.debug("Agent '%s': Saving to memory graph. Content: '%.30s...' Tags: %s", self.agent_id, content, tags)
         # if self.context.memory_graph:
+        #     from ..memory_graph.models import EchoCreate # Local import to avoid circularity if services use agents
         #     echo_data = EchoCreate(
         #         content=content,
         #         tags=tags or [],
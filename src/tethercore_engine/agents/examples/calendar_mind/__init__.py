@@ -1,3 +1,14 @@
-from .agent import CalendarMindAgent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import CalendarMindAgent
 
 __all__ = ["CalendarMindAgent"]
+
+def __getattr__(name: str):
+    # PEP 562: the agent module (and its BaseAgent imports) loads on first access, not on package import,
+    # so scanning the agent catalog stays cheap for agents that are never instantiated.
+    if name == "CalendarMindAgent":
+        from .agent import CalendarMindAgent
+        return CalendarMindAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,36 @@
 from ...base_agent import BaseAgent, AgentContext # Relative import
+import asyncio
+import bisect
+import itertools
+import re
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+try:
+    from ciso8601 import parse_datetime # C ISO 8601 parser; also accepts 'Z' suffixes and other variants
+except ImportError:
+    parse_datetime = datetime.fromisoformat
+
+# Characters rewritten when turning names into memory-graph tags; extend the mapping rather than chaining replace().
+_TAG_TRANS = str.maketrans({" ": "_"})
+
+def _event_start(event: Dict[str, Any]) -> datetime:
+    """Sort key: the event's start as a UTC datetime, so starts with different offsets order by actual time.
+    Naive starts are taken as UTC, as EchoCreate does."""
+    start = parse_datetime(event["start"])
+    if start.tzinfo is None:
+        return start.replace(tzinfo=timezone.utc)
+    return start.astimezone(timezone.utc)
+
+def _parse_date_filter(value: str) -> date:
+    """Turns a list filter ("today", "tomorrow" or an ISO date) into a date."""
+    lowered = value.strip().lower()
+    if lowered == "today":
+        return date.today()
+    if lowered == "tomorrow":
+        return date.today() + timedelta(days=1)
+    return date.fromisoformat(lowered)
 
 class CalendarMindAgent(BaseAgent):
     """
@@ -12,7 +42,12 @@ class CalendarMindAgent(BaseAgent):
         await super().setup(config)
         # In a real agent, this might connect to a calendar API (Google Calendar, Outlook, etc.)
         # using credentials/tokens provided securely through context or config.
-        self.events: List[Dict[str, Any]] = [] # Simple in-memory store for events
+        # Simple in-memory store for events, kept ordered by start time (bisect insertion) so listings come out
+        # chronologically and time-range lookups can bisect instead of scanning.
+        self.events: List[Dict[str, Any]] = []
+        self._event_ids = itertools.count(1) # Positions shift on sorted insert, so IDs come from a counter
+        # Same events bucketed by every calendar day they touch, so date-filtered listings are a dict lookup.
+        self.events_by_day: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
         print(f"CalendarMindAgent '{self.agent_id}': Setup complete. Ready to manage calendar events (in-memory).")
 
     async def execute_task(self, task_description: str, task_parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -23,60 +58,86 @@ class CalendarMindAgent(BaseAgent):
         # Example: "what's on my calendar today?"
         # Example: "find free time next week for a 30 minute call"
 
-        if "add event" in task_description.lower():
-            # Extremely simplified parsing. NLU/LLM would be needed for robust parsing.
-            try:
-                # Example: "add event 'My Event' on 2025-12-25 from 10:00 to 11:00"
-                event_name = task_parameters.get("name", "Unnamed Event")
-                start_time_str = task_parameters.get("start_time") # Expects ISO format string
-                end_time_str = task_parameters.get("end_time")     # Expects ISO format string
-                
-                if not start_time_str or not event_name:
-                    return {"status": "error", "message": "Event name and start_time are required to add an event."}
-
-                start_time = datetime.fromisoformat(start_time_str)
-                end_time = datetime.fromisoformat(end_time_str) if end_time_str else start_time + timedelta(hours=1)
-
-                new_event = {
-                    "id": str(len(self.events) + 1), # Simple ID
-                    "summary": event_name,
-                    "start": start_time.isoformat(),
-                    "end": end_time.isoformat(),
-                    "description": task_parameters.get("description", "")
-                }
-                self.events.append(new_event)
-                await self.context.log_to_tether_chain(
-                    event_type="CALENDAR_EVENT_ADDED",
-                    details={"event_summary": event_name, "start_time": start_time.isoformat()},
-                )
-                await self._save_to_memory_graph(
-                    content=f"Added calendar event: {event_name} starting at {start_time.strftime('%Y-%m-%d %H:%M')}",
-                    tags=["calendar", "event_added", event_name.replace(" ", "_")]
-                )
-                return {"status": "success", "message": f"Event '{event_name}' added.", "event_id": new_event["id"]}
-            except Exception as e:
-                return {"status": "error", "message": f"Failed to add event: {e}"}
-
-        elif "what's on my calendar" in task_description.lower() or "list events" in task_description.lower():
-            # Simplified: list all events or filter by a date (if provided)
-            date_filter_str = task_parameters.get("date") # e.g., "today", "tomorrow", "2025-12-25"
-            
-            display_events = []
-            if not self.events:
-                 return {"status": "success", "message": "Your calendar is empty.", "events": []}
-
-            for event in self.events:
-                # Basic date filtering placeholder
-                # A real implementation would parse date_filter_str and compare event start/end times
-                display_events.append(event)
+        match = self._COMMAND_RE.search(task_description.lower())
+        handler = self._COMMAND_HANDLERS[match.group(0)] if match else CalendarMindAgent._handle_unrecognized
+        return await handler(self, task_description, task_parameters)
+
+    async def _handle_add_event(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # Extremely simplified parsing. NLU/LLM would be needed for robust parsing.
+        try:
+            # Example: "add event 'My Event' on 2025-12-25 from 10:00 to 11:00"
+            event_name = task_parameters.get("name", "Unnamed Event")
+            start_time_str = task_parameters.get("start_time") # Expects ISO format string
+            end_time_str = task_parameters.get("end_time")     # Expects ISO format string
             
-            return {"status": "success", "events": display_events}
+            if not start_time_str or not event_name:
+                return {"status": "error", "message": "Event name and start_time are required to add an event."}
+
+            start_time = parse_datetime(start_time_str)
+            end_time = parse_datetime(end_time_str) if end_time_str else start_time + timedelta(hours=1)
+            start_iso = start_time.isoformat()
+            end_iso = end_time.isoformat()
 
-        else:
-            llm_response = await self._get_llm_response(
-                f"As CalendarMind, how should I handle: '{task_description}'? Params: {task_parameters}"
+            new_event = {
+                "id": str(next(self._event_ids)), # Simple ID
+                "summary": event_name,
+                "start": start_iso,
+                "end": end_iso,
+                "description": task_parameters.get("description", "")
+            }
+            bisect.insort(self.events, new_event, key=_event_start)
+            day = start_time.date()
+            # An event ending exactly at midnight does not touch the following day.
+            last_day = (end_time - timedelta(microseconds=1)).date() if end_time > start_time else day
+            while day <= last_day:
+                bisect.insort(self.events_by_day[day], new_event, key=_event_start)
+                day += timedelta(days=1)
+            # Audit log and memory write are independent; run them concurrently.
+            await asyncio.gather(
+                self.context.log_to_tether_chain(
+                    event_type="CALENDAR_EVENT_ADDED",
+                    details={"event_summary": event_name, "start_time": start_iso},
+                ),
+                self._save_to_memory_graph(
+                    content=f"Added calendar event: {event_name} starting at {start_time.strftime('%Y-%m-%d %H:%M')}",
+                    tags=["calendar", "event_added", event_name.translate(_TAG_TRANS)]
+                ),
             )
-            return {"status": "info", "message": "Calendar task not specifically handled, providing general LLM response.", "llm_suggestion": llm_response}
+            return {"status": "success", "message": f"Event '{event_name}' added.", "event_id": new_event["id"]}
+        except Exception as e:
+            return {"status": "error", "message": f"Failed to add event: {e}"}
+
+    async def _handle_list_events(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # Simplified: list all events or filter by a date (if provided)
+        date_filter_str = task_parameters.get("date") # e.g., "today", "tomorrow", "2025-12-25"
+        
+        if not self.events:
+             return {"status": "success", "message": "Your calendar is empty.", "events": []}
+
+        if not date_filter_str:
+            return {"status": "success", "events": list(self.events)}
+
+        try:
+            filter_date = _parse_date_filter(date_filter_str)
+        except ValueError:
+            return {"status": "error", "message": f"Unrecognized date filter: '{date_filter_str}'."}
+        # .get() rather than [] so lookups don't create empty buckets in the defaultdict.
+        return {"status": "success", "events": list(self.events_by_day.get(filter_date, ()))}
+
+    async def _handle_unrecognized(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        llm_response = await self._get_llm_response(
+            f"As CalendarMind, how should I handle: '{task_description}'? Params: {task_parameters}"
+        )
+        return {"status": "info", "message": "Calendar task not specifically handled, providing general LLM response.", "llm_suggestion": llm_response}
+
+    _COMMAND_HANDLERS = {
+        "add event": _handle_add_event,
+        "what's on my calendar": _handle_list_events,
+        "list events": _handle_list_events,
+    }
+    # Recognized commands, matched once against the lowered description. Built from the handler table
+    # (longest phrase first) so adding a command is a single dict entry.
+    _COMMAND_RE = re.compile("|".join(map(re.escape, sorted(_COMMAND_HANDLERS, key=len, reverse=True))))
 
 # Example for standalone testing
 if __name__ == "__main__":
@@ -1,3 +1,13 @@
-from .agent import FocusMindAgent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import FocusMindAgent
 
 __all__ = ["FocusMindAgent"]
+
+def __getattr__(name: str):
+    # PEP 562: defer importing agent.py until the class is first requested.
+    if name == "FocusMindAgent":
+        from .agent import FocusMindAgent
+        return FocusMindAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
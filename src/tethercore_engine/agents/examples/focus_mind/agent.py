@@ -1,6 +1,11 @@
 from ...base_agent import BaseAgent, AgentContext # Relative import from parent package
+import asyncio
+import re
 from typing import Dict, Any, Optional, List
 
+# Tag sanitization table (single pass via str.translate)
+_TAG_TRANS = str.maketrans({" ": "_"})
+
 class FocusMindAgent(BaseAgent):
     """
     FocusMind Agent: Helps manage focus sessions, tasks, and minimize distractions.
@@ -13,6 +18,9 @@ class FocusMindAgent(BaseAgent):
         self.focus_duration_minutes: int = self.context.agent_custom_config.get("default_focus_duration_minutes", 25)
         print(f"FocusMindAgent '{self.agent_id}': Setup complete. Default focus duration: {self.focus_duration_minutes} mins.")
 
+    # Task name after the command, minus optional surrounding quotes; matched on the original text to keep its casing.
+    _FOCUS_RE = re.compile(r"start focus session on\s*['\"]?(.+?)['\"]?\s*$", re.IGNORECASE)
+
     async def execute_task(self, task_description: str, task_parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Executes a focus-related task.
@@ -23,46 +31,61 @@ class FocusMindAgent(BaseAgent):
         
         # Simple command parsing based on task_description
         # A more robust agent would use NLU or structured commands
-        if "start focus session on" in task_description.lower():
-            # Extract task name, e.g., "start focus session on 'Project X planning'"
-            try:
-                self.current_focus_task = task_description.lower().split("start focus session on", 1)[1].strip().strip("'\"")
-                duration = task_parameters.get("duration_minutes", self.focus_duration_minutes)
-                
-                await self.context.log_to_tether_chain(
-                    event_type="FOCUS_SESSION_STARTED",
-                    details={"task": self.current_focus_task, "duration_minutes": duration},
-                )
-                await self._save_to_memory_graph(
-                    content=f"Started focus session on: {self.current_focus_task} for {duration} minutes.",
-                    tags=["focus_session", "task_management", self.current_focus_task.replace(" ", "_")]
-                )
-                return {"status": "success", "message": f"Focus session started on '{self.current_focus_task}' for {duration} minutes."}
-            except IndexError:
-                 return {"status": "error", "message": "Could not parse task name from 'start focus session' command."}
-
-        elif "get current focus task" in task_description.lower():
-            if self.current_focus_task:
-                return {"status": "success", "current_task": self.current_focus_task}
-            else:
-                return {"status": "success", "message": "No active focus task."}
-
-        elif "suggest break activity" in task_description.lower():
-            # Example LLM interaction
-            prompt = "Suggest a short, refreshing break activity for someone working on a computer."
-            suggestion = await self._get_llm_response(prompt)
-            await self._save_to_memory_graph(
-                content=f"Suggested break activity: {suggestion}",
-                tags=["break_suggestion", "wellbeing"]
-            )
-            return {"status": "success", "suggestion": suggestion or "Take a short walk or stretch."}
-            
+        match = self._COMMAND_RE.search(task_description.lower())
+        handler = self._COMMAND_HANDLERS[match.group(0)] if match else FocusMindAgent._handle_unrecognized
+        return await handler(self, task_description, task_parameters)
+
+    async def _handle_start_focus(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # Extract task name, e.g., "start focus session on 'Project X planning'"
+        match = self._FOCUS_RE.search(task_description)
+        if not match:
+            return {"status": "error", "message": "Could not parse task name from 'start focus session' command."}
+        self.current_focus_task = match.group(1)
+        duration = task_parameters.get("duration_minutes", self.focus_duration_minutes)
+        
+        await asyncio.gather(
+            self.context.log_to_tether_chain(
+                event_type="FOCUS_SESSION_STARTED",
+                details={"task": self.current_focus_task, "duration_minutes": duration},
+            ),
+            self._save_to_memory_graph(
+                content=f"Started focus session on: {self.current_focus_task} for {duration} minutes.",
+                tags=["focus_session", "task_management", self.current_focus_task.translate(_TAG_TRANS)]
+            ),
+        )
+        return {"status": "success", "message": f"Focus session started on '{self.current_focus_task}' for {duration} minutes."}
+
+    async def _handle_current_focus(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        if self.current_focus_task:
+            return {"status": "success", "current_task": self.current_focus_task}
         else:
-            # Fallback to a general LLM query if task is not recognized
-            llm_response = await self._get_llm_response(
-                f"As a FocusMind agent, how should I respond to the request: '{task_description}'? Parameters: {task_parameters}"
-            )
-            return {"status": "info", "message": "Task not specifically handled, providing general LLM response.", "llm_suggestion": llm_response}
+            return {"status": "success", "message": "No active focus task."}
+
+    async def _handle_suggest_break(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # Example LLM interaction
+        prompt = "Suggest a short, refreshing break activity for someone working on a computer."
+        suggestion = await self._get_llm_response(prompt)
+        await self._save_to_memory_graph(
+            content=f"Suggested break activity: {suggestion}",
+            tags=["break_suggestion", "wellbeing"]
+        )
+        return {"status": "success", "suggestion": suggestion or "Take a short walk or stretch."}
+
+    async def _handle_unrecognized(self, task_description: str, task_parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # Fallback to a general LLM query if task is not recognized
+        llm_response = await self._get_llm_response(
+            f"As a FocusMind agent, how should I respond to the request: '{task_description}'? Parameters: {task_parameters}"
+        )
+        return {"status": "info", "message": "Task not specifically handled, providing general LLM response.", "llm_suggestion": llm_response}
+
+    _COMMAND_HANDLERS = {
+        "start focus session on": _handle_start_focus,
+        "get current focus task": _handle_current_focus,
+        "suggest break activity": _handle_suggest_break,
+    }
+    # Recognized commands, matched once against the lowered description. Built from the handler table
+    # (longest phrase first) so adding a command is a single dict entry.
+    _COMMAND_RE = re.compile("|".join(map(re.escape, sorted(_COMMAND_HANDLERS, key=len, reverse=True))))
 
     async def on_shutdown(self):
         await super().on_shutdown()
@@ -1,10 +1,20 @@
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
+import asyncio
+import dataclasses
+import functools
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from datetime import datetime, timezone
 
+logger = logging.getLogger(__name__)
+
+_UTC = timezone.utc
+
 # from ..tether_chain.service import TetherChainService # For logging consent changes
 
-class PermissionRequest(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PermissionRequest:
     """Represents a request for permission by an agent or service."""
     requester_id: str # e.g., agent_id
     resource: str     # e.g., "calendar", "memory_graph:echo_tag_personal"
@@ -12,17 +22,24 @@ class PermissionRequest(BaseModel):
     justification: Optional[str] = None # Why the permission is needed
     # expires_at: Optional[datetime] = None # Optional expiry for the permission
 
-class ConsentRecord(BaseModel):
-    """Represents a record of user consent."""
+@dataclass(slots=True, frozen=True)
+class ConsentRecord:
+    """Represents a record of user consent. Immutable; use dataclasses.replace to derive an updated record."""
     user_id: str
     requester_id: str
     resource: str
     actions_granted: List[str]
-    actions_denied: Optional[List[str]] = Field(default_factory=list)
-    granted_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    actions_denied: Optional[List[str]] = field(default_factory=list)
+    granted_at: datetime = field(default_factory=lambda: datetime.now(_UTC))
     # expires_at: Optional[datetime] = None
     status: str = "active" # e.g., "active", "revoked", "expired"
-    conditions: Optional[Dict[str, Any]] = Field(default_factory=dict) # e.g. {"max_daily_access": 10}
+    conditions: Optional[Dict[str, Any]] = field(default_factory=dict) # e.g. {"max_daily_access": 10}
+
+    # Set view of actions_granted for constant-time checks; rebuilt by __post_init__ (including via replace()).
+    _granted_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_granted_set", frozenset(self.actions_granted))
 
 class ConsentEngineService:
     """
@@ -30,11 +47,26 @@ class ConsentEngineService:
     It interfaces with the Trust Contract Layer and logs consent changes to TetherChain.
     """
     # For simplicity, using an in-memory store. A real implementation needs persistent storage.
-    _consent_db: Dict[str, List[ConsentRecord]] = {} # Key: user_id
+    # Key: user_id -> (requester_id, resource) -> record. At most one record per requester/resource pair,
+    # so permission checks are a pair of dict lookups instead of a scan over the user's records.
+    _consent_db: Dict[str, Dict[Tuple[str, str], ConsentRecord]] = {}
+    # user_id -> active records as last returned by get_user_consents; None (or missing) means stale.
+    # Shared like _consent_db so every instance sees invalidations.
+    _active_cache: Dict[str, Optional[List[ConsentRecord]]] = {}
+    # One lock per user so concurrent grants/revokes for the same user serialize without blocking other users.
+    # Reads stay lock-free: they are single dict lookups. Shared like _consent_db, but weakly: a lock only lives
+    # while a grant/revoke holds or waits on it, so the map doesn't grow with every user ever seen.
+    _user_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
 
     def __init__(self, tether_chain_service = None): # Pass TetherChainService instance
         # self.tether_chain = tether_chain_service
-        print("ConsentEngineService Initialized (In-memory storage).")
+        logger.info("ConsentEngineService Initialized (In-memory storage).")
+
+    def _lock_for(self, user_id: str) -> asyncio.Lock:
+        lock = self._user_locks.get(user_id)
+        if lock is None:
+            lock = self._user_locks[user_id] = asyncio.Lock()
+        return lock
 
     async def request_consent(self, user_id: str, permission_request: PermissionRequest) -> bool:
         """
@@ -44,21 +76,21 @@ class ConsentEngineService:
         Returns:
             bool: True if consent is granted (simulated), False otherwise.
         """
-        print(f"ConsentEngine: Requesting consent from user '{user_id}' for:")
-        print(f"  Requester: {permission_request.requester_id}")
-        print(f"  Resource:  {permission_request.resource}")
-        print(f"  Actions:   {permission_request.actions}")
-        print(f"  Justification: {permission_request.justification or 'N/A'}")
+        logger.info(
+            "Consent request user=%s requester=%s resource=%s actions=%s justification=%s",
+            user_id, permission_request.requester_id, permission_request.resource,
+            permission_request.actions, permission_request.justification or "N/A",
+        )
 
         # Simulate user interaction (e.g., from UI or CLI prompt)
         # For now, let's assume auto-approval for some resources for testing,
         # or a default denial. This needs proper user interaction.
         if "memory_graph" in permission_request.resource and "read" in permission_request.actions:
-            print("ConsentEngine: Auto-simulating approval for read access to memory_graph.")
+            logger.debug("Auto-simulating approval for read access to memory_graph.")
             await self.grant_consent(user_id, permission_request, permission_request.actions)
             return True
         
-        print("ConsentEngine: Simulating user denial or no response for other requests.")
+        logger.debug("Simulating user denial or no response for other requests.")
         await self.record_denial(user_id, permission_request, permission_request.actions)
         return False
 
@@ -72,17 +104,16 @@ class ConsentEngineService:
             actions_granted=granted_actions,
             conditions=conditions or {}
         )
-        if user_id not in self._consent_db:
-            self._consent_db[user_id] = []
-        
-        # Remove any previous conflicting records or update existing ones (simplified)
-        self._consent_db[user_id] = [
-            r for r in self._consent_db[user_id]
-            if not (r.requester_id == request.requester_id and r.resource == request.resource)
-        ]
-        self._consent_db[user_id].append(record)
-
-        print(f"Consent granted by '{user_id}' to '{request.requester_id}' for '{request.resource}' actions: {granted_actions}")
+        async with self._lock_for(user_id):
+            # Replaces any previous record for the same requester/resource
+            self._consent_db.setdefault(user_id, {})[(request.requester_id, request.resource)] = record
+            self._active_cache[user_id] = None
+            self._check_cached.cache_clear()
+
+        logger.info(
+            "Consent granted by '%s' to '%s' for '%s' actions: %s",
+            user_id, request.requester_id, request.resource, granted_actions,
+        )
         # if self.tether_chain:
         #     await self.tether_chain.add_entry(
         #         event_type="CONSENT_GRANTED",
@@ -99,7 +130,10 @@ class ConsentEngineService:
         """Records that a user has denied consent (or it was not given)."""
         # This is a simplified denial logging. You might not store explicit denial records
         # in the same way as grants, or they might have a different status.
-        print(f"Consent denied or not provided by '{user_id}' to '{request.requester_id}' for '{request.resource}' actions: {denied_actions}")
+        logger.info(
+            "Consent denied or not provided by '%s' to '%s' for '%s' actions: %s",
+            user_id, request.requester_id, request.resource, denied_actions,
+        )
         # if self.tether_chain:
         #     await self.tether_chain.add_entry(
         #         event_type="CONSENT_DENIED",
@@ -117,61 +151,84 @@ class ConsentEngineService:
         """
         Checks if a specific action is permitted for a requester on a resource by a user.
         """
-        if user_id not in self._consent_db:
+        return self._check_cached(user_id, requester_id, resource, action)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _check_cached(user_id: str, requester_id: str, resource: str, action: str) -> bool:
+        # Agents re-check the same (mostly denied) permissions every turn, so answers are memoized.
+        # Any grant or revoke clears the whole cache; writes are rare compared to checks.
+        user_records = ConsentEngineService._consent_db.get(user_id)
+        if not user_records:
             return False
-        
-        for record in self._consent_db[user_id]:
-            if record.requester_id == requester_id and \
-               record.resource == resource and \
-               action in record.actions_granted and \
-               record.status == "active":
-                # TODO: Check conditions and expiry if implemented
-                # if record.expires_at and record.expires_at < datetime.now(timezone.utc):
-                #     record.status = "expired" # Mark as expired
-                #     # Log to TetherChain
-                #     return False
-                return True
+
+        record = user_records.get((requester_id, resource))
+        if record is not None and record.status == "active" and action in record._granted_set:
+            # TODO: Check conditions and expiry if implemented (expiry would also need to bypass this cache)
+            # if record.expires_at and record.expires_at < datetime.now(timezone.utc):
+            #     record.status = "expired" # Mark as expired
+            #     # Log to TetherChain
+            #     return False
+            return True
         return False
 
     async def revoke_consent(self, user_id: str, requester_id: str, resource: str, actions: Optional[List[str]] = None):
         """Revokes consent for specific actions or all actions on a resource."""
-        if user_id not in self._consent_db:
-            print(f"No consent records found for user '{user_id}' to revoke.")
+        user_records = self._consent_db.get(user_id)
+        if user_records is None:
+            logger.info("No consent records found for user '%s' to revoke.", user_id)
             return
 
-        updated_records = []
-        revoked_something = False
-        for record in self._consent_db[user_id]:
-            if record.requester_id == requester_id and record.resource == resource:
+        async with self._lock_for(user_id):
+            key = (requester_id, resource)
+            record = user_records.get(key)
+            revoked_something = False
+            if record is not None:
                 if actions is None: # Revoke all actions for this resource/requester
-                    record.status = "revoked"
-                    revoked_something = True
-                    print(f"All consent revoked for '{requester_id}' on '{resource}' by '{user_id}'.")
+                    record = dataclasses.replace(record, status="revoked")
+                    logger.info("All consent revoked for '%s' on '%s' by '%s'.", requester_id, resource, user_id)
                     # Log to TetherChain
                 else:
-                    original_granted = set(record.actions_granted)
                     actions_to_revoke = set(actions)
-                    record.actions_granted = list(original_granted - actions_to_revoke)
-                    if not record.actions_granted: # If all actions removed, mark as revoked
-                        record.status = "revoked"
-                    revoked_something = True
-                    print(f"Consent for actions {actions_to_revoke} revoked for '{requester_id}' on '{resource}' by '{user_id}'.")
+                    remaining = record._granted_set - actions_to_revoke
+                    # If all actions removed, mark as revoked
+                    record = dataclasses.replace(
+                        record,
+                        actions_granted=list(remaining),
+                        status=record.status if remaining else "revoked"
+                    )
+                    logger.info(
+                        "Consent for actions %s revoked for '%s' on '%s' by '%s'.",
+                        actions_to_revoke, requester_id, resource, user_id,
+                    )
                     # Log to TetherChain
-            if record.status == "active": # Keep only active or non-matching records
-                 updated_records.append(record)
-        
-        self._consent_db[user_id] = updated_records
+                revoked_something = True
+                if record.status != "active": # Keep only active records
+                    del user_records[key]
+                else:
+                    user_records[key] = record
+                self._active_cache[user_id] = None
+                self._check_cached.cache_clear()
+
         if not revoked_something:
-            print(f"No matching active consent found to revoke for '{requester_id}' on '{resource}'.")
+            logger.info("No matching active consent found to revoke for '%s' on '%s'.", requester_id, resource)
 
 
     async def get_user_consents(self, user_id: str) -> List[ConsentRecord]:
-        """Retrieves all active consent records for a user."""
-        return [r for r in self._consent_db.get(user_id, []) if r.status == "active"]
+        """
+        Retrieves all active consent records for a user.
+        The list is cached until the user's consents change; callers should treat it as read-only.
+        """
+        active = self._active_cache.get(user_id)
+        if active is None:
+            active = [r for r in self._consent_db.get(user_id, {}).values() if r.status == "active"]
+            self._active_cache[user_id] = active
+        return active
 
 # Example Usage
 if __name__ == "__main__":
     async def main():
+        logging.basicConfig(level=logging.INFO)
         consent_service = ConsentEngineService()
         user_id = "user_test_consent"
         agent_id_focus = "agent_focus_mind"
@@ -211,8 +268,11 @@ if __name__ == "__main__":
         # List consents
         consents = await consent_service.get_user_consents(user_id)
         print(f"\nActive consents for {user_id}:")
+        import json
         for c in consents:
-            print(c.model_dump_json(indent=2))
+            # Only the constructor fields; the internal _granted_set cache isn't part of the record
+            c_dict = {f.name: getattr(c, f.name) for f in dataclasses.fields(c) if f.init}
+            print(json.dumps(c_dict, default=str, indent=2))
 
         # Revoke consent
         await consent_service.revoke_consent(user_id, agent_id_calendar, "calendar_api", ["write_event"])
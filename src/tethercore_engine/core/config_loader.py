@@ -1,44 +1,146 @@
+import functools
+import json
+import logging
 import yaml
 import os
-from pydantic import BaseModel, Field, HttpUrl, FilePath, DirectoryPath
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import Optional, List, Dict, Any
+from pydantic import Field, HttpUrl, FilePath, DirectoryPath, TypeAdapter, ValidationError, model_validator
+from pydantic_settings import BaseSettings, EnvSettingsSource, PydanticBaseSettingsSource, SettingsConfigDict
+from pydantic_settings.sources import parse_env_vars
+from typing import BinaryIO, Callable, Literal, Optional, Dict, Any, Mapping, Sequence, Tuple, Type
+from typing_extensions import TypedDict # Pydantic requires this one on Python < 3.12
 
-# Define Pydantic models for different sections of your configuration
-# to get type checking and validation.
+from .exceptions import ConfigException
 
-class LLMRouterConfig(BaseModel):
-    default_model: Optional[str] = "ollama/mistral" # Example default
-    available_models: List[str] = Field(default_factory=lambda: ["ollama/mistral", "ollama/phi-3"])
+logger = logging.getLogger(__name__)
+
+# libyaml-backed loader when PyYAML was built with it; same safe semantics, much faster parsing.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    import orjson # Optional: faster parsing for JSON config files
+except ImportError:
+    orjson = None
+
+_ENV_FILE = ".env" # Dotenv file read by AppConfig (relative to the working directory)
+
+# Typed sections of the configuration. These are TypedDicts rather than nested BaseModels: they are only
+# ever built as part of AppConfig, so Pydantic validates them inside the parent's single schema instead of
+# dispatching to a validator per sub-model. Sections are plain dicts (config.llm_router["default_model"]);
+# keys left out of the YAML/env are filled from _SECTION_DEFAULTS after validation.
+
+class LLMRouterConfig(TypedDict, total=False):
+    default_model: Optional[str]
+    available_models: Sequence[str]
     # Add API keys if LiteLLM doesn't manage them through its own env vars or proxy
-    # openai_api_key: Optional[str] = Field(None, alias="OPENAI_API_KEY")
-    # anthropic_api_key: Optional[str] = Field(None, alias="ANTHROPIC_API_KEY")
-    verbose_litellm: bool = False
-
-class VectorStoreConfig(BaseModel):
-    provider: str = "weaviate" # "weaviate" or "chroma"
-    weaviate_url: Optional[HttpUrl] = "http://localhost:8080"
-    weaviate_api_key: Optional[str] = None
-    chroma_path: Optional[DirectoryPath] = "./chroma_data" # Path for on-disk Chroma
-    chroma_collection_name: str = "tether_echos"
-
-class SyftConfig(BaseModel):
-    use_local_virtual_worker: bool = True
-    syft_node_url: Optional[HttpUrl] = None
+    # openai_api_key: Optional[str]
+    # anthropic_api_key: Optional[str]
+    verbose_litellm: bool
+
+class VectorStoreConfig(TypedDict, total=False):
+    provider: str # "weaviate" or "chroma"
+    weaviate_url: Optional[HttpUrl]
+    weaviate_api_key: Optional[str]
+    weaviate_hybrid_alpha: float # Vector vs keyword weight for text search (1.0 = pure vector, 0.0 = pure BM25)
+    chroma_path: Optional[DirectoryPath] # Path for on-disk Chroma
+    chroma_collection_name: str
+
+class SyftConfig(TypedDict, total=False):
+    use_local_virtual_worker: bool
+    syft_node_url: Optional[HttpUrl]
     # Add syft credentials if needed for a remote node
 
-class TetherChainConfig(BaseModel):
-    log_file_path: FilePath = "tether_chain.log.jsonl" # Default path
+class TetherChainConfig(TypedDict, total=False):
+    log_file_path: FilePath
+    durability: Literal["always", "interval", "never"] # When written entries are fdatasync'ed to disk
+    sync_interval_ms: float # Max delay before an fdatasync under "interval" durability
 
-class AgentRuntimeConfig(BaseModel):
-    docker_socket_url: Optional[str] = None # e.g., "unix://var/run/docker.sock"
+class AgentRuntimeConfig(TypedDict, total=False):
+    docker_socket_url: Optional[str] # e.g., "unix://var/run/docker.sock"
+
+class VoiceInterfaceConfig(TypedDict, total=False):
+    whisper_cpp_executable: Optional[str] # Assumes in PATH or provide full path
+    whisper_model_path: Optional[FilePath]
+    whisper_server_executable: Optional[str] # whisper.cpp HTTP server kept running between requests; null runs the CLI each time
+    whisper_threads: Optional[int] # Threads for whisper.cpp; null uses every CPU
+    prefer_quantized_models: bool # Use a quantized sibling of a model file (e.g. ggml-base.en-q5_1.bin) when one exists
+    device: Literal["auto", "cpu", "cuda", "metal"] # Where STT/TTS inference runs; "auto" uses a GPU when one is usable
+    tts_cache_dir: Optional[str] # Synthesized audio reused for repeated text; null disables the cache
+    tts_cache_max_bytes: int
+    piper_tts_executable: Optional[str]
+    piper_tts_model_path: Optional[FilePath] # e.g., "models/en_US-lessac-medium.onnx"
+    piper_tts_config_path: Optional[FilePath] # e.g., "models/en_US-lessac-medium.onnx.json"
+
+# Default URL validated once at import, so configs that rely on it carry a real HttpUrl (like a user-supplied
+# value) without re-running URL validation per AppConfig.
+_DEFAULT_WEAVIATE_URL = TypeAdapter(HttpUrl).validate_python("http://localhost:8080")
+
+_DEFAULT_MODELS = ("ollama/mistral", "ollama/phi-3")
+
+# Per-section defaults. Like the old model defaults, these are not validated (the default paths need not exist,
+# and no stat is done for them; FilePath/DirectoryPath checks only run on values the user supplies).
+# Every value is immutable, so configs can share them and the merge below only copies the outer dict.
+_SECTION_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "llm_router": {
+        "default_model": "ollama/mistral", # Example default
+        "available_models": _DEFAULT_MODELS,
+        "verbose_litellm": False,
+    },
+    "vector_store": {
+        "provider": "weaviate",
+        "weaviate_url": _DEFAULT_WEAVIATE_URL,
+        "weaviate_api_key": None,
+        "weaviate_hybrid_alpha": 0.5,
+        "chroma_path": "./chroma_data",
+        "chroma_collection_name": "tether_echos",
+    },
+    "privacy_layer_syft": {
+        "use_local_virtual_worker": True,
+        "syft_node_url": None,
+    },
+    "tether_chain": {
+        "log_file_path": "tether_chain.log.jsonl", # Default path
+        "durability": "interval",
+        "sync_interval_ms": 5.0,
+    },
+    "agent_runtime": {
+        "docker_socket_url": None,
+    },
+    "voice_interface": {
+        "whisper_cpp_executable": "main",
+        "whisper_model_path": "models/ggml-base.en.bin",
+        "whisper_server_executable": "whisper-server",
+        "whisper_threads": None,
+        "prefer_quantized_models": True,
+        "device": "auto",
+        "tts_cache_dir": "~/.cache/tethercore/tts",
+        "tts_cache_max_bytes": 256 * 1024 * 1024,
+        "piper_tts_executable": "piper",
+        "piper_tts_model_path": None,
+        "piper_tts_config_path": None,
+    },
+}
+
+class _ScopedEnvSettingsSource(EnvSettingsSource):
+    """
+    Environment source that keeps only the variables that can map onto a settings field: a field's env name,
+    or "<field>__..." for nested sections. The stock source copies all of os.environ, and every nested section
+    then re-scans that copy, so a long environment is walked once per section on each AppConfig build.
+    _load_env_vars and _extract_field_info are pydantic-settings internals, which is why pyproject.toml
+    pins pydantic-settings to 2.2.x; re-check this class before widening that range.
+    """
+    def _load_env_vars(self) -> Mapping[str, Optional[str]]:
+        exact_names = set()
+        for field_name, field in self.settings_cls.model_fields.items():
+            for _, env_name, _ in self._extract_field_info(field, field_name):
+                exact_names.add(env_name)
+        nested_prefixes = tuple(name + self.env_nested_delimiter for name in exact_names) if self.env_nested_delimiter else ()
 
-class VoiceInterfaceConfig(BaseModel):
-    whisper_cpp_executable: Optional[str] = "main" # Assumes in PATH or provide full path
-    whisper_model_path: Optional[FilePath] = "models/ggml-base.en.bin"
-    piper_tts_executable: Optional[str] = "piper"
-    piper_tts_model_path: Optional[FilePath] = None # e.g., "models/en_US-lessac-medium.onnx"
-    piper_tts_config_path: Optional[FilePath] = None # e.g., "models/en_US-lessac-medium.onnx.json"
+        relevant = {}
+        for key, value in os.environ.items():
+            name = key if self.case_sensitive else key.lower()
+            if name in exact_names or (nested_prefixes and name.startswith(nested_prefixes)):
+                relevant[key] = value
+        return parse_env_vars(relevant, self.case_sensitive, self.env_ignore_empty, self.env_parse_none_str)
 
 class AppConfig(BaseSettings):
     """
@@ -47,38 +149,79 @@ class AppConfig(BaseSettings):
     """
     # Define how Pydantic-settings should load configurations
     model_config = SettingsConfigDict(
-        env_file='.env',                # Load from .env file
+        env_file=_ENV_FILE,             # Load from .env file
         env_file_encoding='utf-8',
         env_nested_delimiter='__',      # For nested env vars like TETHERCORE__LLM_ROUTER__DEFAULT_MODEL
-        extra='ignore'                  # Ignore extra fields in .env or environment
+        extra='ignore',                 # Ignore extra fields in .env or environment
+        defer_build=True                # Build the schema on the first load_app_config(), not at import
     )
 
     app_name: str = "TetherCore"
     environment: str = "development" # "development", "production", "testing"
     debug_mode: bool = Field(default=True, alias="TETHER_DEBUG_MODE")
 
-    llm_router: LLMRouterConfig = Field(default_factory=LLMRouterConfig)
-    vector_store: VectorStoreConfig = Field(default_factory=VectorStoreConfig)
-    privacy_layer_syft: SyftConfig = Field(default_factory=SyftConfig)
-    tether_chain: TetherChainConfig = Field(default_factory=TetherChainConfig)
-    agent_runtime: AgentRuntimeConfig = Field(default_factory=AgentRuntimeConfig)
-    voice_interface: VoiceInterfaceConfig = Field(default_factory=VoiceInterfaceConfig)
+    llm_router: LLMRouterConfig = Field(default_factory=dict)
+    vector_store: VectorStoreConfig = Field(default_factory=dict)
+    privacy_layer_syft: SyftConfig = Field(default_factory=dict)
+    tether_chain: TetherChainConfig = Field(default_factory=dict)
+    agent_runtime: AgentRuntimeConfig = Field(default_factory=dict)
+    voice_interface: VoiceInterfaceConfig = Field(default_factory=dict)
 
     # Example of a root-level env var that Pydantic-settings would pick up
     # TETHER_ADMIN_EMAIL: Optional[str] = None
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        # Same order as the default; only the environment source is swapped for the scoped one.
+        return init_settings, _ScopedEnvSettingsSource(settings_cls), dotenv_settings, file_secret_settings
 
-_cached_config: Optional[AppConfig] = None
+    @model_validator(mode="after")
+    def _fill_section_defaults(self) -> "AppConfig":
+        for section, defaults in _SECTION_DEFAULTS.items():
+            setattr(self, section, {**defaults, **getattr(self, section)})
+        return self
 
-def load_app_config(config_file_path: str = "config/tether_config.yaml", force_reload: bool = False) -> AppConfig:
+
+# (st_mtime_ns, st_size) of a file, or None if it does not exist.
+_FileStat = Optional[Tuple[int, int]]
+# Identifies the file state a cached AppConfig was built from: (YAML path, YAML stat, .env stat).
+_ConfigSignature = Tuple[str, _FileStat, _FileStat]
+
+def _file_stat(path: str) -> _FileStat:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+def _config_file_signature(config_file_path: str) -> _ConfigSignature:
+    return (config_file_path, _file_stat(config_file_path), _file_stat(_ENV_FILE))
+
+def load_app_config(
+    config_file_path: str = "config/tether_config.yaml",
+    force_reload: bool = False,
+    trusted: bool = False,
+) -> AppConfig:
     """
     Loads application configuration from a YAML file, environment variables, and .env file.
     Uses Pydantic-settings for robust parsing and validation.
-    Caches the loaded configuration to avoid repeated file I/O.
+    Caches loaded configurations per file state and only reloads when the YAML file's path,
+    modification time or size, or the .env file's, changes (environment variable edits still need force_reload).
 
     Args:
-        config_file_path (str): Path to the main YAML configuration file.
+        config_file_path (str): Path to the main configuration file (YAML, or JSON with a .json suffix).
         force_reload (bool): If True, reloads the configuration even if cached.
+        trusted (bool): Development hot-reload fast path. With force_reload and unchanged config/.env files,
+            returns an unvalidated copy of the cached config (model_copy, no YAML parse or validation)
+            instead of reloading. Environment variable changes are not picked up on this path;
+            keep it False in production.
 
     Returns:
         AppConfig: The loaded and validated application configuration.
@@ -86,27 +229,54 @@ def load_app_config(config_file_path: str = "config/tether_config.yaml", force_r
     Raises:
         FileNotFoundError: If the YAML config file is not found.
         yaml.YAMLError: If there's an error parsing the YAML file.
-        pydantic.ValidationError: If configuration values fail validation.
+        ValueError: If there's an error parsing a JSON config file.
+        ConfigException: If configuration values fail validation (wraps the pydantic.ValidationError).
     """
-    global _cached_config
-    if _cached_config is not None and not force_reload:
-        return _cached_config
+    signature = _config_file_signature(config_file_path)
+    if force_reload:
+        if trusted:
+            # Unchanged files hit the cache; the copy stands in for a freshly built instance.
+            return _load_app_config_cached(signature).model_copy(deep=True)
+        _load_app_config_cached.cache_clear()
+    return _load_app_config_cached(signature)
+
+# Keyed by the file signature, so editing the YAML or .env file (new mtime/size) misses the cache on its own,
+# and several config files can be cached side by side. Least recently used signatures are evicted.
+@functools.lru_cache(maxsize=8)
+def _load_app_config_cached(signature: _ConfigSignature) -> AppConfig:
+    # The signature already stat'ed .env; when it is missing, tell pydantic-settings not to look for it again.
+    return _load_app_config_uncached(signature[0], env_file_present=signature[2] is not None)
+
+def _read_yaml_config(f: BinaryIO) -> Any:
+    return yaml.load(f, Loader=_SafeLoader)
 
+def _read_json_config(f: BinaryIO) -> Any:
+    # JSON has no anchors/tags to resolve, so a JSON copy of the config skips YAML parsing entirely.
+    if orjson is not None:
+        return orjson.loads(f.read())
+    return json.load(f)
+
+# Lower-cased file suffix -> reader. Anything else is read as YAML, as before.
+_CONFIG_READERS: Dict[str, Callable[[BinaryIO], Any]] = {
+    ".yaml": _read_yaml_config,
+    ".yml": _read_yaml_config,
+    ".json": _read_json_config,
+}
+
+def _load_app_config_uncached(config_file_path: str, env_file_present: bool = True) -> AppConfig:
+    read_config = _CONFIG_READERS.get(os.path.splitext(config_file_path)[1].lower(), _read_yaml_config)
     yaml_config = {}
-    if os.path.exists(config_file_path):
-        try:
-            with open(config_file_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
-                if yaml_config is None: # Handle empty YAML file
-                    yaml_config = {}
-            print(f"Successfully loaded YAML config from: {config_file_path}")
-        except FileNotFoundError:
-            print(f"Warning: YAML config file not found at {config_file_path}. Using defaults and env vars.")
-        except yaml.YAMLError as e:
-            print(f"Error parsing YAML config file {config_file_path}: {e}")
-            raise # Or handle more gracefully, e.g., by falling back to pure env/default
-    else:
-        print(f"Warning: YAML config file not found at {config_file_path}. Using defaults and env vars.")
+    try:
+        # Binary handle streamed straight into the parser; no separate exists() stat beforehand.
+        with open(config_file_path, 'rb') as f:
+            yaml_config = read_config(f)
+            if yaml_config is None: # Handle empty YAML file
+                yaml_config = {}
+    except FileNotFoundError:
+        logger.warning("Config file not found at %s. Using defaults and env vars.", config_file_path)
+    except (yaml.YAMLError, ValueError) as e: # ValueError covers json/orjson decode errors
+        logger.error("Error parsing config file %s: %s", config_file_path, e)
+        raise # Or handle more gracefully, e.g., by falling back to pure env/default
 
     # Pydantic-settings will load from .env and environment variables automatically.
     # We pass the yaml_config as initial values. Values from .env/environment
@@ -114,70 +284,16 @@ def load_app_config(config_file_path: str = "config/tether_config.yaml", force_r
     try:
         # Pydantic-settings merges dicts deeply by default when models are nested.
         # So, yaml_config will provide base values, then .env, then actual environment variables.
-        app_conf = AppConfig(**yaml_config)
-        _cached_config = app_conf
-        print("Application configuration loaded and validated successfully.")
-        if app_conf.debug_mode:
-            print("DEBUG MODE IS ENABLED.")
-        return app_conf
-    except Exception as e: # Catch Pydantic ValidationError specifically if needed
-        print(f"Error validating application configuration: {e}")
-        raise
-
-# Example Usage:
-if __name__ == "__main__":
-    # Create a dummy config/tether_config.yaml for testing
-    os.makedirs("config", exist_ok=True)
-    dummy_yaml_content = """
-app_name: "TetherCore (from YAML)"
-environment: "test_yaml"
-debug_mode: false # Overridden by env var if TETHER_DEBUG_MODE is set
-
-llm_router:
-  default_model: "ollama/phi-3-from-yaml"
-  available_models:
-    - "ollama/phi-3-from-yaml"
-    - "ollama/mistral-from-yaml"
-
-vector_store:
-  provider: "chroma"
-  chroma_path: "./test_chroma_data_yaml"
-"""
-    yaml_path = "config/tether_config.yaml"
-    with open(yaml_path, 'w') as f:
-        f.write(dummy_yaml_content)
-
-    # Create a dummy .env file for testing
-    dummy_env_content = """
-TETHER_DEBUG_MODE=True
-TETHERCORE__LLM_ROUTER__DEFAULT_MODEL="ollama/mistral-from-env"
-TETHERCORE__VECTOR_STORE__WEAVIATE_URL="http://localhost:9090"
-# TETHER_ADMIN_EMAIL="admin_from_env@example.com"
-"""
-    env_path = ".env"
-    with open(env_path, 'w') as f:
-        f.write(dummy_env_content)
-
-    try:
-        config = load_app_config(config_file_path=yaml_path)
-        print("\n--- Loaded Config ---")
-        print(config.model_dump_json(indent=2))
-
-        print(f"\nApp Name: {config.app_name}") # Should be from YAML
-        print(f"Environment: {config.environment}") # Should be from YAML
-        print(f"Debug Mode: {config.debug_mode}") # Should be True (from .env)
-        print(f"LLM Default Model: {config.llm_router.default_model}") # Should be from .env
-        print(f"LLM Available Models: {config.llm_router.available_models}") # Should be from YAML
-        print(f"Vector Store Provider: {config.vector_store.provider}") # Should be from YAML
-        print(f"Chroma Path: {config.vector_store.chroma_path}") # Should be from YAML
-        print(f"Weaviate URL: {config.vector_store.weaviate_url}") # Should be from .env
-        # print(f"Admin Email: {config.TETHER_ADMIN_EMAIL}") # Should be from .env
-
-    except Exception as e:
-        print(f"Error in example: {e}")
-    finally:
-        # Clean up dummy files
-        if os.path.exists(yaml_path): os.remove(yaml_path)
-        if os.path.exists(env_path): os.remove(env_path)
-        if os.path.exists("config") and not os.listdir("config"): os.rmdir("config")
+        if env_file_present:
+            app_conf = AppConfig(**yaml_config)
+        else:
+            app_conf = AppConfig(_env_file=None, **yaml_config)
+    except ValidationError as e:
+        raise ConfigException(f"Error validating application configuration: {e}") from e
 
+    # One record per load; the detailed form only when the application has enabled DEBUG logging.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Application configuration loaded from %s and validated (debug_mode=%s).", config_file_path, app_conf.debug_mode)
+    else:
+        logger.info("Application configuration loaded from %s.", config_file_path)
+    return app_conf
@@ -1,10 +1,34 @@
 # import litellm # Assuming litellm is installed and configured
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict # Pydantic requires this one on Python < 3.12
+
+# Only the parts of a LiteLLM (OpenAI-format) completion response we read.
+class _Message(TypedDict):
+    content: Optional[str]
+
+class _Choice(TypedDict):
+    message: _Message
+
+class LLMResponse(TypedDict):
+    choices: List[_Choice]
+
+# Built once at import; constructing a TypeAdapter per response would rebuild its validator every call.
+_RESPONSE_ADAPTER = TypeAdapter(LLMResponse)
+
+def _response_content(response: Dict[str, Any]) -> str:
+    """Validates a completion response (as a dict) and returns the first choice's text."""
+    parsed = _RESPONSE_ADAPTER.validate_python(response)
+    return (parsed["choices"][0]["message"]["content"] or "").strip()
 
 class LLMRouterService:
     """
     Service for routing requests to various LLMs using LiteLLM.
     Handles model selection, prompt formatting, and response parsing.
     """
+    # Prototype for the single user message sent per query; copied and filled in rather than rebuilt.
+    _MSG_TEMPLATE = {"role": "user", "content": None}
 
     def __init__(self, config: dict = None):
         """
@@ -15,6 +39,12 @@ class LLMRouterService:
                                      This would typically be loaded from the main config.
         """
         self.config = config or {}
+        self._default_model = self.config.get("default_model", "gpt-3.5-turbo") # Example default; resolved once
+        # Immutable, so list_available_models can hand out the same object on every call
+        self._available_models = tuple(self.config.get(
+            "available_models",
+            ("ollama/mistral (local)", "openai/gpt-3.5-turbo (example cloud)"), # Placeholder
+        ))
         # litellm.set_verbose = self.config.get("verbose", False)
         # if self.config.get("api_keys"):
         #     # Configure API keys for various providers if needed
@@ -41,47 +71,30 @@ class LLMRouterService:
         """
         print(f"LLMRouterService: Received query for model '{model or 'default'}': '{prompt[:50]}...'")
         # try:
-        #     messages = [{"content": prompt, "role": "user"}]
+        #     msg = LLMRouterService._MSG_TEMPLATE.copy()
+        #     msg["content"] = prompt
+        #     messages = [msg]
         #     response = await litellm.acompletion(
-        #         model=model or self.config.get("default_model", "gpt-3.5-turbo"), # Example default
+        #         model=model or self._default_model,
         #         messages=messages,
         #         **kwargs
         #     )
-        #     # Accessing the message content correctly based on LiteLLM's response structure
-        #     # This might be response.choices[0].message.content or response['choices'][0]['message']['content']
-        #     # or directly response.message.content depending on the version and model.
-        #     # Refer to LiteLLM documentation for the exact structure.
-        #     content = response.choices[0].message.content
-        #     return content.strip()
+        #     # LiteLLM returns a ModelResponse; validate its dict form against the OpenAI-style shape
+        #     # instead of walking attributes by hand.
+        #     return _response_content(response.model_dump())
         # except Exception as e:
         #     print(f"LLM query failed: {e}")
         #     # Consider more specific error handling and logging
         #     raise
         return f"Placeholder response for: '{prompt}'" # Placeholder
 
-    def list_available_models(self) -> list:
+    def list_available_models(self) -> Sequence[str]:
         """
         Lists models available through the LiteLLM configuration.
         This might involve parsing the config or using a LiteLLM utility if available.
+        Returns a shared tuple; copy it with list() if you need to modify it.
         """
         print("LLMRouterService: Listing available models...")
         # This is a simplified example; actual implementation depends on how models are configured.
-        # return list(litellm.model_cost.keys()) or self.config.get("available_models", [])
-        return ["ollama/mistral (local)", "openai/gpt-3.5-turbo (example cloud)"] # Placeholder
-
-if __name__ == "__main__":
-    # Example Usage (requires an async context to run acompletion)
-    import asyncio
-
-    async def main():
-        router = LLMRouterService(config={"default_model": "ollama/mistral"}) # Ensure Ollama is running
-        models = router.list_available_models()
-        print(f"Available models: {models}")
-
-        try:
-            response_text = await router.query("Hello, world! Tell me a joke.")
-            print(f"LLM Response: {response_text}")
-        except Exception as e:
-            print(f"Error during example query: {e}")
-
-    # asyncio.run(main()) # Commented out to prevent execution during generation
+        # return list(litellm.model_cost.keys()) or self._available_models
+        return self._available_models
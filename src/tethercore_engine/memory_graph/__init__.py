@@ -1,18 +1,45 @@
 # This file makes 'memory_graph' a Python sub-package.
 
-from .models import Echo, EchoCreate, EchoFilter
-from .store_interface import VectorStoreInterface
-# Conditionally import specific stores or let them be chosen by config
-# from .weaviate_store import WeaviateStore
-# from .chroma_store import ChromaStore
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import Echo, EchoCreate, EchoFilter
+    from .store_interface import VectorStoreInterface
+    from .weavite_store import WeaviateStore
+    from .chroma_store import ChromaStore
 # from .service import MemoryGraphService # If you create a service facade
 
+# Public name -> submodule that defines it. Resolved on first attribute access (PEP 562), so importing
+# the package doesn't build the Pydantic models or pull in the weaviate/chromadb clients.
+# The store backends are chosen by config and stay unimported unless actually used.
+_LAZY = {
+    "Echo": ".models",
+    "EchoCreate": ".models",
+    "EchoFilter": ".models",
+    "VectorStoreInterface": ".store_interface",
+    "WeaviateStore": ".weavite_store",
+    "ChromaStore": ".chroma_store",
+}
+
 __all__ = [
     "Echo",
     "EchoCreate",
     "EchoFilter",
     "VectorStoreInterface",
-    # "WeaviateStore",
-    # "ChromaStore",
+    "WeaviateStore",
+    "ChromaStore",
     # "MemoryGraphService",
 ]
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value # Cache so later lookups skip __getattr__
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,75 @@
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from typing import AsyncIterator, List, Optional, Dict, Any, Set, Tuple
+import asyncio
 import chromadb
 from chromadb.utils import embedding_functions # For generating embeddings if needed
 import uuid
 from datetime import datetime, timezone
+import logging
 
 from .store_interface import VectorStoreInterface
 from .models import Echo, EchoCreate, EchoFilter
 
+logger = logging.getLogger(__name__)
+
 # Configuration for ChromaDB (example)
 CHROMA_PATH = "./chroma_data"  # Path for on-disk persistence
 CHROMA_COLLECTION_NAME = "tether_echos"
+# Chroma server used when use_async_http is set (e.g. the chroma service in docker-compose)
+CHROMA_HTTP_HOST = "localhost"
+CHROMA_HTTP_PORT = 8000
+# Documents per collection.add() call in add_echos. Each call is one SQLite transaction and one embedding
+# batch, so larger batches amortize that overhead; Chroma recommends staying in the 50-250 range.
+CHROMA_ADD_BATCH_SIZE = 200
+# SQLite settings applied to the embedded client's database for faster ingest. WAL plus synchronous=NORMAL
+# can lose the last few commits on power loss but cannot corrupt the database; the even faster
+# journal_mode=OFF is deliberately not used, since a crash mid-write could then corrupt the store.
+SQLITE_PRAGMAS = (
+    ("journal_mode", "WAL"),
+    ("synchronous", "NORMAL"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-262144"), # Negative means KiB: 256 MiB of page cache
+)
+# HNSW index settings for new collections. Higher M / construction_ef build a better graph but slow inserts;
+# search_ef is how many candidates a query explores (higher = better recall, slower queries; Chroma's own default
+# is 10). Chroma fixes these when a collection is created, so they have no effect on an existing collection.
+HNSW_M = 16
+HNSW_CONSTRUCTION_EF = 100
+HNSW_SEARCH_EF = 64
+HNSW_SPACE = "cosine" # "l2", "cosine" or "ip"
+# add_echo calls arriving within this window are coalesced into one add_echos() write (and one embedding
+# batch); a batch is written early once it reaches ADD_MAX_BATCH. A window of 0 writes each add immediately.
+ADD_BATCH_WINDOW_MS = 5.0
+ADD_MAX_BATCH = 128
+# Echos kept in ChromaStore's in-process LRU cache for get_echo
+ECHO_CACHE_SIZE = 4096
 # To use a default sentence transformer for embeddings with Chroma:
 # You might need to install sentence-transformers: pip install sentence-transformers
 # DEFAULT_EMBEDDING_FUNCTION = embedding_functions.DefaultEmbeddingFunction()
 
 
+_parse_dt = datetime.fromisoformat
+
+def _epoch_seconds(dt: datetime) -> float:
+    """
+    UNIX seconds for a datetime, including the fraction, so range filters are exact within a second.
+    Always a float: Chroma compares float operands against float values only. Naive values are taken as UTC,
+    as EchoCreate does.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+# Each tag is also stored as its own boolean metadata key, "tag_<name>": True, so tag filters become
+# $eq predicates Chroma can evaluate through its metadata index instead of matching inside tags_str.
+TAG_KEY_PREFIX = "tag_"
+
+def _tag_metadata(tags: Optional[List[str]]) -> Dict[str, bool]:
+    return {TAG_KEY_PREFIX + tag: True for tag in tags} if tags else {}
+
+
 class ChromaStore(VectorStoreInterface):
     """
     ChromaDB implementation of the VectorStoreInterface.
@@ -22,37 +77,122 @@ class ChromaStore(VectorStoreInterface):
     client: Optional[chromadb.Client] = None
     collection: Optional[chromadb.Collection] = None
 
-    def __init__(self, path: str = CHROMA_PATH, collection_name: str = CHROMA_COLLECTION_NAME):
+    def __init__(
+        self,
+        path: str = CHROMA_PATH,
+        collection_name: str = CHROMA_COLLECTION_NAME,
+        add_batch_size: int = CHROMA_ADD_BATCH_SIZE,
+        embedding_function: Optional[Any] = None,
+        use_async_http: bool = False,
+        host: str = CHROMA_HTTP_HOST,
+        port: int = CHROMA_HTTP_PORT,
+        cache_size: int = ECHO_CACHE_SIZE,
+        tune_sqlite: bool = True,
+        hnsw_m: int = HNSW_M,
+        hnsw_construction_ef: int = HNSW_CONSTRUCTION_EF,
+        hnsw_search_ef: int = HNSW_SEARCH_EF,
+        distance: str = HNSW_SPACE,
+        add_batch_window_ms: float = ADD_BATCH_WINDOW_MS,
+        add_max_batch: int = ADD_MAX_BATCH,
+    ):
         self.path = path
         self.collection_name = collection_name
-        # For in-memory: self.client = chromadb.Client()
-        # For persistent:
-        self.client = chromadb.PersistentClient(path=self.path)
-        print(f"ChromaStore initialized for path: {self.path}, collection: {self.collection_name}")
+        self.distance = distance
+        self.collection_metadata = {
+            "hnsw:space": distance,
+            "hnsw:M": hnsw_m,
+            "hnsw:construction_ef": hnsw_construction_ef,
+            "hnsw:search_ef": hnsw_search_ef,
+        }
+        self.add_batch_size = add_batch_size
+        # LRU cache of Echos by id, kept current by this store's own writes. Writes made through another client
+        # (e.g. a second process sharing a Chroma server) are not seen until the entry is evicted.
+        # Cached Echos are returned as-is, so callers should treat results from get_echo as read-only.
+        self._cache: "OrderedDict[str, Echo]" = OrderedDict()
+        self._cache_max = cache_size
+        # Micro-batching of concurrent add_echo calls (see _schedule_add_flush)
+        self.add_batch_window_ms = add_batch_window_ms
+        self.add_max_batch = add_max_batch
+        self._pending_adds: List[Tuple[EchoCreate, asyncio.Future]] = []
+        self._add_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._add_flush_tasks: Set[asyncio.Task] = set()
+        self.embedding_function = embedding_function # None: the collection's own (Chroma's default) embedding function
+        # Chroma's embedded clients are synchronous; their calls are run on a worker thread (see _run) so the
+        # event loop isn't blocked. With use_async_http, a Chroma server is used through its native async client.
+        self.use_async_http = use_async_http
+        self.host = host
+        self.port = port
+        self.tune_sqlite = tune_sqlite
+        # The client is opened in connect(), so constructing a store does no disk or network I/O
+        self.client = None
+        if not use_async_http:
+            # Chroma keeps one SQLite connection per thread, and most PRAGMAs are per connection, so all calls
+            # go through a single dedicated thread: the tuned connection is the one every call uses.
+            # (The executor starts its thread on first use.)
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma")
+
+    def _tune_sqlite(self) -> None:
+        """Applies SQLITE_PRAGMAS to the calling thread's connection. Uses Chroma internals, so failures are non-fatal."""
+        try:
+            from chromadb.db.impl.sqlite import SqliteDB
+            conn = self.client._system.instance(SqliteDB)._conn_pool.connect()
+            effective = {}
+            for name, value in SQLITE_PRAGMAS:
+                conn.execute(f"PRAGMA {name}={value}")
+                effective[name] = conn.execute(f"PRAGMA {name}").fetchone()[0]
+            logger.info("Chroma SQLite settings: %s", effective)
+        except Exception as e:
+            logger.warning("Could not tune Chroma's SQLite settings (continuing with defaults): %s", e)
+
+    async def _run(self, method, *args, **kwargs):
+        """Awaits a client/collection call: natively with the async HTTP client, otherwise on the store's worker thread."""
+        if self.use_async_http:
+            return await method(*args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(method, *args, **kwargs))
 
     async def connect(self):
-        """Connect to ChromaDB (client is initialized in __init__, get/create collection here)."""
+        """Connect to ChromaDB: open the client on first use, then get/create the collection."""
         if self.collection:
-            print("Already connected to Chroma collection.")
+            logger.debug("Already connected to Chroma collection.")
             return
         try:
             # Get or create the collection.
             # You might want to specify an embedding function if Chroma isn't configured globally
             # or if you want a specific one for this collection.
-            self.collection = self.client.get_or_create_collection(
+            collection_kwargs: Dict[str, Any] = {"metadata": self.collection_metadata}
+            if self.embedding_function is not None:
+                collection_kwargs["embedding_function"] = self.embedding_function
+            if self.client is None:
+                if self.use_async_http:
+                    self.client = await chromadb.AsyncHttpClient(host=self.host, port=self.port)
+                    logger.info("Chroma client opened for server: %s:%s", self.host, self.port)
+                else:
+                    # For in-memory: chromadb.Client()
+                    # For persistent:
+                    self.client = await self._run(chromadb.PersistentClient, path=self.path)
+                    if self.tune_sqlite:
+                        await self._run(self._tune_sqlite)
+                    logger.info("Chroma client opened for path: %s", self.path)
+            self.collection = await self._run(
+                self.client.get_or_create_collection,
                 name=self.collection_name,
-                # embedding_function=DEFAULT_EMBEDDING_FUNCTION # Optional
+                **collection_kwargs,
             )
-            print(f"Successfully connected to Chroma collection: '{self.collection_name}'")
+            logger.info("Successfully connected to Chroma collection: '%s'", self.collection_name)
             await self.ensure_schema() # Chroma schema is more about collection existence
         except Exception as e:
-            print(f"Error connecting to Chroma collection: {e}")
+            logger.error("Error connecting to Chroma collection: %s", e)
             self.collection = None
             raise
 
     async def disconnect(self):
         """Chroma client does not have an explicit disconnect. Resources are managed by the client."""
-        print("Chroma client does not require explicit disconnect.")
+        logger.debug("Chroma client does not require explicit disconnect.")
+        # Write out any adds still waiting for their batch window before dropping the collection
+        if self._pending_adds:
+            self._flush_pending_adds()
+        if self._add_flush_tasks:
+            await asyncio.gather(*self._add_flush_tasks, return_exceptions=True)
         # self.client.clear_system_cache() # Optional, if issues arise
         self.collection = None # Allow garbage collection
 
@@ -64,11 +204,11 @@ class ChromaStore(VectorStoreInterface):
         """
         if not self.collection:
             # This should ideally be called after connect() ensures collection exists
-            print("Collection not available. Call connect() first.")
+            logger.warning("Collection not available. Call connect() first.")
             await self.connect()
             if not self.collection:
                 raise ConnectionError("Failed to connect to Chroma to ensure schema.")
-        print(f"Chroma schema (collection '{self.collection_name}') is considered ensured if collection exists.")
+        logger.debug("Chroma schema (collection '%s') is considered ensured if collection exists.", self.collection_name)
 
     def _echo_to_chroma_doc(self, echo: EchoCreate, echo_id: str) -> Dict[str, Any]:
         """Helper to convert EchoCreate to Chroma document format (metadata, document content)."""
@@ -76,10 +216,15 @@ class ChromaStore(VectorStoreInterface):
             "user_id": echo.user_id,
             "created_at": echo.created_at.isoformat(),
             "updated_at": echo.updated_at.isoformat(),
+            # Numeric copies of the timestamps so date filters can use $gte/$lte range predicates
+            # (the ISO strings above are kept for exact round-tripping, including microseconds).
+            "created_at_ts": _epoch_seconds(echo.created_at),
+            "updated_at_ts": _epoch_seconds(echo.updated_at),
             # Store tags as a single string or handle them carefully if filtering is needed
             # Chroma metadata values must be string, int, float, or bool.
             # For list of tags, you might join them or handle complex queries differently.
-            "tags_str": ",".join(sorted(list(set(echo.tags)))) if echo.tags else "",
+            "tags_str": ",".join(echo.tags) if echo.tags else "", # Already sorted and unique (EchoBase validator)
+            **_tag_metadata(echo.tags),
         }
         # Add other flat metadata if present
         # if echo.metadata:
@@ -88,56 +233,168 @@ class ChromaStore(VectorStoreInterface):
         #             metadata[k] = v
         return {"id": echo_id, "document": echo.content, "metadata": metadata}
 
+    @staticmethod
+    def _build_where(filters: Optional[EchoFilter]) -> Optional[Dict[str, Any]]:
+        """
+        Translates an EchoFilter into a Chroma where clause: None when nothing can be pushed down, the bare
+        predicate when there is one, otherwise {"$and": [...]} (Chroma rejects multi-key where dicts).
+        content_contains is not pushed down (it would need where_document).
+        """
+        if filters is None:
+            return None
+        predicates: List[Dict[str, Any]] = []
+        if filters.user_id:
+            predicates.append({"user_id": filters.user_id})
+        if filters.start_date:
+            predicates.append({"created_at_ts": {"$gte": _epoch_seconds(filters.start_date)}})
+        if filters.end_date:
+            predicates.append({"created_at_ts": {"$lte": _epoch_seconds(filters.end_date)}})
+        if filters.tags_include_all:
+            predicates.extend({TAG_KEY_PREFIX + tag: True} for tag in filters.tags_include_all)
+        if filters.tags_include_any:
+            any_tag = [{TAG_KEY_PREFIX + tag: True} for tag in filters.tags_include_any]
+            predicates.append(any_tag[0] if len(any_tag) == 1 else {"$or": any_tag})
+        if not predicates:
+            return None
+        return predicates[0] if len(predicates) == 1 else {"$and": predicates}
+
     def _chroma_doc_to_echo(self, doc_id: str, document_content: Optional[str], metadata: Optional[Dict[str, Any]]) -> Echo:
         """Helper to convert Chroma document format back to Echo."""
         if metadata is None:
             metadata = {}
         tags_str = metadata.get("tags_str", "")
-        tags_list = [tag for tag in tags_str.split(',') if tag] if tags_str else []
+        tags = tuple(tag for tag in tags_str.split(',') if tag) if tags_str else () # Stored sorted and unique
 
-        return Echo(
+        # Everything here was validated when it was written, so skip re-validating every row read back
+        return Echo.model_construct(
             id=doc_id,
             content=document_content or "",
-            tags=tags_list,
+            tags=tags,
             user_id=metadata.get("user_id", "unknown_user"),
-            created_at=datetime.fromisoformat(metadata["created_at"]) if "created_at" in metadata else datetime.now(timezone.utc),
-            updated_at=datetime.fromisoformat(metadata["updated_at"]) if "updated_at" in metadata else datetime.now(timezone.utc),
+            created_at=_parse_dt(metadata["created_at"]) if "created_at" in metadata else datetime.now(timezone.utc),
+            updated_at=_parse_dt(metadata["updated_at"]) if "updated_at" in metadata else datetime.now(timezone.utc),
+            metadata={},
             # metadata={k: v for k, v in metadata.items() if k not in ["user_id", "created_at", "updated_at", "tags_str"]}
         )
 
+    def _cache_put(self, echo: Echo) -> None:
+        self._cache[echo.id] = echo
+        self._cache.move_to_end(echo.id)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False) # Evict the least recently used entry
+
+    def _rows_to_echos(self, ids: Optional[List[str]], documents: Optional[List[Any]], metadatas: Optional[List[Any]]) -> List[Echo]:
+        """Converts the parallel id/document/metadata lists of a get() (or one query() row) into Echos."""
+        if not ids:
+            return []
+        to_echo = self._chroma_doc_to_echo
+        missing = [None] * len(ids)
+        return [to_echo(doc_id, doc, meta) for doc_id, doc, meta in zip(ids, documents or missing, metadatas or missing, strict=True)]
+
     async def add_echo(self, echo_data: EchoCreate) -> Echo:
-        """Adds a new Echo to Chroma."""
+        """
+        Adds a new Echo to Chroma. Concurrent calls within add_batch_window_ms are written together in one
+        add_echos() call, so their documents are embedded as a single batch.
+        """
+        if self.add_batch_window_ms <= 0:
+            return (await self.add_echos([echo_data]))[0]
         if not self.collection:
             raise ConnectionError("Chroma collection not available. Call connect() first.")
 
-        echo_id = str(uuid.uuid4())
-        chroma_doc = self._echo_to_chroma_doc(echo_data, echo_id)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_adds.append((echo_data, future))
+        if len(self._pending_adds) >= self.add_max_batch:
+            self._flush_pending_adds()
+        elif self._add_flush_handle is None:
+            # The window is a hard deadline: the first add of a batch waits at most this long
+            self._add_flush_handle = loop.call_later(self.add_batch_window_ms / 1000, self._flush_pending_adds)
+        return await future
+
+    def _flush_pending_adds(self) -> None:
+        """Starts writing the pending adds as one batch."""
+        if self._add_flush_handle is not None:
+            self._add_flush_handle.cancel()
+            self._add_flush_handle = None
+        batch, self._pending_adds = self._pending_adds, []
+        task = asyncio.ensure_future(self._write_add_batch(batch))
+        self._add_flush_tasks.add(task) # Keep a reference until done so the task isn't garbage collected
+        task.add_done_callback(self._add_flush_tasks.discard)
+
+    async def _write_add_batch(self, batch: List[Tuple[EchoCreate, asyncio.Future]]) -> None:
+        try:
+            created = await self.add_echos([echo_data for echo_data, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done(): # Skip callers that were cancelled while waiting
+                    future.set_exception(e)
+            return
+        for (_, future), echo in zip(batch, created, strict=True):
+            if not future.done():
+                future.set_result(echo)
+
+    async def add_echos(self, echos: List[EchoCreate]) -> List[Echo]:
+        """Adds several Echos to Chroma, writing them in batches of add_batch_size per collection.add() call."""
+        if not self.collection:
+            raise ConnectionError("Chroma collection not available. Call connect() first.")
+
+        ids: List[str] = []
+        documents: List[str] = []
+        metadatas: List[Dict[str, Any]] = []
+        for echo_data in echos:
+            chroma_doc = self._echo_to_chroma_doc(echo_data, str(uuid.uuid4()))
+            ids.append(chroma_doc["id"])
+            documents.append(chroma_doc["document"])
+            metadatas.append(chroma_doc["metadata"])
 
         try:
-            self.collection.add(
-                ids=[chroma_doc["id"]],
-                documents=[chroma_doc["document"]], # Document to be embedded
-                metadatas=[chroma_doc["metadata"]]
-            )
-            return self._chroma_doc_to_echo(echo_id, echo_data.content, chroma_doc["metadata"])
+            for start in range(0, len(ids), self.add_batch_size):
+                end = start + self.add_batch_size
+                await self._run(self.collection.add,
+                    ids=ids[start:end],
+                    documents=documents[start:end], # Documents to be embedded
+                    metadatas=metadatas[start:end],
+                )
+            # Built from the validated inputs directly rather than by parsing back the metadata just written
+            created = [
+                Echo.model_construct(
+                    id=echo_id,
+                    content=echo_data.content,
+                    tags=echo_data.tags or (),
+                    user_id=echo_data.user_id,
+                    created_at=echo_data.created_at,
+                    updated_at=echo_data.updated_at,
+                    metadata={}, # Matches what reads return: extra metadata isn't stored in Chroma yet
+                )
+                for echo_id, echo_data in zip(ids, echos, strict=True)
+            ]
+            for echo in created:
+                self._cache_put(echo)
+            return created
         except Exception as e:
-            print(f"Error adding Echo to Chroma: {e}")
+            logger.error("Error adding Echos to Chroma: %s", e)
             raise
 
     async def get_echo(self, echo_id: str) -> Optional[Echo]:
         """Retrieves a specific Echo by its ID from Chroma."""
         if not self.collection:
             raise ConnectionError("Chroma collection not available.")
+        cached = self._cache.get(echo_id)
+        if cached is not None:
+            self._cache.move_to_end(echo_id)
+            return cached
         try:
-            results = self.collection.get(ids=[echo_id], include=["metadatas", "documents"])
+            results = await self._run(self.collection.get, ids=[echo_id], include=["metadatas", "documents"])
             if results and results['ids']:
                 doc_id = results['ids'][0]
                 doc_content = results['documents'][0] if results['documents'] else None
                 metadata = results['metadatas'][0] if results['metadatas'] else None
-                return self._chroma_doc_to_echo(doc_id, doc_content, metadata)
+                echo = self._chroma_doc_to_echo(doc_id, doc_content, metadata)
+                self._cache_put(echo)
+                return echo
             return None
         except Exception as e: # Chroma might raise specific errors for not found
-            print(f"Error getting Echo {echo_id} from Chroma: {e}")
+            logger.error("Error getting Echo %s from Chroma: %s", echo_id, e)
             return None
 
     async def list_echos(self, filters: Optional[EchoFilter] = None, limit: int = 100, offset: int = 0) -> List[Echo]:
@@ -145,41 +402,62 @@ class ChromaStore(VectorStoreInterface):
         if not self.collection:
             raise ConnectionError("Chroma collection not available.")
 
-        where_filter: Optional[Dict[str, Any]] = None
+        where_filter = self._build_where(filters)
         if filters:
-            # Chroma's where filter is a dict, e.g., {"user_id": "user123"}
-            # For tags, if stored as "tags_str", you might need to use $contains or other operators
-            # if your Chroma version supports advanced metadata filtering.
-            # This is a simplified example.
-            temp_filter = {}
-            if filters.user_id:
-                temp_filter["user_id"] = filters.user_id
-            # if filters.tags_include_all: # Complex for comma-separated string
-            #    # This would require more advanced query or post-filtering
-            #    print("Warning: Complex tag filtering not fully supported by this basic ChromaStore list_echos.")
-            if temp_filter:
-                where_filter = temp_filter
-            print(f"Filtering with: {where_filter}. Filters received: {filters}")
+            logger.debug("Filtering with: %s. Filters received: %s", where_filter, filters)
 
 
         try:
-            results = self.collection.get(
+            results = await self._run(self.collection.get,
                 where=where_filter,
                 limit=limit,
                 offset=offset,
                 include=["metadatas", "documents"]
             )
-            echos = []
-            if results and results['ids']:
-                for i, doc_id in enumerate(results['ids']):
-                    doc_content = results['documents'][i] if results['documents'] else None
-                    metadata = results['metadatas'][i] if results['metadatas'] else None
-                    echos.append(self._chroma_doc_to_echo(doc_id, doc_content, metadata))
-            return echos
+            if not results:
+                return []
+            return self._rows_to_echos(results['ids'], results.get('documents'), results.get('metadatas'))
         except Exception as e:
-            print(f"Error listing Echos from Chroma: {e}")
+            logger.error("Error listing Echos from Chroma: %s", e)
             return []
 
+    async def count_echos(self, filters: Optional[EchoFilter] = None) -> int:
+        """Counts matching Echos without loading their documents or metadata."""
+        if not self.collection:
+            raise ConnectionError("Chroma collection not available.")
+
+        where_filter = self._build_where(filters)
+        if where_filter is None:
+            return await self._run(self.collection.count)
+        # collection.count() takes no filter; an ids-only get still skips document/metadata realization
+        results = await self._run(self.collection.get, where=where_filter, include=[])
+        return len(results['ids'])
+
+    async def iter_echos(self, filters: Optional[EchoFilter] = None, page_size: int = 500) -> AsyncIterator[Echo]:
+        """Yields every matching Echo, fetching page_size rows per collection.get() call."""
+        if not self.collection:
+            raise ConnectionError("Chroma collection not available.")
+
+        where_filter = self._build_where(filters)
+        to_echo = self._chroma_doc_to_echo
+        offset = 0
+        while True:
+            results = await self._run(self.collection.get,
+                where=where_filter,
+                limit=page_size,
+                offset=offset,
+                include=["metadatas", "documents"]
+            )
+            ids = results['ids'] if results else None
+            if not ids:
+                return
+            missing = [None] * len(ids)
+            for doc_id, doc, meta in zip(ids, results.get('documents') or missing, results.get('metadatas') or missing, strict=True):
+                yield to_echo(doc_id, doc, meta)
+            if len(ids) < page_size:
+                return
+            offset += page_size
+
     async def update_echo(self, echo_id: str, echo_update_data: Dict[str, Any]) -> Optional[Echo]:
         """Updates an existing Echo in Chroma (effectively add/replace)."""
         if not self.collection:
@@ -189,7 +467,7 @@ class ChromaStore(VectorStoreInterface):
         # Or, if 'upsert' is used, it handles this.
         # Let's assume we need to reconstruct the full object for update.
         # This is simplified; a real update might need careful metadata merging.
-        print(f"Updating Echo {echo_id}. Data: {echo_update_data}. This is an upsert operation.")
+        logger.debug("Updating Echo %s. Data: %s. This is an upsert operation.", echo_id, echo_update_data)
         # For a true partial update, you'd fetch, modify, then re-add/upsert.
         # Here, we'll assume echo_update_data can be used to form a new EchoCreate-like object.
 
@@ -199,8 +477,9 @@ class ChromaStore(VectorStoreInterface):
             # For simplicity, let's assume echo_update_data contains all necessary fields
             # or that we are doing a full replacement of document and metadata.
             # A more robust solution would fetch the existing record, update fields, then upsert.
+            content_changed = True # Only known to be False once the existing record has been fetched
             if "content" not in echo_update_data or "user_id" not in echo_update_data:
-                 print("Warning: Chroma update expects full document content and user_id for this simplified upsert.")
+                 logger.warning("Chroma update expects full document content and user_id for this simplified upsert.")
                  # Fetch existing to get missing parts if needed
                  existing_echo = await self.get_echo(echo_id)
                  if not existing_echo:
@@ -209,27 +488,52 @@ class ChromaStore(VectorStoreInterface):
                  updated_content = echo_update_data.get("content", existing_echo.content)
                  updated_tags = echo_update_data.get("tags", existing_echo.tags) # Assuming tags are passed as list
                  updated_user_id = echo_update_data.get("user_id", existing_echo.user_id)
+                 content_changed = updated_content != existing_echo.content
+                 previous_tag_keys = _tag_metadata(existing_echo.tags).keys()
             else:
                 updated_content = echo_update_data["content"]
                 updated_tags = echo_update_data.get("tags", [])
                 updated_user_id = echo_update_data["user_id"]
+                # Only the metadata is needed here, to find tag keys that must be cleared
+                existing = await self._run(self.collection.get, ids=[echo_id], include=["metadatas"])
+                existing_metadata = existing["metadatas"][0] if existing and existing["metadatas"] else {}
+                previous_tag_keys = [key for key in existing_metadata if key.startswith(TAG_KEY_PREFIX)]
 
 
+            now = datetime.now(timezone.utc)
+            created_at = echo_update_data.get("created_at", now) # Or keep original
+            if isinstance(created_at, str):
+                created_at = datetime.fromisoformat(created_at)
             new_metadata = {
                 "user_id": updated_user_id,
-                "created_at": echo_update_data.get("created_at", datetime.now(timezone.utc).isoformat()), # Or keep original
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "tags_str": ",".join(sorted(list(set(updated_tags)))) if updated_tags else "",
+                "created_at": created_at.isoformat(),
+                "updated_at": now.isoformat(),
+                "created_at_ts": _epoch_seconds(created_at),
+                "updated_at_ts": _epoch_seconds(now),
+                "tags_str": ",".join(sorted(set(updated_tags))) if updated_tags else "",
+                **_tag_metadata(updated_tags),
             }
-
-            self.collection.upsert(
-                ids=[echo_id],
-                documents=[updated_content],
-                metadatas=[new_metadata]
-            )
-            return await self.get_echo(echo_id) # Fetch the updated record
+            # Chroma merges metadata on update/upsert and rejects None values, so tag keys that were dropped are
+            # overwritten with False; tag filters only match True.
+            for key in previous_tag_keys:
+                new_metadata.setdefault(key, False)
+
+            if content_changed:
+                await self._run(self.collection.upsert,
+                    ids=[echo_id],
+                    documents=[updated_content],
+                    metadatas=[new_metadata],
+                )
+            else:
+                # Metadata-only edit (e.g. tags): leaving out documents= skips re-embedding the unchanged content
+                await self._run(self.collection.update, ids=[echo_id], metadatas=[new_metadata])
+            # Build the result from what was just written rather than reading the record back
+            updated_echo = self._chroma_doc_to_echo(echo_id, updated_content, new_metadata)
+            self._cache_put(updated_echo)
+            return updated_echo
         except Exception as e:
-            print(f"Error updating Echo {echo_id} in Chroma: {e}")
+            self._cache.pop(echo_id, None) # The stored record's state is uncertain after a failed write
+            logger.error("Error updating Echo %s in Chroma: %s", echo_id, e)
             return None
 
 
@@ -237,45 +541,46 @@ class ChromaStore(VectorStoreInterface):
         """Deletes an Echo from Chroma."""
         if not self.collection:
             raise ConnectionError("Chroma collection not available.")
+        self._cache.pop(echo_id, None)
         try:
-            self.collection.delete(ids=[echo_id])
+            await self._run(self.collection.delete, ids=[echo_id])
             return True
         except Exception as e: # Chroma might raise specific errors
-            print(f"Error deleting Echo {echo_id} from Chroma: {e}")
+            logger.error("Error deleting Echo %s from Chroma: %s", echo_id, e)
             return False
 
     async def search_echos_by_vector(self, vector: List[float], limit: int = 10, filters: Optional[EchoFilter] = None) -> List[Echo]:
         """Searches Echos by vector similarity."""
+        return (await self.search_echos_by_vectors([vector], limit=limit, filters=filters))[0]
+
+    async def search_echos_by_vectors(self, vectors: List[List[float]], limit: int = 10, filters: Optional[EchoFilter] = None) -> List[List[Echo]]:
+        """Searches Echos for several query vectors with a single collection.query() call."""
         if not self.collection:
             raise ConnectionError("Chroma collection not available.")
 
-        where_filter: Optional[Dict[str, Any]] = None
+        where_filter = self._build_where(filters)
         if filters:
-            # Similar to list_echos, build a where_filter if needed
-            temp_filter = {}
-            if filters.user_id: temp_filter["user_id"] = filters.user_id
-            if temp_filter: where_filter = temp_filter
-            print(f"Filtering for vector search: {where_filter}. Filters: {filters}")
+            logger.debug("Filtering for vector search: %s. Filters: %s", where_filter, filters)
 
 
         try:
-            results = self.collection.query(
-                query_embeddings=[vector],
+            results = await self._run(self.collection.query,
+                query_embeddings=vectors,
                 n_results=limit,
                 where=where_filter,
-                include=["metadatas", "documents", "distances"]
+                include=["metadatas", "documents"] # Add "distances" if callers need the scores
             )
-            echos = []
-            if results and results['ids'] and results['ids'][0]: # query returns a list of lists
-                for i, doc_id in enumerate(results['ids'][0]):
-                    doc_content = results['documents'][0][i] if results['documents'] and results['documents'][0] else None
-                    metadata = results['metadatas'][0][i] if results['metadatas'] and results['metadatas'][0] else None
-                    # distance = results['distances'][0][i] if results['distances'] and results['distances'][0] else None
-                    echos.append(self._chroma_doc_to_echo(doc_id, doc_content, metadata))
-            return echos
+            matches: List[List[Echo]] = []
+            # query returns one list per query vector
+            if results and results['ids']:
+                documents = results.get('documents') or [None] * len(results['ids'])
+                metadatas = results.get('metadatas') or [None] * len(results['ids'])
+                matches = [self._rows_to_echos(*row) for row in zip(results['ids'], documents, metadatas, strict=True)]
+            matches.extend([] for _ in range(len(vectors) - len(matches))) # Always one entry per query vector
+            return matches
         except Exception as e:
-            print(f"Error searching Echos by vector in Chroma: {e}")
-            return []
+            logger.error("Error searching Echos by vector in Chroma: %s", e)
+            return [[] for _ in vectors]
 
     async def search_echos_by_text(self, query_text: str, limit: int = 10, filters: Optional[EchoFilter] = None) -> List[Echo]:
         """
@@ -285,72 +590,23 @@ class ChromaStore(VectorStoreInterface):
         if not self.collection:
             raise ConnectionError("Chroma collection not available.")
 
-        where_filter: Optional[Dict[str, Any]] = None
+        where_filter = self._build_where(filters)
         if filters:
-            # Similar to list_echos, build a where_filter if needed
-            temp_filter = {}
-            if filters.user_id: temp_filter["user_id"] = filters.user_id
-            if temp_filter: where_filter = temp_filter
-            print(f"Filtering for text search: {where_filter}. Filters: {filters}")
+            logger.debug("Filtering for text search: %s. Filters: %s", where_filter, filters)
 
         try:
-            results = self.collection.query(
+            results = await self._run(self.collection.query,
                 query_texts=[query_text], # Chroma uses query_texts for this
                 n_results=limit,
                 where=where_filter,
                 include=["metadatas", "documents", "distances"]
             )
-            echos = []
-            if results and results['ids'] and results['ids'][0]:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    doc_content = results['documents'][0][i] if results['documents'] and results['documents'][0] else None
-                    metadata = results['metadatas'][0][i] if results['metadatas'] and results['metadatas'][0] else None
-                    echos.append(self._chroma_doc_to_echo(doc_id, doc_content, metadata))
-            return echos
+            if not results or not results['ids']:
+                return []
+            documents = results.get('documents')
+            metadatas = results.get('metadatas')
+            # Unwrap the single query's row
+            return self._rows_to_echos(results['ids'][0], documents[0] if documents else None, metadatas[0] if metadatas else None)
         except Exception as e:
-            print(f"Error searching Echos by text in Chroma: {e}")
+            logger.error("Error searching Echos by text in Chroma: %s", e)
             return []
-
-# Example of how to use (for testing)
-async def _chroma_example():
-    store = ChromaStore(path="./chroma_test_data") # Use a test path
-    try:
-        await store.connect()
-
-        new_echo_data = EchoCreate(
-            content="A test Echo for ChromaDB!",
-            tags=["test", "chroma"],
-            user_id="user_chroma_test",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        created_echo = await store.add_echo(new_echo_data)
-        print(f"Chroma - Created Echo: {created_echo}")
-
-        if created_echo:
-            retrieved_echo = await store.get_echo(created_echo.id)
-            print(f"Chroma - Retrieved Echo: {retrieved_echo}")
-
-            all_echos = await store.list_echos(limit=5)
-            print(f"Chroma - Listed Echos: {all_echos}")
-
-            # Text search (ensure your collection has an appropriate embedding function)
-            # search_results = await store.search_echos_by_text("test Chroma", limit=2)
-            # print(f"Chroma - Search results (text): {search_results}")
-
-            # await store.delete_echo(created_echo.id)
-            # print(f"Chroma - Echo deleted: {await store.get_echo(created_echo.id) is None}")
-
-    except Exception as e:
-        print(f"An error occurred in Chroma example: {e}")
-    finally:
-        await store.disconnect()
-        # Clean up test data directory if needed
-        # import shutil
-        # shutil.rmtree("./chroma_test_data", ignore_errors=True)
-
-
-if __name__ == "__main__":
-    # import asyncio
-    # asyncio.run(_chroma_example()) # Commented out
-    pass
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, field_validator, validator
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 import uuid
 
@@ -12,13 +12,26 @@ class EchoBase(BaseModel):
     An Echo represents a piece of memory, a thought, a goal, etc.
     """
     content: str = Field(..., description="The textual content of the Echo.")
-    tags: Optional[List[str]] = Field(default_factory=list, description="Tags associated with the Echo for categorization and retrieval.")
+    tags: Optional[Tuple[str, ...]] = Field(default_factory=tuple, description="Tags associated with the Echo for categorization and retrieval (sorted, unique).")
     user_id: str = Field(..., description="The ID of the user who owns this Echo.")
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict, description="Arbitrary metadata associated with the Echo.")
     # Optional: Add fields for source (e.g., 'manual', 'agent:focus_mind', 'voice_input')
     # source_application: Optional[str] = None
     # sentiment_score: Optional[float] = None # If sentiment analysis is performed
 
+    @field_validator('tags', mode='before')
+    @classmethod
+    def normalize_tags(cls, v):
+        # Sorted, de-duplicated and frozen once here, so stores can serialize tags without re-sorting on every write
+        if v is None:
+            return ()
+        if not isinstance(v, (list, tuple, set, frozenset)):
+            return v # Strings and other non-sequences are left for field validation to reject
+        try:
+            return tuple(sorted({tag for tag in v if tag}))
+        except TypeError: # Unhashable or unorderable items; field validation reports them
+            return v
+
 class EchoCreate(EchoBase):
     """
     Model for creating a new Echo.
@@ -59,38 +72,3 @@ class EchoFilter(BaseModel):
     user_id: Optional[str] = None
     content_contains: Optional[str] = None
     # Add other filter criteria as needed
-
-# Example usage:
-if __name__ == "__main__":
-    # Create an Echo
-    echo_to_create = EchoCreate(
-        content="This is my first thought for TetherCore's memory graph!",
-        tags=["project-tether", "idea", "memory-graph"],
-        user_id="user_cj_taylor"
-    )
-    print("Echo to Create:")
-    print(echo_to_create.model_dump_json(indent=2))
-    print(f"Created at (UTC): {echo_to_create.created_at}")
-
-    # Simulate an Echo retrieved from DB
-    retrieved_echo_data = {
-        "id": str(uuid.uuid4()),
-        "content": "Retrieved thought about AI ethics.",
-        "tags": ["ai", "ethics", "important"],
-        "user_id": "user_cj_taylor",
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
-        "metadata": {"source": "manual_entry", "priority": "high"}
-    }
-    retrieved_echo = Echo(**retrieved_echo_data)
-    print("\nRetrieved Echo:")
-    print(retrieved_echo.model_dump_json(indent=2))
-
-    # Filter example
-    echo_filter = EchoFilter(
-        tags_include_any=["idea", "important"],
-        user_id="user_cj_taylor",
-        start_date=datetime(2024, 1, 1, tzinfo=timezone.utc)
-    )
-    print("\nEcho Filter:")
-    print(echo_filter.model_dump_json(indent=2))
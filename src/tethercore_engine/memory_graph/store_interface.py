@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any
 from .models import Echo, EchoCreate, EchoFilter # Assuming models.py is in the same directory
 
 class VectorStoreInterface(ABC):
@@ -31,6 +31,19 @@ class VectorStoreInterface(ABC):
         """
         pass
 
+    async def add_echos(self, echos: List[EchoCreate]) -> List[Echo]:
+        """
+        Adds several Echos in one call. Backends that support bulk writes should override this;
+        the default simply adds them one at a time.
+
+        Args:
+            echos (List[EchoCreate]): The data for the new Echos.
+
+        Returns:
+            List[Echo]: The created Echos, in the same order as the input.
+        """
+        return [await self.add_echo(echo_data) for echo_data in echos]
+
     @abstractmethod
     async def get_echo(self, echo_id: str) -> Optional[Echo]:
         """
@@ -59,6 +72,40 @@ class VectorStoreInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def count_echos(self, filters: Optional[EchoFilter] = None) -> int:
+        """
+        Counts Echos matching the filters without retrieving them.
+
+        Args:
+            filters (Optional[EchoFilter]): Filters to apply.
+
+        Returns:
+            int: The number of matching Echos.
+        """
+        pass
+
+    async def iter_echos(self, filters: Optional[EchoFilter] = None, page_size: int = 500) -> AsyncIterator[Echo]:
+        """
+        Iterates over all matching Echos, fetching them a page at a time, for exports and streaming responses
+        that should not hold every Echo in memory at once. Backends can override this to avoid building each page.
+
+        Args:
+            filters (Optional[EchoFilter]): Filters to apply.
+            page_size (int): Number of Echos fetched per round trip.
+
+        Yields:
+            Echo: Each matching Echo.
+        """
+        offset = 0
+        while True:
+            page = await self.list_echos(filters=filters, limit=page_size, offset=offset)
+            for echo in page:
+                yield echo
+            if len(page) < page_size:
+                return
+            offset += page_size
+
     @abstractmethod
     async def update_echo(self, echo_id: str, echo_update_data: Dict[str, Any]) -> Optional[Echo]:
         """
@@ -102,6 +149,21 @@ class VectorStoreInterface(ABC):
         """
         pass
 
+    async def search_echos_by_vectors(self, vectors: List[List[float]], limit: int = 10, filters: Optional[EchoFilter] = None) -> List[List[Echo]]:
+        """
+        Runs several vector similarity searches at once. Backends that can batch queries should override this;
+        the default runs them one at a time.
+
+        Args:
+            vectors (List[List[float]]): The query vectors.
+            limit (int): Maximum number of similar Echos to return per query.
+            filters (Optional[EchoFilter]): Additional filters to apply to every search.
+
+        Returns:
+            List[List[Echo]]: One list of similar Echos per query vector, in input order.
+        """
+        return [await self.search_echos_by_vector(vector, limit=limit, filters=filters) for vector in vectors]
+
     @abstractmethod
     async def search_echos_by_text(self, query_text: str, limit: int = 10, filters: Optional[EchoFilter] = None) -> List[Echo]:
         """
@@ -1,215 +1,582 @@
-from typing import List, Optional, Dict, Any
+from collections import OrderedDict
+from typing import AsyncIterator, Hashable, List, Optional, Dict, Any, Sequence, Set, Tuple, Union
+from urllib.parse import urlparse
+import asyncio
+import logging
+import struct
+import time
 import weaviate
+from weaviate.classes.config import Configure, DataType, Property
+from weaviate.classes.data import DataObject
+from weaviate.classes.query import Filter
 import uuid # For generating IDs if not provided by Weaviate or if needed
+from datetime import datetime, timezone
 from .store_interface import VectorStoreInterface
 from .models import Echo, EchoCreate, EchoFilter
 
+logger = logging.getLogger(__name__)
+
 # Configuration for Weaviate connection (example)
 WEAVIATE_URL = "http://localhost:8080" # Or from config
+WEAVIATE_GRPC_PORT = 50051 # v4 client talks gRPC for queries/inserts alongside HTTP (see docker-compose.yml)
 WEAVIATE_API_KEY = None # If using Weaviate Cloud Services (WCS)
+WEAVIATE_CONNECTION_TYPE = "custom" # "local", "cloud" (WCS, url is the cluster URL) or "custom" (any host from url)
 ECHO_CLASS_NAME = "Echo" # Name of the class in Weaviate schema
+ECHO_PROPERTIES = ("content", "tags", "created_at", "updated_at", "user_id") # Returned by queries unless `fields` narrows them
+# A query result: a full Echo, or, when the query passed `fields`, a plain dict of "id" plus just those properties
+# (a partial Echo would fill the missing fields with defaults that look like real values).
+EchoResult = Union[Echo, Dict[str, Any]]
+# "text2vec-transformers" (Weaviate embeds content itself) or "none" (you provide vectors; text search is then BM25 only)
+WEAVIATE_VECTORIZER = "text2vec-transformers"
+# Vector compression for the HNSW index: None (full float32 vectors), "bq" (binary, 32x smaller), "sq" (scalar int8,
+# 4x smaller; needs Weaviate >= 1.26) or "pq" (product quantization). The graph is traversed on the compressed vectors
+# and the top WEAVIATE_RESCORE_LIMIT candidates are rescored with full-precision vectors, so search_echos_by_vector
+# keeps most of its accuracy. Like the vectorizer, this is fixed when the collection is created.
+WEAVIATE_QUANTIZER: Optional[str] = None
+WEAVIATE_RESCORE_LIMIT = 20
+# HNSW search list size. None keeps Weaviate's dynamic ef (scaled with each query's limit); a fixed value trades
+# recall against traversal cost. Applied when the collection is created (later changes go through collection.config.update).
+WEAVIATE_HNSW_EF: Optional[int] = None
+WEAVIATE_QUANTIZER_TRAINING_LIMIT = 100_000 # Vectors sampled to train the "sq"/"pq" quantizers
+# Weight of vector vs keyword scoring in search_echos_by_text's hybrid query: 1.0 is pure vector, 0.0 pure BM25
+WEAVIATE_HYBRID_ALPHA = 0.5
+WEAVIATE_BATCH_SIZE = 100 # Objects per batch request for bulk adds; None lets the client size batches dynamically
+WEAVIATE_BATCH_CONCURRENT_REQUESTS = 2 # Batch requests kept in flight at once
+WEAVIATE_BATCH_TIMEOUT_RETRIES = 3 # Times failed objects are resubmitted before being reported back
+# add_echo calls arriving within this window are coalesced into one insert_many() request; a batch is sent
+# early once it reaches WEAVIATE_ADD_MAX_BATCH. A window of 0 inserts each add immediately.
+WEAVIATE_ADD_BATCH_WINDOW_MS = 5.0
+WEAVIATE_ADD_MAX_BATCH = 128
+# In-process LRU cache for get/list/search results. Entries expire after WEAVIATE_CACHE_TTL_S; writes through this
+# store invalidate them (writes from other processes only become visible once the TTL runs out). Size 0 disables it.
+WEAVIATE_CACHE_SIZE = 10_000
+WEAVIATE_CACHE_TTL_S = 60.0
+WEAVIATE_CACHE_MIN_QUERY_MS = 0.0 # Only cache results of queries that took at least this long
+
+# One connected v4 client per endpoint, shared by every WeaviateStore pointing at it. The v4 client keeps
+# persistent HTTP/2 + gRPC connections, so connect() reuses it instead of opening new connections per store.
+# Values are [client, number of connected stores]; the client is closed when the last store disconnects.
+_SHARED_CLIENTS: Dict[Tuple, List[Any]] = {}
+_SHARED_CLIENTS_LOCK = asyncio.Lock()
+
+def _vector_bytes(vector: Sequence[float]) -> bytes:
+    """float32 bytes of a vector. Buffers already holding float32 (numpy arrays, array('f')) are copied as-is, without boxing each element."""
+    try:
+        view = memoryview(vector)
+    except TypeError:
+        # struct packs in one C call; ~3x faster than array("f", vector) for a 768-d list
+        return struct.pack(f"{len(vector)}f", *vector)
+    if view.format == "f" and view.ndim == 1:
+        return view.tobytes()
+    return struct.pack(f"{len(view)}f", *view.tolist())
 
 class WeaviateStore(VectorStoreInterface):
     """
-    Weaviate implementation of the VectorStoreInterface.
+    Weaviate implementation of the VectorStoreInterface (weaviate-client v4 API).
     """
-    client: Optional[weaviate.Client] = None
-
-    def __init__(self, url: str = WEAVIATE_URL, api_key: Optional[str] = WEAVIATE_API_KEY):
+    client: Optional[weaviate.WeaviateClient] = None
+
+    def __init__(
+        self,
+        url: str = WEAVIATE_URL,
+        api_key: Optional[str] = WEAVIATE_API_KEY,
+        connection_type: str = WEAVIATE_CONNECTION_TYPE,
+        grpc_port: int = WEAVIATE_GRPC_PORT,
+        vectorizer: str = WEAVIATE_VECTORIZER,
+        hybrid_alpha: float = WEAVIATE_HYBRID_ALPHA,
+        quantizer: Optional[str] = WEAVIATE_QUANTIZER,
+        rescore_limit: int = WEAVIATE_RESCORE_LIMIT,
+        hnsw_ef: Optional[int] = WEAVIATE_HNSW_EF,
+        batch_size: Optional[int] = WEAVIATE_BATCH_SIZE,
+        concurrent_requests: int = WEAVIATE_BATCH_CONCURRENT_REQUESTS,
+        timeout_retries: int = WEAVIATE_BATCH_TIMEOUT_RETRIES,
+        add_batch_window_ms: float = WEAVIATE_ADD_BATCH_WINDOW_MS,
+        add_max_batch: int = WEAVIATE_ADD_MAX_BATCH,
+        cache_size: int = WEAVIATE_CACHE_SIZE,
+        cache_ttl_s: float = WEAVIATE_CACHE_TTL_S,
+        cache_min_query_ms: float = WEAVIATE_CACHE_MIN_QUERY_MS,
+    ):
         self.url = url
         self.api_key = api_key
-        print(f"WeaviateStore initialized for URL: {self.url}")
+        self.connection_type = connection_type
+        self.grpc_port = grpc_port
+        self.vectorizer = vectorizer
+        self.hybrid_alpha = hybrid_alpha
+        self.quantizer = quantizer
+        self.rescore_limit = rescore_limit
+        self.hnsw_ef = hnsw_ef
+        self.batch_size = batch_size
+        self.concurrent_requests = concurrent_requests
+        self.timeout_retries = timeout_retries
+        self.add_batch_window_ms = add_batch_window_ms
+        self.add_max_batch = add_max_batch
+        self._pending_adds: List[Tuple[EchoCreate, asyncio.Future]] = []
+        self._add_flush_handle: Optional[asyncio.TimerHandle] = None
+        self._add_flush_tasks: Set[asyncio.Task] = set()
+        # key -> (expiry on the time.monotonic() clock, result)
+        self._cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._cache_max = cache_size
+        self._cache_ttl_s = cache_ttl_s
+        self._cache_min_query_ms = cache_min_query_ms
+        # Part of every list/search cache key; bumped on each write so all cached query results go stale at once
+        self._write_version = 0
+        self.collection = None
+        logger.debug("WeaviateStore initialized for URL: %s", self.url)
+
+    def _client_key(self) -> Tuple:
+        return (self.connection_type, self.url, self.grpc_port, self.api_key)
+
+    def _open_client(self) -> "weaviate.WeaviateClient":
+        """Creates and connects a v4 client for this store's endpoint."""
+        auth_config = weaviate.auth.AuthApiKey(api_key=self.api_key) if self.api_key else None
+        if self.connection_type == "cloud":
+            return weaviate.connect_to_wcs(cluster_url=self.url, auth_credentials=auth_config)
+        parsed = urlparse(self.url)
+        secure = parsed.scheme == "https"
+        host = parsed.hostname or "localhost"
+        port = parsed.port or (443 if secure else 8080)
+        if self.connection_type == "local":
+            return weaviate.connect_to_local(host=host, port=port, grpc_port=self.grpc_port, auth_credentials=auth_config)
+        return weaviate.connect_to_custom(
+            http_host=host,
+            http_port=port,
+            http_secure=secure,
+            grpc_host=host,
+            grpc_port=self.grpc_port,
+            grpc_secure=secure,
+            auth_credentials=auth_config,
+        )
 
     async def connect(self):
-        """Connect to the Weaviate instance."""
+        """Connect to the Weaviate instance, reusing the shared client for this endpoint if there is one."""
         if self.client and self.client.is_ready():
-            print("Already connected to Weaviate.")
+            logger.debug("Already connected to Weaviate.")
             return
 
         try:
-            auth_config = None
-            if self.api_key:
-                auth_config = weaviate.auth.AuthApiKey(api_key=self.api_key)
-
-            self.client = weaviate.Client(
-                url=self.url,
-                auth_client_secret=auth_config
-            )
+            async with _SHARED_CLIENTS_LOCK:
+                shared = _SHARED_CLIENTS.get(self._client_key())
+                if shared is None or not shared[0].is_ready():
+                    shared = [self._open_client(), 0]
+                    _SHARED_CLIENTS[self._client_key()] = shared
+                shared[1] += 1
+                self.client = shared[0]
             if self.client.is_ready():
-                print("Successfully connected to Weaviate.")
+                logger.info("Successfully connected to Weaviate at %s", self.url)
                 await self.ensure_schema()
+                self.collection = self.client.collections.get(ECHO_CLASS_NAME)
             else:
-                print("Failed to connect to Weaviate after client initialization.")
-                self.client = None # Reset client if not ready
+                logger.error("Failed to connect to Weaviate after client initialization.")
+                await self.disconnect() # Release the client if not ready
         except Exception as e:
-            print(f"Error connecting to Weaviate: {e}")
+            logger.error("Error connecting to Weaviate: %s", e)
             self.client = None
             raise
 
     async def disconnect(self):
-        """Disconnect from Weaviate (Weaviate client doesn't have an explicit disconnect)."""
-        print("Weaviate client does not require explicit disconnect. Connection will close when object is destroyed or program exits.")
-        self.client = None # Allow garbage collection
+        """Release this store's use of the shared client; the connection is closed when no store uses it."""
+        if self.client is None:
+            return
+        # Send any adds still waiting for their batch window before releasing the client
+        if self._pending_adds:
+            self._flush_pending_adds()
+        if self._add_flush_tasks:
+            await asyncio.gather(*self._add_flush_tasks, return_exceptions=True)
+        async with _SHARED_CLIENTS_LOCK:
+            key = self._client_key()
+            shared = _SHARED_CLIENTS.get(key)
+            if shared is not None and shared[0] is self.client:
+                shared[1] -= 1
+                if shared[1] <= 0:
+                    del _SHARED_CLIENTS[key]
+                    self.client.close()
+        self.client = None
+        self.collection = None
+
+    def _vector_index_config(self):
+        """HNSW index config for a new collection, with the configured quantizer and ef (None keeps Weaviate's defaults)."""
+        index_options: Dict[str, Any] = {}
+        if self.hnsw_ef is not None:
+            index_options["ef"] = self.hnsw_ef
+        if self.quantizer is None:
+            return Configure.VectorIndex.hnsw(**index_options) if index_options else None
+        if self.quantizer == "bq":
+            quantizer = Configure.VectorIndex.Quantizer.bq(rescore_limit=self.rescore_limit)
+        elif self.quantizer == "sq":
+            quantizer = Configure.VectorIndex.Quantizer.sq(
+                training_limit=WEAVIATE_QUANTIZER_TRAINING_LIMIT, rescore_limit=self.rescore_limit
+            )
+        elif self.quantizer == "pq":
+            quantizer = Configure.VectorIndex.Quantizer.pq(training_limit=WEAVIATE_QUANTIZER_TRAINING_LIMIT)
+        else:
+            raise ValueError(f"Unsupported Weaviate quantizer: {self.quantizer!r} (expected 'bq', 'sq', 'pq' or None)")
+        return Configure.VectorIndex.hnsw(quantizer=quantizer, **index_options)
 
     async def ensure_schema(self):
-        """Ensure the 'Echo' class schema exists in Weaviate."""
+        """Ensure the 'Echo' collection exists in Weaviate."""
         if not self.client or not self.client.is_ready():
-            print("Cannot ensure schema: Weaviate client not connected.")
+            logger.warning("Cannot ensure schema: Weaviate client not connected.")
             # Optionally, try to connect here or raise an error
             await self.connect() # Try to connect if not already
             if not self.client or not self.client.is_ready():
                  raise ConnectionError("Failed to connect to Weaviate to ensure schema.")
 
-
-        schema = self.client.schema.get()
-        class_exists = any(cls['class'] == ECHO_CLASS_NAME for cls in schema.get('classes', []))
-
-        if not class_exists:
-            print(f"'{ECHO_CLASS_NAME}' class not found in Weaviate. Creating schema...")
-            echo_class_obj = {
-                "class": ECHO_CLASS_NAME,
-                "description": "Stores Echos (memories, thoughts, goals) for TetherCore",
-                "vectorizer": "text2vec-transformers", # Example, choose your vectorizer
-                # Or "vectorizer": "none" if you provide your own vectors
-                "moduleConfig": {
-                    "text2vec-transformers": { # Ensure this module is enabled in your Weaviate setup
-                        "poolingStrategy": "masked_mean",
-                        "vectorizeClassName": False # Usually False for custom classes
-                    }
-                },
-                "properties": [
-                    {"name": "content", "dataType": ["text"], "description": "Textual content of the Echo"},
-                    {"name": "tags", "dataType": ["list[string]"], "description": "Tags associated with the Echo"}, # Weaviate uses string[]
-                    {"name": "created_at", "dataType": ["date"], "description": "Timestamp of Echo creation"},
-                    {"name": "updated_at", "dataType": ["date"], "description": "Timestamp of Echo last update"},
-                    {"name": "user_id", "dataType": ["string"], "description": "ID of the user who owns the Echo"},
-                    # Add other properties as defined in your Echo model
-                ]
-            }
+        if not self.client.collections.exists(ECHO_CLASS_NAME):
+            logger.info("'%s' class not found in Weaviate. Creating schema...", ECHO_CLASS_NAME)
             try:
-                self.client.schema.create_class(echo_class_obj)
-                print(f"Successfully created '{ECHO_CLASS_NAME}' class in Weaviate.")
+                self.client.collections.create(
+                    ECHO_CLASS_NAME,
+                    description="Stores Echos (memories, thoughts, goals) for TetherCore",
+                    # Ensure the text2vec-transformers module is enabled in your Weaviate setup.
+                    vectorizer_config=Configure.Vectorizer.none() if self.vectorizer == "none" else Configure.Vectorizer.text2vec_transformers(
+                        pooling_strategy="masked_mean",
+                        vectorize_collection_name=False, # Usually False for custom classes
+                    ),
+                    vector_index_config=self._vector_index_config(),
+                    properties=[
+                        Property(name="content", data_type=DataType.TEXT, description="Textual content of the Echo"),
+                        Property(name="tags", data_type=DataType.TEXT_ARRAY, description="Tags associated with the Echo"),
+                        Property(name="created_at", data_type=DataType.DATE, description="Timestamp of Echo creation"),
+                        Property(name="updated_at", data_type=DataType.DATE, description="Timestamp of Echo last update"),
+                        Property(name="user_id", data_type=DataType.TEXT, description="ID of the user who owns the Echo"),
+                        # Add other properties as defined in your Echo model
+                    ],
+                )
+                logger.info("Successfully created '%s' class in Weaviate.", ECHO_CLASS_NAME)
             except Exception as e:
-                print(f"Error creating '{ECHO_CLASS_NAME}' class: {e}")
+                logger.error("Error creating '%s' class: %s", ECHO_CLASS_NAME, e)
                 raise
         else:
-            print(f"'{ECHO_CLASS_NAME}' class already exists in Weaviate.")
-
+            logger.debug("'%s' class already exists in Weaviate.", ECHO_CLASS_NAME)
+
+    @staticmethod
+    def _build_filter(filters: Optional[EchoFilter]):
+        """
+        Translates an EchoFilter into a v4 Filter so it runs in Weaviate against its inverted index: None when
+        nothing can be pushed down, the bare filter when there is one, otherwise all of them combined.
+        content_contains is not pushed down (Weaviate's LIKE matches tokens, not substrings).
+        """
+        if filters is None:
+            return None
+        predicates = []
+        if filters.user_id:
+            predicates.append(Filter.by_property("user_id").equal(filters.user_id))
+        if filters.start_date:
+            predicates.append(Filter.by_property("created_at").greater_or_equal(filters.start_date))
+        if filters.end_date:
+            predicates.append(Filter.by_property("created_at").less_or_equal(filters.end_date))
+        if filters.tags_include_all:
+            predicates.append(Filter.by_property("tags").contains_all(list(filters.tags_include_all)))
+        if filters.tags_include_any:
+            predicates.append(Filter.by_property("tags").contains_any(list(filters.tags_include_any)))
+        if not predicates:
+            return None
+        return predicates[0] if len(predicates) == 1 else Filter.all_of(predicates)
+
+    @staticmethod
+    def _object_to_projection(obj, fields: Sequence[str]) -> Dict[str, Any]:
+        """Helper to convert a v4 query result object fetched with only some `fields` to a dict of its id and those fields."""
+        props = obj.properties
+        projection: Dict[str, Any] = {"id": str(obj.uuid)}
+        for field in fields:
+            if field in props:
+                projection[field] = tuple(props[field] or ()) if field == "tags" else props[field]
+        return projection
+
+    @classmethod
+    def _object_to_result(cls, obj, fields: Optional[Sequence[str]]) -> EchoResult:
+        return cls._object_to_echo(obj) if fields is None else cls._object_to_projection(obj, fields)
+
+    @staticmethod
+    def _object_to_echo(obj) -> Echo:
+        """Helper to convert a v4 query result object (fetched with all ECHO_PROPERTIES) back to Echo."""
+        props = obj.properties
+        # Everything here was validated when it was written (tags stored sorted and unique), and the v4 client
+        # already returns DATE properties as datetimes, so skip re-validating every row read back
+        return Echo.model_construct(
+            id=str(obj.uuid),
+            content=props.get('content') or "",
+            tags=tuple(props.get('tags') or ()),
+            created_at=props.get('created_at') or datetime.now(timezone.utc),
+            updated_at=props.get('updated_at') or datetime.now(timezone.utc),
+            user_id=props.get('user_id') or "unknown_user",
+            metadata={},
+            # metadata=... # Reconstruct metadata if needed
+        )
 
-    async def add_echo(self, echo_data: EchoCreate) -> Echo:
-        """Adds a new Echo to Weaviate."""
-        if not self.client:
-            raise ConnectionError("Weaviate client not connected. Call connect() first.")
+    @staticmethod
+    def _created_echo(echo_id: str, echo_data: EchoCreate) -> Echo:
+        """The Echo for a just-written EchoCreate, built from its validated fields instead of dumping and re-validating them."""
+        return Echo.model_construct(
+            id=echo_id,
+            content=echo_data.content,
+            tags=echo_data.tags or (),
+            user_id=echo_data.user_id,
+            created_at=echo_data.created_at,
+            updated_at=echo_data.updated_at,
+            metadata={}, # Matches what reads return: extra metadata isn't stored in Weaviate yet
+        )
 
-        properties = {
+    @staticmethod
+    def _echo_properties(echo_data: EchoCreate) -> Dict[str, Any]:
+        """Helper to convert EchoCreate to Weaviate object properties."""
+        return {
             "content": echo_data.content,
-            "tags": echo_data.tags or [],
-            "created_at": echo_data.created_at.isoformat(),
-            "updated_at": echo_data.updated_at.isoformat(),
+            "tags": list(echo_data.tags or []),
+            "created_at": echo_data.created_at,
+            "updated_at": echo_data.updated_at,
             "user_id": echo_data.user_id,
             # **echo_data.metadata if echo_data.metadata else {} # Spread metadata if it's flat
         }
-        # If you are providing your own vectors, add the 'vector' key here
-        # vector = self._generate_vector(echo_data.content) # Example
-        # result_uuid = self.client.data_object.create(properties, ECHO_CLASS_NAME, vector=vector)
 
+    def _cache_get(self, key: Hashable) -> Any:
+        """Returns the cached result for key, or None if it is missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key: Hashable, value: Any, started: float) -> None:
+        """Caches value under key if caching is enabled and the query (begun at `started`) was slow enough."""
+        now = time.monotonic()
+        if self._cache_max <= 0 or (now - started) * 1000 < self._cache_min_query_ms:
+            return
+        self._cache[key] = (now + self._cache_ttl_s, value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False) # Evict the least recently used entry
+
+    def _invalidate_queries(self) -> None:
+        self._write_version += 1
+
+    def _query_key(self, kind: str, query: Hashable, filters: Optional[EchoFilter], limit: int, offset: int = 0) -> Tuple:
+        filters_key = filters.model_dump_json() if filters else None
+        return (kind, query, filters_key, limit, offset, self._write_version)
+
+    async def add_echo(self, echo_data: EchoCreate) -> Echo:
+        """
+        Adds a new Echo to Weaviate. Concurrent calls within add_batch_window_ms are sent together in one
+        insert_many() request instead of one insert round-trip each.
+        """
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected. Call connect() first.")
+        if self.add_batch_window_ms <= 0:
+            # If you are providing your own vectors, pass vector=... to insert()
+            try:
+                result_uuid = self.collection.data.insert(properties=self._echo_properties(echo_data), uuid=uuid.uuid4())
+                self._invalidate_queries()
+                return self._created_echo(str(result_uuid), echo_data)
+            except Exception as e:
+                logger.error("Error adding Echo to Weaviate: %s", e)
+                raise
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending_adds.append((echo_data, future))
+        if len(self._pending_adds) >= self.add_max_batch:
+            self._flush_pending_adds()
+        elif self._add_flush_handle is None:
+            # The window is a hard deadline: the first add of a batch waits at most this long
+            self._add_flush_handle = loop.call_later(self.add_batch_window_ms / 1000, self._flush_pending_adds)
+        return await future
+
+    def _flush_pending_adds(self) -> None:
+        """Starts sending the pending adds as one batch."""
+        if self._add_flush_handle is not None:
+            self._add_flush_handle.cancel()
+            self._add_flush_handle = None
+        batch, self._pending_adds = self._pending_adds, []
+        task = asyncio.ensure_future(self._write_add_batch(batch))
+        self._add_flush_tasks.add(task) # Keep a reference until done so the task isn't garbage collected
+        task.add_done_callback(self._add_flush_tasks.discard)
+
+    async def _write_add_batch(self, batch: List[Tuple[EchoCreate, asyncio.Future]]) -> None:
+        objects = [DataObject(properties=self._echo_properties(echo_data), uuid=uuid.uuid4()) for echo_data, _ in batch]
         try:
-            result_uuid = self.client.data_object.create(
-                data_object=properties,
-                class_name=ECHO_CLASS_NAME
-                # If providing vectors manually: vector=echo_data.vector
-            )
-            return Echo(id=result_uuid, **echo_data.model_dump())
+            result = await asyncio.to_thread(self.collection.data.insert_many, objects)
         except Exception as e:
-            print(f"Error adding Echo to Weaviate: {e}")
-            raise
+            self._invalidate_queries() # Some objects may have been written before the failure
+            logger.error("Error adding Echo batch to Weaviate: %s", e)
+            for _, future in batch:
+                if not future.done(): # Skip callers that were cancelled while waiting
+                    future.set_exception(e)
+            return
+        self._invalidate_queries()
+        # insert_many reports failures per object (by index) rather than failing the whole request
+        for index, ((echo_data, future), data_object) in enumerate(zip(batch, objects, strict=True)):
+            if future.done():
+                continue
+            error = result.errors.get(index)
+            if error is not None:
+                future.set_exception(RuntimeError(f"Error adding Echo to Weaviate: {error.message}"))
+            else:
+                future.set_result(self._created_echo(str(data_object.uuid), echo_data))
+
+    def _run_batch(self, objects: List[Tuple[str, Dict[str, Any]]], batch_size: Optional[int]) -> List[Any]:
+        """Sends (uuid, properties) pairs through one batch context and returns its failed objects."""
+        if batch_size:
+            batch_context = self.collection.batch.fixed_size(batch_size=batch_size, concurrent_requests=self.concurrent_requests)
+        else:
+            batch_context = self.collection.batch.dynamic()
+        with batch_context as batch:
+            for object_uuid, properties in objects:
+                batch.add_object(properties=properties, uuid=object_uuid)
+        return list(self.collection.batch.failed_objects)
+
+    async def _batch_insert(self, objects: List[Tuple[str, Dict[str, Any]]], batch_size: Optional[int]) -> List[Any]:
+        """Batch-inserts objects, resubmitting failures up to `timeout_retries` times; returns what still failed."""
+        # The batch client is synchronous (it blocks until every object is sent), so run it off the event loop
+        try:
+            failed = await asyncio.to_thread(self._run_batch, objects, batch_size)
+        finally:
+            self._invalidate_queries() # Some objects may have been written even if the batch raised
+        for _ in range(self.timeout_retries):
+            if not failed:
+                break
+            logger.warning("Retrying %d failed Echo(s) in Weaviate batch. First error: %s", len(failed), failed[0].message)
+            retry = [(str(f.object_.uuid), f.object_.properties) for f in failed]
+            try:
+                failed = await asyncio.to_thread(self._run_batch, retry, batch_size)
+            finally:
+                self._invalidate_queries()
+        return failed
+
+    async def add_echos_batch(self, echos: List[EchoCreate], batch_size: Optional[int] = None) -> List[Any]:
+        """
+        Adds many Echos through Weaviate's batch API instead of one insert round-trip per Echo.
+        Returns the objects that still failed after retries (each with `.message` and `.object_`)
+        rather than raising on a partial failure.
+        """
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected. Call connect() first.")
+        objects = [(str(uuid.uuid4()), self._echo_properties(echo_data)) for echo_data in echos]
+        failed = await self._batch_insert(objects, batch_size or self.batch_size)
+        if failed:
+            logger.error("%d of %d Echo(s) could not be added to Weaviate.", len(failed), len(echos))
+        return failed
+
+    async def add_echos(self, echos: List[EchoCreate]) -> List[Echo]:
+        """Adds several Echos in one Weaviate batch; raises if any of them could not be written."""
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected. Call connect() first.")
+        objects = [(str(uuid.uuid4()), self._echo_properties(echo_data)) for echo_data in echos]
+        failed = await self._batch_insert(objects, self.batch_size)
+        if failed:
+            raise RuntimeError(f"Failed to add {len(failed)} of {len(echos)} Echos to Weaviate: {failed[0].message}")
+        return [self._created_echo(object_uuid, echo_data) for (object_uuid, _), echo_data in zip(objects, echos, strict=True)]
 
     async def get_echo(self, echo_id: str) -> Optional[Echo]:
         """Retrieves a specific Echo by its UUID from Weaviate."""
         if not self.client:
             raise ConnectionError("Weaviate client not connected.")
+        # Keyed by id only (no write version): adds can't change it, and update/delete drop the entry
+        cached = self._cache_get(("get", echo_id))
+        if cached is not None:
+            return cached
         try:
-            data_object = self.client.data_object.get_by_id(
-                uuid=echo_id,
-                class_name=ECHO_CLASS_NAME
-            )
+            started = time.monotonic()
+            data_object = self.collection.query.fetch_object_by_id(echo_id)
             if data_object:
-                props = data_object['properties']
-                return Echo(
-                    id=data_object['id'], # or echo_id
-                    content=props.get('content'),
-                    tags=props.get('tags', []),
-                    created_at=props.get('created_at'), # Needs parsing from ISO string
-                    updated_at=props.get('updated_at'), # Needs parsing
-                    user_id=props.get('user_id'),
-                    # metadata=... # Reconstruct metadata if needed
-                )
+                echo = self._object_to_echo(data_object)
+                self._cache_put(("get", echo_id), echo, started)
+                return echo
             return None
         except Exception as e:
-            print(f"Error getting Echo {echo_id} from Weaviate: {e}")
+            logger.error("Error getting Echo %s from Weaviate: %s", echo_id, e)
             return None # Or re-raise
 
-    async def list_echos(self, filters: Optional[EchoFilter] = None, limit: int = 100, offset: int = 0) -> List[Echo]:
-        """Lists Echos from Weaviate, optionally applying filters."""
+    async def list_echos(self, filters: Optional[EchoFilter] = None, limit: int = 100, offset: int = 0, fields: Optional[Sequence[str]] = None) -> List[EchoResult]:
+        """
+        Lists Echos from Weaviate, optionally applying filters. `fields` limits the properties fetched
+        (e.g. ("content",), or () for ids only) and makes each result a dict of "id" plus those properties
+        instead of an Echo; by default full Echos are returned. The dicts are shared with the query cache, so
+        copy one before modifying it.
+        """
         if not self.client:
             raise ConnectionError("Weaviate client not connected.")
 
-        query_builder = self.client.query.get(ECHO_CLASS_NAME, ["content", "tags", "created_at", "updated_at", "user_id", "_additional{id}"]) \
-                                   .with_limit(limit) \
-                                   .with_offset(offset)
-
-        # Basic filtering example (adapt to EchoFilter model)
-        # This part needs to be more robust based on EchoFilter structure
-        where_filter = None
-        if filters:
-            # Example: if filters.tags_include_all and filters.user_id:
-            # where_filter = {
-            #     "operator": "And",
-            #     "operands": [
-            #         {"path": ["user_id"], "operator": "Equal", "valueString": filters.user_id},
-            #         # Add tag filtering - Weaviate's 'ContainsAll' is for list of strings
-            #     ]
-            # }
-            # if where_filter:
-            #    query_builder = query_builder.with_where(where_filter)
-            print(f"Filtering not fully implemented for WeaviateStore. Filters received: {filters}")
-
-
+        fields = tuple(fields) if fields is not None else None
+        key = self._query_key("list", fields, filters, limit, offset)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached) # Copy so callers can't mutate the cached list
         try:
-            results = query_builder.do()
-            echos = []
-            for item in results['data']['Get'][ECHO_CLASS_NAME]:
-                props = item # Weaviate v4 returns properties directly
-                echos.append(Echo(
-                    id=item['_additional']['id'],
-                    content=props.get('content'),
-                    tags=props.get('tags', []),
-                    created_at=props.get('created_at'), # Needs parsing
-                    updated_at=props.get('updated_at'), # Needs parsing
-                    user_id=props.get('user_id'),
-                ))
-            return echos
+            started = time.monotonic()
+            results = self.collection.query.fetch_objects(
+                limit=limit,
+                offset=offset,
+                filters=self._build_filter(filters),
+                return_properties=list(fields if fields is not None else ECHO_PROPERTIES),
+            )
+            echos = [self._object_to_result(obj, fields) for obj in results.objects]
+            self._cache_put(key, echos, started)
+            return list(echos)
         except Exception as e:
-            print(f"Error listing Echos from Weaviate: {e}")
+            logger.error("Error listing Echos from Weaviate: %s", e)
             return []
 
+    async def iter_echos(self, filters: Optional[EchoFilter] = None, page_size: int = 500) -> AsyncIterator[Echo]:
+        """
+        Iterates over all matching Echos with Weaviate's `after` cursor, so each page costs O(page_size) instead
+        of the server skipping `offset` objects first. The next page is fetched (one page ahead) while the
+        caller consumes the current one. Weaviate doesn't combine the cursor with filters, so a filtered
+        iteration falls back to offset pages.
+        """
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected.")
+        if self._build_filter(filters) is not None:
+            async for echo in super().iter_echos(filters=filters, page_size=page_size):
+                yield echo
+            return
+
+        def fetch_page(cursor) -> "asyncio.Future":
+            # Pages bypass the result cache: a one-off scan would only evict entries worth keeping
+            return asyncio.ensure_future(asyncio.to_thread(
+                self.collection.query.fetch_objects, limit=page_size, after=cursor, return_properties=list(ECHO_PROPERTIES)
+            ))
+
+        next_page: Optional[asyncio.Future] = fetch_page(None)
+        try:
+            while next_page is not None:
+                objects = (await next_page).objects
+                # A full page may have a successor: request it now so it is in flight while this one is consumed
+                next_page = fetch_page(objects[-1].uuid) if len(objects) == page_size else None
+                for obj in objects:
+                    yield self._object_to_echo(obj)
+        finally:
+            if next_page is not None:
+                next_page.cancel() # Caller stopped early; don't leave the lookahead pending
+
+    async def count_echos(self, filters: Optional[EchoFilter] = None) -> int:
+        """Counts Echos in Weaviate with a total-count aggregate (no objects are fetched)."""
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected.")
+        return self.collection.aggregate.over_all(total_count=True, filters=self._build_filter(filters)).total_count
+
     async def update_echo(self, echo_id: str, echo_update_data: Dict[str, Any]) -> Optional[Echo]:
         """Updates an existing Echo in Weaviate."""
         if not self.client:
             raise ConnectionError("Weaviate client not connected.")
+        if "tags" in echo_update_data:
+            # Keep stored tags sorted and unique, as _object_to_echo relies on it
+            echo_update_data = {**echo_update_data, "tags": list(Echo.normalize_tags(echo_update_data["tags"]))}
+        self._cache.pop(("get", echo_id), None)
+        self._invalidate_queries()
         try:
-            # Weaviate's update replaces the object, merge updates properties.
-            # For partial updates, use .data_object.update() or .data_object.merge()
-            self.client.data_object.update(
+            # data.update merges the given properties into the object; data.replace would overwrite it.
+            self.collection.data.update(
                 uuid=echo_id,
-                class_name=ECHO_CLASS_NAME,
-                data_object=echo_update_data
+                properties=echo_update_data
                 # vector=new_vector if content changed and providing vectors manually
             )
             # Refetch the object to return the updated state
             return await self.get_echo(echo_id)
         except Exception as e:
-            print(f"Error updating Echo {echo_id} in Weaviate: {e}")
+            logger.error("Error updating Echo %s in Weaviate: %s", echo_id, e)
             return None
 
 
@@ -217,123 +584,113 @@ class WeaviateStore(VectorStoreInterface):
         """Deletes an Echo from Weaviate."""
         if not self.client:
             raise ConnectionError("Weaviate client not connected.")
+        self._cache.pop(("get", echo_id), None)
+        self._invalidate_queries()
         try:
-            self.client.data_object.delete(
-                uuid=echo_id,
-                class_name=ECHO_CLASS_NAME
-            )
-            return True
+            return self.collection.data.delete_by_id(echo_id)
         except Exception as e:
-            print(f"Error deleting Echo {echo_id} from Weaviate: {e}")
+            logger.error("Error deleting Echo %s from Weaviate: %s", echo_id, e)
             return False
 
-    async def search_echos_by_vector(self, vector: List[float], limit: int = 10, filters: Optional[EchoFilter] = None) -> List[Echo]:
-        """Searches Echos by vector similarity."""
+    def _vector_key(self, vector: Sequence[float], filters: Optional[EchoFilter], limit: int, autocut: Optional[int], fields: Optional[Tuple[str, ...]]) -> Tuple:
+        # float32 bytes: a compact, hashable stand-in for the vector (matches the precision Weaviate indexes at)
+        return self._query_key("vector", (_vector_bytes(vector), autocut, fields), filters, limit)
+
+    async def search_echos_by_vector(self, vector: Sequence[float], limit: int = 10, filters: Optional[EchoFilter] = None, autocut: Optional[int] = None, fields: Optional[Sequence[str]] = None) -> List[EchoResult]:
+        """
+        Searches Echos by vector similarity. With autocut=N, Weaviate cuts the results after the Nth jump in
+        distance, returning only the tight leading group(s) of matches instead of always `limit` of them.
+        The vector may be any float sequence, including a 1-D float32 numpy array, which is passed through unconverted.
+        `fields` limits the returned properties, as in list_echos.
+        """
         if not self.client:
             raise ConnectionError("Weaviate client not connected.")
-
-        near_vector = {"vector": vector}
-        query_builder = self.client.query.get(ECHO_CLASS_NAME, ["content", "tags", "_additional{id, distance}"]) \
-                                   .with_near_vector(near_vector) \
-                                   .with_limit(limit)
-        # Add filter support here if needed, similar to list_echos
-        if filters:
-            print(f"Filtering for vector search not fully implemented. Filters: {filters}")
-
-
-        try:
-            results = query_builder.do()
-            echos = []
-            for item in results['data']['Get'][ECHO_CLASS_NAME]:
-                # props = item # v4
-                echos.append(Echo(
-                    id=item['_additional']['id'],
-                    content=item.get('content'),
-                    tags=item.get('tags', []),
-                    # created_at, updated_at, user_id would also be here if requested in query
-                    # vector_distance=item['_additional']['distance'] # Optionally include distance
-                ))
-            return echos
-        except Exception as e:
-            print(f"Error searching Echos by vector in Weaviate: {e}")
-            return []
-
-
-    async def search_echos_by_text(self, query_text: str, limit: int = 10, filters: Optional[EchoFilter] = None) -> List[Echo]:
-        """Searches Echos by text similarity (hybrid or keyword)."""
+        return (await self.search_echos_by_vectors([vector], limit=limit, filters=filters, autocut=autocut, fields=fields))[0]
+
+    async def search_echos_by_vectors(self, vectors: Sequence[Sequence[float]], limit: int = 10, filters: Optional[EchoFilter] = None, autocut: Optional[int] = None, fields: Optional[Sequence[str]] = None) -> List[List[EchoResult]]:
+        """
+        Runs several vector searches concurrently. Weaviate has no multi-vector query, so each one is still its
+        own near_vector request, but they share the client's gRPC channel instead of waiting on each other.
+        vectors may be a 2-D numpy array: each row is passed on as a view, without copying it into a list.
+        """
         if not self.client:
             raise ConnectionError("Weaviate client not connected.")
+        fields = tuple(fields) if fields is not None else None
+        keys = [self._vector_key(vector, filters, limit, autocut, fields) for vector in vectors]
+        results: List[Optional[List[EchoResult]]] = [self._cache_get(key) for key in keys]
+        misses = [i for i, cached in enumerate(results) if cached is None]
+        if misses:
+            started = time.monotonic()
+            where = self._build_filter(filters)
+            fetched = await asyncio.gather(
+                *(asyncio.to_thread(self._near_vector, vectors[i], limit, where, autocut, fields) for i in misses),
+                return_exceptions=True,
+            )
+            for i, echos in zip(misses, fetched, strict=True):
+                if isinstance(echos, Exception):
+                    logger.error("Error searching Echos by vector in Weaviate: %s", echos)
+                    results[i] = []
+                else:
+                    self._cache_put(keys[i], echos, started)
+                    results[i] = echos
+        return [list(echos) for echos in results] # Copy so callers can't mutate cached lists
+
+    def _near_vector(self, vector: Sequence[float], limit: int, where, autocut: Optional[int], fields: Optional[Tuple[str, ...]]) -> List[EchoResult]:
+        # Stored vectors are not requested (include_vector stays False): with a quantizer, Weaviate reads
+        # full-precision vectors only for the rescore_limit candidates it rescores, and none cross the wire.
+        results = self.collection.query.near_vector(
+            near_vector=vector,
+            limit=limit,
+            auto_limit=autocut,
+            filters=where, # Applied before top-k, so filtered searches still return up to `limit` matches
+            return_properties=list(fields if fields is not None else ECHO_PROPERTIES),
+            # return_metadata=MetadataQuery(distance=True) # Optionally include distance
+        )
+        return [self._object_to_result(obj, fields) for obj in results.objects]
 
-        # Using Weaviate's bm25 search
-        # For hybrid, you might use .with_hybrid() if configured
-        query_builder = self.client.query.get(ECHO_CLASS_NAME, ["content", "tags", "_additional{id, score}"]) \
-                                   .with_bm25(query=query_text, properties=["content^2", "tags"]) \
-                                   .with_limit(limit)
 
-        # Add filter support here if needed
-        if filters:
-            print(f"Filtering for text search not fully implemented. Filters: {filters}")
+    async def search_echos_by_text(self, query_text: str, limit: int = 10, filters: Optional[EchoFilter] = None, alpha: Optional[float] = None, fields: Optional[Sequence[str]] = None) -> List[EchoResult]:
+        """
+        Searches Echos by text similarity: one hybrid query fusing vector and BM25 scores, weighted by alpha
+        (defaults to hybrid_alpha). Falls back to BM25 alone when the collection has no vectorizer.
+        `fields` limits the returned properties, as in list_echos.
+        """
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected.")
 
+        if alpha is None:
+            alpha = self.hybrid_alpha
+        fields = tuple(fields) if fields is not None else None
+        return_properties = list(fields if fields is not None else ECHO_PROPERTIES)
+        key = self._query_key("text", (query_text, alpha, fields), filters, limit)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return list(cached) # Copy so callers can't mutate the cached list
         try:
-            results = query_builder.do()
-            echos = []
-            for item in results['data']['Get'][ECHO_CLASS_NAME]:
-                # props = item # v4
-                echos.append(Echo(
-                    id=item['_additional']['id'],
-                    content=item.get('content'),
-                    tags=item.get('tags', []),
-                    # search_score=item['_additional']['score'] # Optionally include score
-                ))
-            return echos
+            started = time.monotonic()
+            if self.vectorizer == "none":
+                # Without a vectorizer Weaviate can't embed the query, so only keyword search is possible
+                results = self.collection.query.bm25(
+                    query=query_text,
+                    query_properties=["content^2", "tags"],
+                    limit=limit,
+                    filters=self._build_filter(filters),
+                    return_properties=return_properties,
+                    # return_metadata=MetadataQuery(score=True) # Optionally include score
+                )
+            else:
+                results = self.collection.query.hybrid(
+                    query=query_text,
+                    alpha=alpha,
+                    query_properties=["content^2", "tags"], # BM25 side; the vector side uses the whole object
+                    limit=limit,
+                    filters=self._build_filter(filters),
+                    return_properties=return_properties,
+                    # return_metadata=MetadataQuery(score=True) # Optionally include score
+                )
+            echos = [self._object_to_result(obj, fields) for obj in results.objects]
+            self._cache_put(key, echos, started)
+            return list(echos)
         except Exception as e:
-            print(f"Error searching Echos by text in Weaviate: {e}")
+            logger.error("Error searching Echos by text in Weaviate: %s", e)
             return []
-
-# Example of how to use (for testing, typically called from a service layer)
-async def _weaviate_example():
-    store = WeaviateStore()
-    try:
-        await store.connect()
-        # Ensure schema
-        # await store.ensure_schema() # connect calls this
-
-        # Add an Echo
-        from datetime import datetime, timezone
-        new_echo_data = EchoCreate(
-            content="This is a test Echo from WeaviateStore example!",
-            tags=["test", "weaviate"],
-            user_id="user123",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        created_echo = await store.add_echo(new_echo_data)
-        print(f"Created Echo: {created_echo}")
-
-        if created_echo:
-            # Get the Echo
-            retrieved_echo = await store.get_echo(created_echo.id)
-            print(f"Retrieved Echo: {retrieved_echo}")
-
-            # List Echos
-            all_echos = await store.list_echos(limit=5)
-            print(f"Listed Echos: {all_echos}")
-
-            # Search Echos (requires a vector or text if using text2vec module)
-            # If Weaviate generates vectors, you might not need to provide one explicitly for text search
-            # search_results_text = await store.search_echos_by_text("test Echo", limit=2)
-            # print(f"Search results (text): {search_results_text}")
-
-            # Delete Echo
-            # deleted = await store.delete_echo(created_echo.id)
-            # print(f"Echo deleted: {deleted}")
-
-    except Exception as e:
-        print(f"An error occurred in Weaviate example: {e}")
-    finally:
-        await store.disconnect()
-
-if __name__ == "__main__":
-    # import asyncio
-    # asyncio.run(_weaviate_example()) # Commented out
-    pass
@@ -3,7 +3,11 @@
 # from syft.client.client import HTTPClient # If connecting to a remote Syft node/domain
 # from syft.service.action.action_object import ActionObject # For handling data sent to Syft
 
-from typing import Any, Dict, Optional
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
 
 class SyftService:
     """
@@ -23,7 +27,7 @@ class SyftService:
         """
         self.config = config or {}
         self.is_connected = False
-        print("SyftService Initialized (Placeholder - PySyft integration is complex)")
+        logger.info("SyftService Initialized (Placeholder - PySyft integration is complex)")
 
         # Example: Initialize a local virtual worker for development/testing
         # if self.config.get("use_local_virtual_worker", True): # Default to true for easy start
@@ -60,12 +64,14 @@ class SyftService:
 
         Returns:
             Optional[Any]: A representation of the privately held data (e.g., a Syft Pointer, encrypted data).
+            Without a Syft connection the data is returned unchanged.
         """
         if not self.is_connected:
-            print("SyftService not connected. Cannot encrypt data.")
-            # return None # Or raise an error
+            # Nothing to send it to: pass the data through untouched (decrypt_data does the same)
+            return data
 
-        print(f"SyftService: Encrypting/securing data for user '{user_id}': '{str(data)[:50]}...' (Placeholder)")
+        # Lazy %-args: nothing is formatted unless debug logging is on
+        logger.debug("SyftService: Encrypting/securing data for user '%s' (Placeholder)", user_id)
         # Example with a local worker (conceptual)
         # if self.syft_worker:
         #     try:
@@ -92,13 +98,12 @@ class SyftService:
             user_id (str): The ID of the user requesting the data (for access control).
 
         Returns:
-            Optional[Any]: The decrypted data.
+            Optional[Any]: The decrypted data. Without a Syft connection the input is returned unchanged.
         """
         if not self.is_connected:
-            print("SyftService not connected. Cannot decrypt data.")
-            # return None
+            return private_data_representation
 
-        print(f"SyftService: Decrypting/retrieving data for user '{user_id}' from representation: '{str(private_data_representation)[:50]}...' (Placeholder)")
+        logger.debug("SyftService: Decrypting/retrieving data for user '%s' (Placeholder)", user_id)
         # Example with a local worker (conceptual)
         # if self.syft_worker and isinstance(private_data_representation, sy.Pointer):
         #     try:
@@ -127,10 +132,10 @@ class SyftService:
             Optional[Any]: The result of the private computation (often a pointer to the result).
         """
         if not self.is_connected:
-            print("SyftService not connected. Cannot perform private computation.")
+            logger.debug("SyftService not connected. Cannot perform private computation.")
             # return None
 
-        print(f"SyftService: Requesting private computation '{computation_function_name}' on data pointers: {data_pointers} (Placeholder)")
+        logger.debug("SyftService: Requesting private computation '%s' on %d data pointer(s) (Placeholder)", computation_function_name, len(data_pointers))
         # Example:
         # if self.node_client and data_pointers:
         #     try:
@@ -146,6 +151,39 @@ class SyftService:
         #         return None
         return {"computation_result_placeholder": "result_mock_id_456"}
 
+    async def perform_private_computation_batch(self, requests: List[Dict[str, Any]]) -> List[Optional[Any]]:
+        """
+        Runs many private computations, submitting all requests for the same function (with the same kwargs)
+        as one Syft call on their stacked data, so N homogeneous requests cost one round-trip and one
+        SMPC setup instead of N.
+
+        Args:
+            requests (List[Dict[str, Any]]): Each has "data_pointers", "computation_function_name" and
+                                             optionally "kwargs", as for perform_private_computation.
+
+        Returns:
+            List[Optional[Any]]: One result per request, in request order.
+        """
+        groups: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        for index, request in enumerate(requests):
+            kwargs = request.get("kwargs") or {}
+            groups[(request["computation_function_name"], repr(sorted(kwargs.items())))].append(index)
+
+        results: List[Optional[Any]] = [None] * len(requests)
+        for (computation_function_name, _), indices in groups.items():
+            kwargs = requests[indices[0]].get("kwargs") or {}
+            logger.debug("SyftService: Requesting batched private computation '%s' for %d request(s) (Placeholder)",
+                         computation_function_name, len(indices))
+            # Example:
+            # if self.node_client:
+            #     stacked = sy.ActionObject.from_obj(np.stack([requests[i]["data_pointers"] for i in indices]))
+            #     result_ptr = stacked.send(self.node_client).call(computation_function_name, **kwargs)
+            #     group_results = list(result_ptr.get()) # One row per request, in stacking order
+            group_results = [{"computation_result_placeholder": "result_mock_id_456"} for _ in indices]
+            for index, result in zip(indices, group_results, strict=True):
+                results[index] = result
+        return results
+
 if __name__ == "__main__":
     # Example Usage
     async def main():
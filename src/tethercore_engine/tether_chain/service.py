@@ -1,12 +1,68 @@
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from functools import cached_property, partial
+from typing import Iterator, List, Dict, Any, Optional, Sequence, Set, Tuple
+import asyncio
+import hashlib
 import json # For serializing complex data in the log
+import os
+import struct
+import weakref
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from pydantic_core import to_jsonable_python
 
 # This could be a simple file-based log, or integrate with a proper append-only database.
 # For a file-based log, ensure thread-safety if multiple agents/processes might write.
 TETHER_CHAIN_LOG_FILE = "tether_chain.log.jsonl" # JSON Lines format for easy append
+TAIL_READ_BLOCK_SIZE = 64 * 1024 # Bytes read per step when scanning the log backwards from its end
+# Group commit: entries added within this window are appended with a single write(); a batch is written early
+# once it holds WRITE_MAX_BATCH_BYTES. A window of 0 writes every entry as it is added.
+WRITE_BATCH_WINDOW_MS = 1.0
+WRITE_MAX_BATCH_BYTES = 1024 * 1024
+# Durability: when written entries are forced to disk (fdatasync) before add_entry(durable=True) returns.
+# The fdatasync runs in a worker thread, but a durable add_entry still waits for it: with SYNC_INTERVAL, a caller
+# adding entries one after another pays about SYNC_INTERVAL_MS plus the sync per entry (milliseconds, not
+# microseconds). Callers that don't need the entry on disk before continuing should pass durable=False.
+SYNC_ALWAYS = "always" # After every batch write
+SYNC_INTERVAL = "interval" # At most SYNC_INTERVAL_MS after the write; one fdatasync covers every batch written meanwhile
+SYNC_NEVER = "never" # Never; the OS writes the page cache back on its own schedule
+DURABILITY = SYNC_INTERVAL
+SYNC_INTERVAL_MS = 5.0
+ENTRY_CACHE_SIZE = 100_000 # Decoded log entries kept in memory, keyed by their byte offset in the log
+# Sparse offset index ("<log>.idx"): the byte offset of every INDEX_STRIDE-th entry, as little-endian uint64s.
+# Record k is entry k * INDEX_STRIDE, so locating an entry is an array lookup plus at most INDEX_STRIDE lines.
+INDEX_STRIDE = 1024
+_INDEX_RECORD = struct.Struct("<Q")
+
+_fdatasync = getattr(os, "fdatasync", os.fsync) # macOS and Windows have no fdatasync
+
+def _iter_lines_reverse(path: str, block_size: int = TAIL_READ_BLOCK_SIZE, end: Optional[int] = None) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yields (byte offset, line) for the lines of a file newest-first (without their newlines), reading it
+    backwards in fixed-size blocks so only the tail a caller actually consumes is read from disk.
+    end starts the scan at that byte offset (the start of a line) instead of the end of the file.
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END) if end is None else end
+        carry = b"" # Start of a line whose beginning lies in an earlier (not yet read) block
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + carry
+            lines = block.split(b"\n")
+            carry = lines[0]
+            end = position + len(block)
+            for line in reversed(lines[1:]):
+                end -= len(line)
+                yield end, line
+                end -= 1 # The newline before this line
+        yield 0, carry
 
 class TetherChainEntry(BaseModel): # Assuming Pydantic from memory_graph.models
+    # Entries are immutable once created (so content_hash can be cached, and decoded entries shared between readers)
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     event_type: str # e.g., ECHO_CREATED, ECHO_UPDATED, AGENT_ACTION, CONSENT_GIVEN, SHATTER_REQUEST
     actor_id: str # User ID, Agent ID, or System
@@ -15,15 +71,40 @@ class TetherChainEntry(BaseModel): # Assuming Pydantic from memory_graph.models
     previous_hash: Optional[str] = None # For chaining entries (conceptual, like blockchain)
     current_hash: Optional[str] = None  # Hash of the current entry
 
-    def calculate_hash(self) -> str:
-        # A simple hash calculation. In a real system, ensure consistent serialization.
-        # Exclude current_hash itself from the hash calculation.
-        import hashlib
-        entry_data = self.model_dump(exclude={'current_hash'}, mode='json') # Pydantic V2
-        # entry_data = self.dict(exclude={'current_hash'}, by_alias=True) # Pydantic V1
-        serialized_data = json.dumps(entry_data, sort_keys=True, default=str)
+    def calculate_hash(self, legacy: bool = False) -> str:
+        """
+        SHA-256 of the entry's canonical form (current_hash itself excluded): the compact JSON array
+        [timestamp.isoformat(), event_type, actor_id, target_id, previous_hash, details] with details' keys
+        sorted and non-JSON values encoded as in the log line (so an entry read back hashes the same). details
+        comes pre-serialized from details_json; no Pydantic dump.
+        legacy=True reproduces the older form (sorted JSON of model_dump(mode='json')) for chains written with it.
+        """
+        if legacy:
+            entry_data = self.model_dump(exclude={'current_hash'}, mode='json') # Pydantic V2
+            serialized_data = json.dumps(entry_data, sort_keys=True, default=str)
+        else:
+            # Same bytes as dumping the whole array with sort_keys (only details holds dicts), with details spliced in
+            head = json.dumps(
+                [self.timestamp.isoformat(), self.event_type, self.actor_id, self.target_id, self.previous_hash],
+                separators=(',', ':'),
+            )
+            serialized_data = f"{head[:-1]},{self.details_json}]"
         return hashlib.sha256(serialized_data.encode('utf-8')).hexdigest()
 
+    @cached_property
+    def details_json(self) -> str:
+        """details as canonical compact JSON (keys sorted), serialized once for both the hash and the log line."""
+        return json.dumps(self.details, sort_keys=True, separators=(',', ':'), default=to_jsonable_python)
+
+    def log_line(self) -> str:
+        """The entry as one JSON Lines record. details is spliced in from details_json instead of being serialized again."""
+        return f'{self.model_dump_json(exclude={"details"})[:-1]},"details":{self.details_json}}}\n'
+
+    @cached_property
+    def content_hash(self) -> str:
+        """calculate_hash(), computed once per entry. current_hash isn't part of the hash, so copies that only set it keep this value."""
+        return self.calculate_hash()
+
 
 class TetherChainService:
     """
@@ -33,31 +114,145 @@ class TetherChainService:
     """
     _last_hash: Optional[str] = None # Store the hash of the last written entry
 
-    def __init__(self, log_file_path: str = TETHER_CHAIN_LOG_FILE):
+    def __init__(
+        self,
+        log_file_path: str = TETHER_CHAIN_LOG_FILE,
+        write_batch_window_ms: float = WRITE_BATCH_WINDOW_MS,
+        write_max_batch_bytes: int = WRITE_MAX_BATCH_BYTES,
+        durability: str = DURABILITY,
+        sync_interval_ms: float = SYNC_INTERVAL_MS,
+    ):
+        if durability not in (SYNC_ALWAYS, SYNC_INTERVAL, SYNC_NEVER):
+            raise ValueError(f"Unknown TetherChain durability {durability!r}")
         self.log_file_path = log_file_path
+        self.write_batch_window_ms = write_batch_window_ms
+        self.write_max_batch_bytes = write_max_batch_bytes
+        self.durability = durability
+        self.sync_interval_ms = sync_interval_ms
+        self._pending_lines: List[str] = []
+        self._pending_futures: List[Tuple[asyncio.Future, bool]] = [] # (add_entry waiter, durable)
+        self._pending_bytes = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._sync_futures: List[asyncio.Future] = [] # Written entries waiting for the next fdatasync
+        self._sync_handle: Optional[asyncio.TimerHandle] = None
+        self._syncs_in_flight: Set[asyncio.Future] = set() # fdatasync calls running in the executor
+        # LRU of decoded entries: byte offset -> (line length, entry). The log is append-only, so an offset keeps
+        # its entry until the file is truncated or replaced (a shorter file clears the cache; the length guards the rest).
+        self._entry_cache: "OrderedDict[int, Tuple[int, TetherChainEntry]]" = OrderedDict()
+        self._entry_cache_file_size = 0
+        self._fd: Optional[int] = None # Append-only descriptor for the log, opened on the first write and kept open
+        self._fd_finalizer: Optional[weakref.finalize] = None
+        self.index_file_path = log_file_path + ".idx"
+        self._index_offsets: List[int] = [] # In-memory copy of the offset index
+        self._entry_count: Optional[int] = None # Entries in the log; None while the index can't be trusted
+        self._indexed_size = 0 # Log size the index and entry count describe
         self._initialize_chain()
+        self._load_index()
+        self._written_hash = self._last_hash # Hash of the newest entry actually in the file
         print(f"TetherChainService Initialized. Log file: {self.log_file_path}")
 
     def _initialize_chain(self):
         """Initializes the chain, potentially loading the last hash from the log file."""
+        # Only the last line is needed: read it from the end of the file (a 4 KiB block usually holds it whole)
+        lines = _iter_lines_reverse(self.log_file_path, block_size=4096)
         try:
-            with open(self.log_file_path, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    last_line = lines[-1].strip()
-                    if last_line:
-                        last_entry_data = json.loads(last_line)
-                        self._last_hash = last_entry_data.get('current_hash')
-                        print(f"Loaded last hash from TetherChain: {self._last_hash}")
+            last_line = next((line for _, line in lines if line.strip()), None)
+            if last_line:
+                last_entry_data = json.loads(last_line)
+                self._last_hash = last_entry_data.get('current_hash')
+                print(f"Loaded last hash from TetherChain: {self._last_hash}")
         except FileNotFoundError:
             print("TetherChain log file not found. Will be created on first entry.")
             self._last_hash = None # Genesis block would have no previous hash
         except (json.JSONDecodeError, KeyError) as e:
             print(f"Error reading last hash from TetherChain log: {e}. Starting fresh.")
             self._last_hash = None
+        finally:
+            lines.close()
 
 
-    async def add_entry(self, event_type: str, actor_id: str, target_id: Optional[str] = None, details: Optional[Dict[str, Any]] = None) -> TetherChainEntry:
+    def _load_index(self):
+        """
+        Loads the offset index, checking its last record against the log and counting the entries after it.
+        A missing, partial or stale index (e.g. a log written before the index existed) is rebuilt from the log.
+        """
+        try:
+            log_size = os.path.getsize(self.log_file_path)
+        except FileNotFoundError:
+            log_size = 0
+        try:
+            with open(self.index_file_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        offsets = [offset for (offset,) in _INDEX_RECORD.iter_unpack(data[:len(data) - len(data) % _INDEX_RECORD.size])]
+        try:
+            if len(data) % _INDEX_RECORD.size == 0 and (offsets or log_size == 0):
+                tail_count = self._count_entries(offsets[-1], log_size) if offsets else 0
+                if tail_count is not None:
+                    self._index_offsets = offsets
+                    self._entry_count = max(len(offsets) - 1, 0) * INDEX_STRIDE + tail_count
+                    self._indexed_size = log_size
+                    return
+            self._rebuild_index(log_size)
+        except OSError as e:
+            print(f"Error loading TetherChain index: {e}. Paginated reads will scan the log.")
+            self._entry_count = None
+
+    def _count_entries(self, start: int, log_size: int) -> Optional[int]:
+        """Counts the entries from byte offset start (which must begin a line) to log_size; None if start doesn't begin one."""
+        if start >= log_size:
+            return None
+        with open(self.log_file_path, 'rb') as f:
+            if start > 0:
+                f.seek(start - 1)
+                if f.read(1) != b"\n":
+                    return None
+            f.seek(start)
+            return sum(1 for line in f if line.strip())
+
+    def _rebuild_index(self, log_size: int):
+        """Rebuilds the offset index with one forward pass over the log and replaces the index file atomically."""
+        offsets: List[int] = []
+        count = position = 0
+        if log_size:
+            with open(self.log_file_path, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        if count % INDEX_STRIDE == 0:
+                            offsets.append(position)
+                        count += 1
+                    position += len(line)
+        temp_path = self.index_file_path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(b"".join(_INDEX_RECORD.pack(offset) for offset in offsets))
+        os.replace(temp_path, self.index_file_path)
+        self._index_offsets, self._entry_count, self._indexed_size = offsets, count, position
+
+    def _index_batch(self, encoded_lines: List[bytes], end: int):
+        """Adds the entries of a batch just written (ending at byte offset end) to the count and the offset index."""
+        if self._entry_count is None or end - sum(map(len, encoded_lines)) != self._indexed_size:
+            self._entry_count = None # Someone else changed the log; fall back to scanning it
+            return
+        new_offsets = []
+        position = self._indexed_size
+        for line in encoded_lines:
+            if self._entry_count % INDEX_STRIDE == 0:
+                new_offsets.append(position)
+            self._entry_count += 1
+            position += len(line)
+        self._indexed_size = position
+        if new_offsets:
+            try:
+                with open(self.index_file_path, 'ab') as f:
+                    f.write(b"".join(_INDEX_RECORD.pack(offset) for offset in new_offsets))
+            except OSError as e:
+                print(f"Error writing TetherChain index: {e}")
+                self._entry_count = None
+                return
+            self._index_offsets.extend(new_offsets)
+
+    async def add_entry(self, event_type: str, actor_id: str, target_id: Optional[str] = None, details: Optional[Dict[str, Any]] = None, durable: bool = True) -> TetherChainEntry:
         """
         Adds a new entry to the TetherChain.
 
@@ -67,72 +262,291 @@ class TetherChainService:
             target_id (Optional[str]): The ID of the entity being acted upon (e.g., Echo ID).
             details (Optional[Dict[str, Any]]): A dictionary of details about the event.
                                                 For updates, this might include a diff.
+            durable (bool): Wait until the entry is fdatasync'ed (per the service's durability policy),
+                            not just written to the OS. This adds milliseconds per call (see DURABILITY);
+                            pass False when the entry doesn't have to survive a crash before the caller continues.
 
         Returns:
             TetherChainEntry: The created log entry.
         """
-        entry_details = details or {}
+        entry = self._chain_entry(event_type, actor_id, target_id, details)
+        line = entry.log_line()
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future() # Resolved once the entry is written (and synced, if durable)
+        self._pending_lines.append(line)
+        self._pending_futures.append((future, durable))
+        self._pending_bytes += len(line)
+        if self.write_batch_window_ms <= 0 or self._pending_bytes >= self.write_max_batch_bytes:
+            self._flush_pending_writes()
+        elif self._flush_handle is None:
+            # The window is a hard deadline: the first entry of a batch waits at most this long
+            self._flush_handle = loop.call_later(self.write_batch_window_ms / 1000, self._flush_pending_writes)
+        await future
+
+        print(f"TetherChain: Added entry - Type: {event_type}, Actor: {actor_id}, Target: {target_id or 'N/A'}")
+        return entry
+
+    async def add_entries(self, events: Sequence[Dict[str, Any]], durable: bool = True) -> List[TetherChainEntry]:
+        """
+        Adds many entries at once (e.g. a bulk import of agent actions), chained in order and appended with a
+        single write instead of waiting for group-commit windows.
+
+        Args:
+            events: One dict of add_entry arguments per entry (event_type, actor_id, and optionally target_id, details).
+            durable (bool): As for add_entry, for the whole batch.
+
+        Returns:
+            List[TetherChainEntry]: The created log entries, in order.
+        """
+        entries = [
+            self._chain_entry(event["event_type"], event["actor_id"], event.get("target_id"), event.get("details"))
+            for event in events
+        ]
+        if not entries:
+            return entries
+        lines = [entry.log_line() for entry in entries]
+        future = asyncio.get_running_loop().create_future()
+        self._pending_lines.extend(lines)
+        self._pending_futures.append((future, durable))
+        self._pending_bytes += sum(map(len, lines))
+        self._flush_pending_writes() # Also writes any single entries still waiting, ahead of these
+        await future
+
+        print(f"TetherChain: Added {len(entries)} entries")
+        return entries
+
+    def _chain_entry(self, event_type: str, actor_id: str, target_id: Optional[str], details: Optional[Dict[str, Any]]) -> TetherChainEntry:
+        """Creates the next entry on the chain (hashed, linked to the current head) and makes it the new head."""
         entry = TetherChainEntry(
             event_type=event_type,
             actor_id=actor_id,
             target_id=target_id,
-            details=entry_details,
+            details=details or {},
             previous_hash=self._last_hash
         )
-        entry.current_hash = entry.calculate_hash()
+        entry = entry.model_copy(update={'current_hash': entry.content_hash})
+        # Advance the chain head now, so entries added while this one waits for its batch still chain onto it
+        self._last_hash = entry.current_hash
+        return entry
 
+    def _flush_pending_writes(self) -> None:
+        """Appends all pending entries to the log with one write() and resolves their add_entry calls."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        lines, futures = self._pending_lines, self._pending_futures
+        self._pending_lines, self._pending_futures, self._pending_bytes = [], [], 0
+        if not lines:
+            return
         try:
-            # Ensure thread/process safety if this can be called concurrently
-            with open(self.log_file_path, 'a') as f:
-                # f.write(entry.model_dump_json() + "\n") # Pydantic V2
-                f.write(entry.model_dump_json() + "\n") # Pydantic V1: entry.json()
-
-            self._last_hash = entry.current_hash # Update the last hash
-            print(f"TetherChain: Added entry - Type: {event_type}, Actor: {actor_id}, Target: {target_id or 'N/A'}")
-            return entry
+            # Written synchronously, so batches reach the file in the order their entries were chained
+            encoded_lines = [line.encode('utf-8') for line in lines]
+            data = memoryview(b"".join(encoded_lines))
+            fd = self._append_fd()
+            while data: # os.write may write less than asked (e.g. when interrupted by a signal)
+                data = data[os.write(fd, data):]
+            end = os.lseek(fd, 0, os.SEEK_CUR) # With O_APPEND, the end of what was just written
         except IOError as e:
             print(f"Error writing to TetherChain log: {e}")
-            # Potentially re-raise or handle more gracefully
-            raise
+            # Nothing after the last written entry made it to the file, so chain new entries onto that one
+            self._last_hash = self._written_hash
+            for future, _ in futures:
+                if not future.done(): # Skip callers that were cancelled while waiting
+                    future.set_exception(e)
+            return
+        self._written_hash = self._last_hash
+        self._index_batch(encoded_lines, end)
+        for future, durable in futures:
+            if durable and self.durability != SYNC_NEVER:
+                self._sync_futures.append(future)
+            elif not future.done():
+                future.set_result(None)
+        if self._sync_futures:
+            if self.durability == SYNC_ALWAYS:
+                self._sync_pending_writes()
+            elif self._sync_handle is None:
+                self._sync_handle = asyncio.get_running_loop().call_later(self.sync_interval_ms / 1000, self._sync_pending_writes)
+
+    def _sync_pending_writes(self) -> None:
+        """
+        Starts one fdatasync of the log in the default executor, so the event loop keeps running while the disk
+        flushes, and resolves every add_entry call waiting on it once it completes.
+        """
+        if self._sync_handle is not None:
+            self._sync_handle.cancel()
+            self._sync_handle = None
+        futures, self._sync_futures = self._sync_futures, []
+        if not futures:
+            return
+        sync = asyncio.get_running_loop().run_in_executor(None, _fdatasync, self._append_fd())
+        self._syncs_in_flight.add(sync)
+        sync.add_done_callback(partial(self._resolve_synced, futures))
+
+    def _resolve_synced(self, futures: List[asyncio.Future], sync: asyncio.Future) -> None:
+        self._syncs_in_flight.discard(sync)
+        error = None if sync.cancelled() else sync.exception()
+        if error is not None:
+            print(f"Error syncing TetherChain log: {error}")
+        for future in futures:
+            if future.done(): # Caller was cancelled while waiting
+                continue
+            if sync.cancelled():
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(None)
+
+    async def _wait_for_syncs(self):
+        """Waits for every fdatasync started so far (their errors are reported to the add_entry callers)."""
+        if self._syncs_in_flight:
+            await asyncio.gather(*self._syncs_in_flight, return_exceptions=True)
+
+    def _append_fd(self) -> int:
+        """
+        Returns the log's append descriptor, opening it on first use. With O_APPEND the kernel moves the offset
+        to end-of-file and writes as one atomic step, so each batch lands whole after whatever is already in the
+        file (including lines appended by another process) without an open()/close() pair per write.
+        """
+        if self._fd is None:
+            self._fd = os.open(self.log_file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_CLOEXEC, 0o644)
+            # Closes the descriptor if the service is garbage-collected without close() (e.g. in scripts)
+            self._fd_finalizer = weakref.finalize(self, os.close, self._fd)
+        return self._fd
+
+    async def flush(self):
+        """Writes any entries still waiting for their group-commit window, and syncs any awaiting fdatasync (e.g. before shutdown)."""
+        self._flush_pending_writes()
+        self._sync_pending_writes()
+        await self._wait_for_syncs()
+
+    async def close(self):
+        """Flushes pending entries and closes the log descriptor. A later add_entry reopens it."""
+        try:
+            self._flush_pending_writes()
+            self._sync_pending_writes()
+            await self._wait_for_syncs() # The descriptor must stay open until the worker threads are done with it
+        finally:
+            if self._fd_finalizer is not None:
+                self._fd_finalizer() # Runs os.close once; a no-op if it already ran
+            self._fd, self._fd_finalizer = None, None
+
+    def _check_entry_cache(self, file_size: int):
+        """Clears the entry cache if the log shrank since it was last read."""
+        if file_size < self._entry_cache_file_size:
+            self._entry_cache.clear() # Truncated or replaced: cached offsets no longer point at the same entries
+        self._entry_cache_file_size = file_size
+
+    def _cached_entry(self, line_offset: int, line: bytes) -> Optional[TetherChainEntry]:
+        """The cached entry decoded from this line (offset and length must match), or None."""
+        cached = self._entry_cache.get(line_offset)
+        if cached is None or cached[0] != len(line):
+            return None
+        self._entry_cache.move_to_end(line_offset)
+        return cached[1]
+
+    def _cache_entry(self, line_offset: int, line: bytes, entry: TetherChainEntry):
+        self._entry_cache[line_offset] = (len(line), entry)
+        if len(self._entry_cache) > ENTRY_CACHE_SIZE:
+            self._entry_cache.popitem(last=False) # Evict the least recently used entry
+
+    def _decode_line(self, line_offset: int, line: bytes) -> Optional[TetherChainEntry]:
+        """
+        Decodes the log line at line_offset (without its newline), from the entry cache when possible.
+        Returns None for blank and malformed lines; raises ValidationError for valid JSON that isn't an entry.
+        """
+        entry = self._cached_entry(line_offset, line)
+        if entry is not None:
+            return entry
+        stripped = line.strip()
+        if not stripped:
+            return None
+        # pydantic-core parses and validates the line in one pass, without a dict in between
+        try:
+            entry = TetherChainEntry.model_validate_json(stripped)
+        except ValidationError as e:
+            if e.errors()[0]['type'] != 'json_invalid':
+                raise
+            print(f"Skipping malformed line in TetherChain log: {stripped!r}")
+            return None
+        self._cache_entry(line_offset, line, entry)
+        return entry
 
     async def get_log_entries(self, limit: int = 100, offset: int = 0, event_type: Optional[str] = None, target_id: Optional[str] = None) -> List[TetherChainEntry]:
         """
-        Retrieves log entries from the TetherChain, with optional filtering and pagination.
-        Note: Reading the whole file for filtering can be inefficient for large logs.
-              Consider a more robust storage solution for production.
+        Retrieves log entries from the TetherChain, newest first, with optional filtering and pagination.
+        The log is read backwards from its end, so the cost grows with offset + limit (and how selective the
+        filters are), not with the size of the log. Entries decoded before are served from the entry cache
+        (entries are frozen, so sharing them between calls is safe).
         """
         entries: List[TetherChainEntry] = []
+        if limit <= 0:
+            return entries
         try:
-            with open(self.log_file_path, 'r') as f:
-                all_lines = f.readlines() # Read all lines
-            
-            # Iterate in reverse to get recent entries first for typical listing
-            # but apply offset and limit correctly
-            
-            relevant_lines = []
-            for line in reversed(all_lines): # Process from newest to oldest
-                line = line.strip()
-                if not line:
+            file_size = os.path.getsize(self.log_file_path)
+        except FileNotFoundError:
+            print("TetherChain log file not found.")
+            return []
+        self._check_entry_cache(file_size)
+        end = None
+        skip_lines = 0 # Lines to pass over undecoded before the first wanted entry
+        if offset and not event_type and not target_id and self._entry_count is not None and file_size == self._indexed_size:
+            # Seek with the offset index: start at the first checkpoint past the newest wanted entry
+            newest = self._entry_count - 1 - offset
+            if newest < 0:
+                return entries
+            checkpoint = newest // INDEX_STRIDE + 1
+            if checkpoint < len(self._index_offsets):
+                end = self._index_offsets[checkpoint]
+                skip_lines = checkpoint * INDEX_STRIDE - 1 - newest
+            else:
+                skip_lines = offset
+            offset = 0
+        # Newest to oldest, reading the file backwards only until offset + limit matching entries are found
+        lines = _iter_lines_reverse(self.log_file_path, end=end)
+        try:
+            skipped = 0
+            for line_offset, line in lines:
+                if skip_lines:
+                    if line.strip():
+                        skip_lines -= 1
                     continue
-                try:
-                    entry_data = json.loads(line)
-                    # Apply filters
-                    if event_type and entry_data.get('event_type') != event_type:
+                if event_type or target_id:
+                    entry = self._cached_entry(line_offset, line)
+                    if entry is None:
+                        stripped = line.strip()
+                        if not stripped:
+                            continue
+                        try:
+                            entry_data = json.loads(stripped)
+                        except json.JSONDecodeError:
+                            print(f"Skipping malformed line in TetherChain log: {stripped!r}")
+                            continue
+                        # Apply filters on the plain dict, so non-matching lines skip model validation
+                        if event_type and entry_data.get('event_type') != event_type:
+                            continue
+                        if target_id and entry_data.get('target_id') != target_id:
+                            continue
+                        entry = TetherChainEntry.model_validate(entry_data)
+                        self._cache_entry(line_offset, line, entry)
+                    if event_type and entry.event_type != event_type:
                         continue
-                    if target_id and entry_data.get('target_id') != target_id:
+                    if target_id and entry.target_id != target_id:
                         continue
-                    relevant_lines.append(entry_data)
-                except json.JSONDecodeError:
-                    print(f"Skipping malformed line in TetherChain log: {line}")
-            
-            # Apply pagination after filtering and reversing
-            paginated_lines = relevant_lines[offset : offset + limit]
-
-            for entry_data in paginated_lines: # Convert selected lines to Pydantic models
-                 entries.append(TetherChainEntry(**entry_data))
+                else:
+                    entry = self._decode_line(line_offset, line)
+                    if entry is None:
+                        continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                entries.append(entry)
+                if len(entries) >= limit:
+                    break
 
-            # If you want entries in chronological order, reverse again
-            # entries.reverse() 
+            # If you want entries in chronological order, reverse them
+            # entries.reverse()
 
         except FileNotFoundError:
             print("TetherChain log file not found.")
@@ -140,50 +554,58 @@ class TetherChainService:
         except Exception as e:
             print(f"Error reading TetherChain log: {e}")
             return []
+        finally:
+            lines.close() # Closes the file when the scan stopped early
         return entries
 
+    def _iter_entries_forward(self, log_file) -> Iterator[TetherChainEntry]:
+        """Yields the entries of an open (binary) log file oldest-first, skipping blank and malformed lines."""
+        line_offset = 0
+        for line in log_file:
+            next_offset = line_offset + len(line)
+            entry = self._decode_line(line_offset, line[:-1] if line.endswith(b"\n") else line)
+            if entry is not None:
+                yield entry
+            line_offset = next_offset
+
     async def verify_chain_integrity(self) -> bool:
         """
-        Verifies the integrity of the chain by checking hashes.
+        Verifies the integrity of the chain: every entry links to the one before it and its content still hashes
+        to its current_hash. The log is streamed forward from genesis, so memory use doesn't grow with the chain,
+        and entries already in the entry cache are neither decoded nor rehashed (content_hash is cached).
         (More complex for a real system, this is a basic check)
         """
-        print("Verifying TetherChain integrity (Placeholder - basic check)...")
-        entries = await self.get_log_entries(limit=1000000) # Get all entries for full check
-        if not entries:
+        print("Verifying TetherChain integrity (basic check)...")
+        try:
+            self._check_entry_cache(os.path.getsize(self.log_file_path))
+            log_file = open(self.log_file_path, 'rb')
+        except FileNotFoundError:
             return True # Empty chain is valid
 
         expected_previous_hash = None # For the first entry (genesis)
-        for entry in entries: # Assuming entries are in chronological order from get_log_entries
-            if entry.previous_hash != expected_previous_hash:
-                print(f"Chain integrity broken at entry (timestamp {entry.timestamp}): Expected prev_hash {expected_previous_hash}, got {entry.previous_hash}")
-                return False
-            
-            # Recalculate hash to ensure entry content wasn't tampered with
-            # Need to create a temporary entry object without current_hash to recalculate
-            temp_entry_data = entry.model_dump()
-            temp_entry_data.pop('current_hash', None)
-            # Re-create with a method that doesn't auto-calc hash based on self.current_hash
-            # This is a bit tricky with Pydantic's default_factory.
-            # For simplicity, we'll trust the stored current_hash for now in this basic check,
-            # but a real verification would re-calculate from all other fields.
-            # calculated_hash_check = entry.calculate_hash() # This would use its own current_hash if not careful
-            # A better way:
-            # temp_entry = TetherChainEntry(**{k:v for k,v in entry.dict().items() if k != 'current_hash'})
-            # temp_entry.previous_hash = entry.previous_hash # Ensure prev_hash is set correctly for recalc
-            # if temp_entry.calculate_hash() != entry.current_hash:
-            # print(f"Chain integrity broken at entry (timestamp {entry.timestamp}): Content hash mismatch.")
-            # return False
-
-            expected_previous_hash = entry.current_hash
+        try:
+            with log_file:
+                for entry in self._iter_entries_forward(log_file):
+                    if entry.previous_hash != expected_previous_hash:
+                        print(f"Chain integrity broken at entry (timestamp {entry.timestamp}): Expected prev_hash {expected_previous_hash}, got {entry.previous_hash}")
+                        return False
+
+                    # Recalculate the hash to ensure the entry content wasn't tampered with
+                    # (entries hashed before the canonical form was introduced need calculate_hash(legacy=True))
+                    if entry.current_hash != entry.content_hash and entry.current_hash != entry.calculate_hash(legacy=True):
+                        print(f"Chain integrity broken at entry (timestamp {entry.timestamp}): Content hash mismatch.")
+                        return False
+
+                    expected_previous_hash = entry.current_hash
+        except ValidationError as e:
+            print(f"Chain integrity broken: a log line is not a valid entry ({e.error_count()} validation errors).")
+            return False
         
         print("TetherChain integrity check passed (basic).")
         return True
 
 # Example Usage
 if __name__ == "__main__":
-    # This requires Pydantic BaseModel to be defined or imported
-    from pydantic import BaseModel, Field # Add this if running standalone
-
     async def main():
         # Clean up log file for fresh test run
         try:
@@ -220,7 +642,7 @@ if __name__ == "__main__":
         for item in log:
             print(item.model_dump_json(indent=2))
 
-        # integrity = await chain_service.verify_chain_integrity() # Requires chronological order from get_log_entries
+        # integrity = await chain_service.verify_chain_integrity()
         # print(f"\nChain Integrity Verified: {integrity}")
 
 
@@ -2,10 +2,64 @@
 # Actual integration requires these tools to be installed and accessible,
 # potentially as subprocesses or through their Python bindings if available and suitable.
 
+import asyncio
+import hashlib
+import io
+import socket
 import subprocess # For calling external CLI tools like whisper.cpp or piper
 import tempfile # For handling temporary audio files
+import threading
+import wave
 import os
-from typing import Optional, Any
+import shutil
+from typing import AsyncIterator, Optional, Any
+
+try:
+    from piper import PiperVoice # Optional: in-process Piper TTS (pip install piper-tts), no process spawn per call
+except ImportError:
+    PiperVoice = None
+
+try:
+    import httpx # Talks to the resident whisper.cpp server (installed with litellm)
+except ImportError:
+    httpx = None
+
+WHISPER_SERVER_HOST = "127.0.0.1"
+# Quantized variants looked for next to the configured models (most preferred first): int8/int5 weights are about
+# half the bytes of FP16, and CPU inference is bound by memory bandwidth. Make them with whisper.cpp's quantize tool,
+# e.g. `quantize models/ggml-base.en.bin models/ggml-base.en-q5_1.bin q5_1`, or onnxruntime's quantize_dynamic for Piper.
+WHISPER_QUANTIZED_SUFFIXES = ("-q5_k_m", "-q5_1", "-q5_0", "-q8_0", "-q4_0")
+PIPER_QUANTIZED_SUFFIXES = (".int8",)
+VOICE_DEVICES = ("auto", "cpu", "cuda", "metal") # Where STT/TTS inference runs; "auto" uses a GPU when one is usable
+TTS_CACHE_DIR = "~/.cache/tethercore/tts" # Synthesized audio, keyed by voice + text, reused for repeated phrases
+TTS_CACHE_MAX_BYTES = 256 * 1024 * 1024 # Least recently used files are removed beyond this
+STT_STREAM_WINDOW_S = 30 # Whisper's context length: streamed audio is transcribed in windows of this many seconds
+WHISPER_SERVER_START_TIMEOUT_S = 60.0 # Model load time allowed before falling back to the CLI
+
+def _prefer_quantized(model_path: Optional[str], suffixes) -> Optional[str]:
+    """The first quantized sibling of model_path that exists (ggml-base.en.bin -> ggml-base.en-q5_1.bin), else model_path."""
+    if not model_path:
+        return model_path
+    root, ext = os.path.splitext(model_path)
+    for suffix in suffixes:
+        candidate = root + suffix + ext
+        if os.path.exists(candidate):
+            return candidate
+    return model_path
+
+def _onnx_cuda_available() -> bool:
+    """Whether the installed ONNX Runtime (used by in-process Piper) can run on CUDA."""
+    try:
+        import onnxruntime
+    except ImportError:
+        return False
+    return "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+
+def _free_port() -> int:
+    """A local TCP port that is free right now, for the whisper.cpp server to listen on."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((WHISPER_SERVER_HOST, 0))
+        return sock.getsockname()[1]
 
 class VoiceInterfaceService:
     """
@@ -23,10 +77,32 @@ class VoiceInterfaceService:
         self.config = config or {}
         self.whisper_cpp_path = self.config.get("whisper_cpp_executable", "whisper-cpp") # Assumes in PATH or provide full path
         self.whisper_model_path = self.config.get("whisper_model_path", "models/ggml-base.en.bin") # Example model path
+        # whisper.cpp's HTTP server, started once so the model stays loaded across requests. None runs the CLI per request.
+        self.whisper_server_path = self.config.get("whisper_server_executable", "whisper-server")
+        self._whisper_server: Optional[asyncio.subprocess.Process] = None
+        self._whisper_server_url: Optional[str] = None
+        self._whisper_server_failed = False # Set once starting the server failed, so later calls go straight to the CLI
+        self._whisper_server_lock = asyncio.Lock()
+        self._whisper_client = None
 
         self.piper_tts_path = self.config.get("piper_tts_executable", "piper") # Assumes in PATH
         self.piper_model_path = self.config.get("piper_tts_model_path") # e.g., "en_US-lessac-medium.onnx"
         self.piper_config_path = self.config.get("piper_tts_config_path") # e.g., "en_US-lessac-medium.onnx.json"
+        if self.config.get("prefer_quantized_models", True):
+            # The voice config (.onnx.json) describes the quantized model too, so only the model paths change
+            self.whisper_model_path = _prefer_quantized(self.whisper_model_path, WHISPER_QUANTIZED_SUFFIXES)
+            self.piper_model_path = _prefer_quantized(self.piper_model_path, PIPER_QUANTIZED_SUFFIXES)
+        self.device = self.config.get("device", "auto")
+        if self.device not in VOICE_DEVICES:
+            raise ValueError(f"Unknown voice interface device {self.device!r}; expected one of {VOICE_DEVICES}")
+        # whisper.cpp uses at most 4 threads unless told otherwise
+        self.whisper_threads = self.config.get("whisper_threads") or os.cpu_count() or 4
+        # In-process Piper voice (its ONNX Runtime session), loaded by the first TTS call and reused after that
+        self._piper_voice = None
+        self._piper_voice_lock = threading.Lock()
+        tts_cache_dir = self.config.get("tts_cache_dir", TTS_CACHE_DIR) # None disables the cache
+        self.tts_cache_dir = os.path.expanduser(tts_cache_dir) if tts_cache_dir else None
+        self.tts_cache_max_bytes = self.config.get("tts_cache_max_bytes", TTS_CACHE_MAX_BYTES)
 
         print("VoiceInterfaceService Initialized (Placeholder for STT/TTS tool integration).")
         if not self.piper_model_path or not self.piper_config_path:
@@ -50,11 +126,18 @@ class VoiceInterfaceService:
             print(f"Error: Whisper model not found at {self.whisper_model_path}")
             return None
 
+        server_url = await self._get_whisper_server_url()
+        if server_url is not None:
+            with open(audio_file_path, 'rb') as audio_file:
+                return await self._transcribe_with_server(server_url, audio_file)
+
         # Command for whisper.cpp (example, adjust based on actual whisper.cpp CLI options)
         # Common options: -m <model_path> -f <file_path> -otxt (output as plain text)
         command = [
             self.whisper_cpp_path,
             "-m", self.whisper_model_path,
+            "-t", str(self.whisper_threads),
+            *self._whisper_device_args(),
             "-f", audio_file_path,
             "-otxt", # Output as plain text to stdout
             "-nt" # No timestamps
@@ -77,6 +160,124 @@ class VoiceInterfaceService:
             print(f"An unexpected error occurred during STT: {e_gen}")
             return None
 
+    async def speech_to_text_stream(self, pcm_chunks: AsyncIterator[bytes], sample_rate: int = 16000) -> AsyncIterator[Optional[str]]:
+        """
+        Transcribes a stream of 16-bit mono PCM (e.g. from a microphone) without writing it to disk first.
+        Audio is cut into STT_STREAM_WINDOW_S windows; each window's text (None if it failed) is yielded in order,
+        and a window is transcribed while the next one is still arriving. whisper.cpp expects 16 kHz audio.
+        """
+        window_bytes = STT_STREAM_WINDOW_S * sample_rate * 2
+        buffer = bytearray()
+        pending: Optional[asyncio.Task] = None # Transcription of the previous window
+        try:
+            async for chunk in pcm_chunks:
+                buffer += chunk
+                while len(buffer) >= window_bytes:
+                    window = bytes(buffer[:window_bytes])
+                    del buffer[:window_bytes]
+                    if pending is not None:
+                        yield await pending
+                    pending = asyncio.create_task(self._transcribe_pcm(window, sample_rate))
+            if pending is not None:
+                yield await pending
+                pending = None
+            if buffer:
+                yield await self._transcribe_pcm(bytes(buffer), sample_rate)
+        finally:
+            if pending is not None:
+                pending.cancel() # The caller stopped iterating early
+
+    async def _transcribe_pcm(self, pcm: bytes, sample_rate: int) -> Optional[str]:
+        """Transcribes one window of 16-bit mono PCM, wrapped as an in-memory WAV."""
+        wav_buffer = io.BytesIO()
+        with wave.open(wav_buffer, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm)
+        server_url = await self._get_whisper_server_url()
+        if server_url is not None:
+            return await self._transcribe_with_server(server_url, ("audio.wav", wav_buffer.getvalue(), "audio/wav"))
+        # The whisper.cpp CLI only reads audio files
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+            temp_file.write(wav_buffer.getvalue())
+        try:
+            return await self.speech_to_text(temp_file.name)
+        finally:
+            os.remove(temp_file.name)
+
+    async def _transcribe_with_server(self, server_url: str, audio: Any) -> Optional[str]:
+        """Posts audio (an open file or a (name, bytes, content type) tuple) to the whisper.cpp server's /inference."""
+        try:
+            response = await self._whisper_client.post(
+                f"{server_url}/inference", files={"file": audio}, data={"response_format": "text"}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            print(f"Error from whisper.cpp server: {e}")
+            return None
+        transcribed_text = response.text.strip()
+        print(f"VoiceInterface: Transcription successful. Text: '{transcribed_text[:100]}...'")
+        return transcribed_text
+
+    def _whisper_device_args(self) -> list:
+        # whisper.cpp runs on the GPU its build supports (CUDA, Metal, ...) by default; -ng keeps it on the CPU
+        return ["-ng"] if self.device == "cpu" else []
+
+    async def _get_whisper_server_url(self) -> Optional[str]:
+        """
+        Base URL of the resident whisper.cpp server, starting it (one model load) on first use.
+        None when server mode is off or the server can't be started; speech_to_text then runs the CLI.
+        """
+        if httpx is None or not self.whisper_server_path or self._whisper_server_failed:
+            return None
+        async with self._whisper_server_lock:
+            if self._whisper_server is not None and self._whisper_server.returncode is None:
+                return self._whisper_server_url
+            port = _free_port()
+            try:
+                self._whisper_server = await asyncio.create_subprocess_exec(
+                    self.whisper_server_path, "-m", self.whisper_model_path, "-t", str(self.whisper_threads),
+                    *self._whisper_device_args(),
+                    "--host", WHISPER_SERVER_HOST, "--port", str(port),
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError:
+                print(f"VoiceInterface: whisper.cpp server '{self.whisper_server_path}' not found. Running the CLI per request.")
+                self._whisper_server_failed = True
+                return None
+            if self._whisper_client is None:
+                self._whisper_client = httpx.AsyncClient(timeout=None) # Long audio can take a while to transcribe
+            url = f"http://{WHISPER_SERVER_HOST}:{port}"
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + WHISPER_SERVER_START_TIMEOUT_S
+            while loop.time() < deadline and self._whisper_server.returncode is None:
+                try:
+                    await self._whisper_client.get(url) # Answers once the model is loaded
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+                    continue
+                print(f"VoiceInterface: whisper.cpp server ready at {url}")
+                self._whisper_server_url = url
+                return url
+            print("VoiceInterface: whisper.cpp server did not start. Running the CLI per request.")
+            self._whisper_server_failed = True
+            await self._stop_whisper_server()
+            return None
+
+    async def _stop_whisper_server(self):
+        server, self._whisper_server, self._whisper_server_url = self._whisper_server, None, None
+        if server is not None and server.returncode is None:
+            server.terminate()
+            await server.wait()
+
+    async def close(self):
+        """Stops the whisper.cpp server, if one was started."""
+        await self._stop_whisper_server()
+        if self._whisper_client is not None:
+            await self._whisper_client.aclose()
+            self._whisper_client = None
+
     async def text_to_speech(self, text_to_speak: str, output_audio_file_path: Optional[str] = None) -> Optional[str]:
         """
         Converts text to speech using Piper TTS and saves it to an audio file.
@@ -111,24 +312,109 @@ class VoiceInterfaceService:
             os.makedirs(os.path.dirname(output_audio_file_path), exist_ok=True)
 
 
+        cache_path = self._tts_cache_path(text_to_speak)
+        if cache_path is not None and self._copy_from_tts_cache(cache_path, output_audio_file_path):
+            print(f"VoiceInterface: TTS served from cache. Audio saved to: {output_audio_file_path}")
+            return output_audio_file_path
+
+        if PiperVoice is not None:
+            result = await self._text_to_speech_in_process(text_to_speak, output_audio_file_path)
+        else:
+            result = await self._text_to_speech_cli(text_to_speak, output_audio_file_path)
+        if result is not None and cache_path is not None:
+            self._add_to_tts_cache(result, cache_path)
+        return result
+
+    def _tts_cache_path(self, text_to_speak: str) -> Optional[str]:
+        """Cache file for this text in the current voice (the model's size and mtime are part of the key), or None if caching is off."""
+        if not self.tts_cache_dir:
+            return None
+        try:
+            model_stat = os.stat(self.piper_model_path)
+        except OSError:
+            return None
+        key_source = f"{self.piper_model_path}\0{self.piper_config_path}\0{model_stat.st_size}\0{model_stat.st_mtime_ns}\0{text_to_speak}"
+        return os.path.join(self.tts_cache_dir, hashlib.sha256(key_source.encode('utf-8')).hexdigest() + ".wav")
+
+    def _copy_from_tts_cache(self, cache_path: str, output_audio_file_path: str) -> bool:
+        """
+        Copies a cached file to the output path; False on a cache miss. Copies rather than hard links, so a later
+        synthesis that overwrites the output file in place can't change the cached audio.
+        """
+        try:
+            shutil.copyfile(cache_path, output_audio_file_path)
+            os.utime(cache_path) # Mark as recently used for eviction
+            return True
+        except OSError:
+            return False
+
+    def _add_to_tts_cache(self, audio_file_path: str, cache_path: str):
+        """Stores a synthesized file in the cache (atomically, via a temp name), then evicts least recently used files over the size limit."""
+        temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.tts_cache_dir, exist_ok=True)
+            shutil.copyfile(audio_file_path, temp_path)
+            os.replace(temp_path, cache_path)
+            self._evict_tts_cache()
+        except OSError as e:
+            print(f"VoiceInterface: Could not cache TTS output: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _evict_tts_cache(self):
+        """Removes the least recently used cached files until the cache fits in tts_cache_max_bytes."""
+        cached_files = []
+        for entry in os.scandir(self.tts_cache_dir):
+            if entry.name.endswith(".wav"):
+                file_stat = entry.stat()
+                cached_files.append((file_stat.st_mtime, file_stat.st_size, entry.path))
+        total_bytes = sum(size for _, size, _ in cached_files)
+        for _, size, path in sorted(cached_files): # Oldest use first
+            if total_bytes <= self.tts_cache_max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError: # Removed by another process meanwhile
+                pass
+            total_bytes -= size
+
+    async def _text_to_speech_cli(self, text_to_speak: str, output_audio_file_path: str) -> Optional[str]:
+        """TTS through the Piper CLI (one process per call)."""
         # Command for Piper TTS (example, adjust based on actual Piper CLI options)
-        # echo "Hello world." | piper --model <model.onnx> --config <model.onnx.json> --output_file output.wav
-        command = f'echo "{text_to_speak.replace("\"", "\\\"")}" | {self.piper_tts_path} --model "{self.piper_model_path}" --config "{self.piper_config_path}" --output_file "{output_audio_file_path}"'
+        # piper --model <model.onnx> --config <model.onnx.json> --output_file output.wav, with the text on stdin.
+        # Run directly (no shell), so the text needs no quoting and can't inject shell syntax.
+        command = [
+            self.piper_tts_path,
+            "--model", self.piper_model_path,
+            "--config", self.piper_config_path,
+            "--output_file", output_audio_file_path,
+        ]
 
-        print(f"VoiceInterface: Running TTS command: {command}")
+        print(f"VoiceInterface: Running TTS command: {' '.join(command)}")
 
         try:
-            # Using shell=True here because of the pipe. Be cautious with shell=True if text_to_speak is user-supplied directly without sanitization.
-            process = subprocess.run(command, shell=True, capture_output=True, text=True, check=True, encoding='utf-8')
-            if process.stderr: # Piper might output info to stderr
-                print(f"Piper TTS stderr: {process.stderr.strip()}")
+            process = await asyncio.create_subprocess_exec(
+                *command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            stdout_bytes, stderr_bytes = await process.communicate(text_to_speak.encode('utf-8'))
+            stdout = stdout_bytes.decode('utf-8', errors='replace')
+            stderr = stderr_bytes.decode('utf-8', errors='replace')
+            if process.returncode != 0:
+                print(f"Error during Piper TTS execution: exit status {process.returncode}")
+                print(f"Stdout: {stdout}")
+                print(f"Stderr: {stderr}")
+                if os.path.exists(output_audio_file_path) and output_audio_file_path.startswith(tempfile.gettempdir()):
+                    os.remove(output_audio_file_path) # Clean up temp file
+                return None
+            if stderr: # Piper might output info to stderr
+                print(f"Piper TTS stderr: {stderr.strip()}")
             if os.path.exists(output_audio_file_path) and os.path.getsize(output_audio_file_path) > 0:
                 print(f"VoiceInterface: TTS successful. Audio saved to: {output_audio_file_path}")
                 return output_audio_file_path
             else:
                 print(f"Error: TTS output file not created or is empty at {output_audio_file_path}")
-                print(f"Stdout: {process.stdout}")
-                print(f"Stderr: {process.stderr}")
+                print(f"Stdout: {stdout}")
+                print(f"Stderr: {stderr}")
                 if os.path.exists(output_audio_file_path) and output_audio_file_path.startswith(tempfile.gettempdir()):
                     os.remove(output_audio_file_path) # Clean up temp file on failure
                 return None
@@ -136,18 +422,33 @@ class VoiceInterfaceService:
         except FileNotFoundError:
             print(f"Error: Piper TTS executable not found at '{self.piper_tts_path}'. Please check configuration or PATH.")
             return None
-        except subprocess.CalledProcessError as e:
-            print(f"Error during Piper TTS execution: {e}")
-            print(f"Stdout: {e.stdout}")
-            print(f"Stderr: {e.stderr}")
+        except Exception as e_gen:
+            print(f"An unexpected error occurred during TTS: {e_gen}")
             if os.path.exists(output_audio_file_path) and output_audio_file_path.startswith(tempfile.gettempdir()):
                 os.remove(output_audio_file_path) # Clean up temp file
             return None
+
+    async def _text_to_speech_in_process(self, text_to_speak: str, output_audio_file_path: str) -> Optional[str]:
+        """TTS through the piper-tts package: no piper process or model load per call. Runs off the event loop."""
+        try:
+            await asyncio.to_thread(self._synthesize_with_voice, text_to_speak, output_audio_file_path)
         except Exception as e_gen:
             print(f"An unexpected error occurred during TTS: {e_gen}")
             if os.path.exists(output_audio_file_path) and output_audio_file_path.startswith(tempfile.gettempdir()):
                 os.remove(output_audio_file_path) # Clean up temp file
             return None
+        print(f"VoiceInterface: TTS successful. Audio saved to: {output_audio_file_path}")
+        return output_audio_file_path
+
+    def _synthesize_with_voice(self, text_to_speak: str, output_audio_file_path: str):
+        with self._piper_voice_lock: # Concurrent first calls load the voice once
+            if self._piper_voice is None:
+                print(f"VoiceInterface: Loading Piper voice {self.piper_model_path}")
+                # Piper's ONNX session can use CUDA; other GPUs (Metal/CoreML) aren't exposed by PiperVoice.load
+                use_cuda = self.device == "cuda" or (self.device == "auto" and _onnx_cuda_available())
+                self._piper_voice = PiperVoice.load(self.piper_model_path, config_path=self.piper_config_path, use_cuda=use_cuda)
+        with wave.open(output_audio_file_path, 'wb') as wav_file:
+            self._piper_voice.synthesize(text_to_speak, wav_file)
 
     async def play_audio_file(self, audio_file_path: str):
         """
@@ -3,16 +3,18 @@ from typing_extensions import Annotated
 from typing import Optional
 import os # For path operations if needed
 
-app = typer.Typer(help="Manage Mindscape Agents.", no_args_is_help=True)
+from ..utils.output import WARN_PREFIX, info
 
-@app.command()
-def list():
+app = typer.Typer(help="Manage Mindscape Agents.", no_args_is_help=True, rich_markup_mode=None)
+
+@app.command(name="list") # Not named `list`, which would shadow the builtin in this module
+def list_agents():
     """
     List all registered Mindscape Agents.
     """
-    typer.echo("Listing Mindscape Agents:")
+    info("Listing Mindscape Agents:")
     # TODO: Implement agent listing logic
-    typer.secho("Agent listing logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Agent listing logic not yet implemented.")
     typer.echo("1. FocusMind (ID: agent-focus, Status: Active)")
     typer.echo("2. CalendarMind (ID: agent-calendar, Status: Inactive)")
 
@@ -24,10 +26,10 @@ def deploy(
     """
     Deploy a new Mindscape Agent from a manifest file.
     """
-    typer.echo(f"Deploying agent from manifest: {manifest_path}")
+    info(f"Deploying agent from manifest: {manifest_path}")
     # TODO: Implement agent deployment logic (parse manifest, register agent)
-    typer.secho("Agent deployment logic not yet implemented.", fg=typer.colors.YELLOW)
-    typer.echo(f"Successfully initiated deployment for agent defined in {os.path.basename(manifest_path)}")
+    typer.echo(WARN_PREFIX + "Agent deployment logic not yet implemented.")
+    info(f"Successfully initiated deployment for agent defined in {os.path.basename(manifest_path)}")
 
 @app.command()
 def run(
@@ -37,9 +39,9 @@ def run(
     """
     Run a specific task with a Mindscape Agent.
     """
-    typer.echo(f"Running agent '{agent_id}' with task: '{task_description}'")
+    info(f"Running agent '{agent_id}' with task: '{task_description}'")
     # TODO: Implement agent task execution logic
-    typer.secho("Agent task execution logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Agent task execution logic not yet implemented.")
 
 @app.command()
 def status(
@@ -48,9 +50,9 @@ def status(
     """
     Get the status of a specific Mindscape Agent.
     """
-    typer.echo(f"Getting status for agent: {agent_id}")
+    info(f"Getting status for agent: {agent_id}")
     # TODO: Implement agent status logic
-    typer.secho("Agent status logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Agent status logic not yet implemented.")
     typer.echo(f"Status: Active, Last Run: 2025-05-19T09:00:00Z, Current Task: Idle")
 
 @app.command()
@@ -62,9 +64,9 @@ def approve_permissions(
     Approve pending permissions for an agent.
     """
     permission_list = [p.strip() for p in permissions.split(',')]
-    typer.echo(f"Approving permissions for agent '{agent_id}': {permission_list}")
+    info(f"Approving permissions for agent '{agent_id}': {permission_list}")
     # TODO: Implement permission approval logic
-    typer.secho("Agent permission approval logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Agent permission approval logic not yet implemented.")
 
 
 if __name__ == "__main__":
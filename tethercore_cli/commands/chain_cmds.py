@@ -1,27 +1,45 @@
+import json
+import sys
 import typer
+from rich.console import Console
+from rich.table import Table
 from typing_extensions import Annotated
 from typing import Optional
 
-app = typer.Typer(help="Interact with TetherChain (memory log and versioning).", no_args_is_help=True)
+from ..utils.output import WARN_PREFIX, info
+
+app = typer.Typer(help="Interact with TetherChain (memory log and versioning).", no_args_is_help=True, rich_markup_mode=None)
 
 @app.command()
 def log(
     echo_id: Annotated[Optional[str], typer.Option("--echo-id", "-e", help="Log operations related to a specific Echo ID.")] = None,
     limit: Annotated[int, typer.Option(help="Maximum number of log entries to show.")] = 20,
+    output_json: Annotated[bool, typer.Option("--json", help="Print the entries as a JSON array instead of a table.")] = False,
 ):
     """
     View the TetherChain log.
     """
+    # TODO: Implement actual TetherChain log viewing logic (placeholder rows below)
+    rows = [
+        {"timestamp": "2025-05-19", "action": "ECHO_CREATED", "echo_id": "xyz123", "details": "Initial creation"},
+        {"timestamp": "2025-05-18", "action": "AGENT_ACTION", "echo_id": "", "details": "FocusMind started task"},
+    ][:limit]
+    if output_json:
+        sys.stdout.write(json.dumps(rows) + "\n") # The whole log in one write, nothing else on stdout
+        return
+
     if echo_id:
-        typer.echo(f"Viewing TetherChain log for Echo ID: {echo_id} (limit: {limit})")
+        info(f"Viewing TetherChain log for Echo ID: {echo_id} (limit: {limit})")
     else:
-        typer.echo(f"Viewing global TetherChain log (limit: {limit})")
-    # TODO: Implement actual TetherChain log viewing logic
-    typer.secho("TetherChain log viewing logic not yet implemented.", fg=typer.colors.YELLOW)
-    typer.echo("Timestamp | Action        | Echo ID | Details")
-    typer.echo("----------|---------------|---------|--------------------")
-    typer.echo("2025-05-19 | ECHO_CREATED  | xyz123  | Initial creation")
-    typer.echo("2025-05-18 | AGENT_ACTION  |         | FocusMind started task")
+        info(f"Viewing global TetherChain log (limit: {limit})")
+    typer.echo(WARN_PREFIX + "TetherChain log viewing logic not yet implemented.")
+    # Build the whole table and print it once, rather than echoing (and flushing) row by row
+    table = Table(show_header=True)
+    for column in ("Timestamp", "Action", "Echo ID", "Details"):
+        table.add_column(column)
+    for row in rows:
+        table.add_row(row["timestamp"], row["action"], row["echo_id"], row["details"])
+    Console().print(table)
 
 
 @app.command()
@@ -33,10 +51,10 @@ def commit_echo(
     Manually commit the current state of an Echo to TetherChain.
     (Automatic commits might also occur based on system events)
     """
-    typer.echo(f"Committing Echo ID: {echo_id} to TetherChain.")
-    typer.echo(f"Message: {message}")
+    info(f"Committing Echo ID: {echo_id} to TetherChain.")
+    info(f"Message: {message}")
     # TODO: Implement Echo commit logic
-    typer.secho("TetherChain Echo commit logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "TetherChain Echo commit logic not yet implemented.")
 
 
 @app.command()
@@ -46,9 +64,9 @@ def rollback_preview(
     """
     Preview the changes that would occur if rolling back to a specific commit.
     """
-    typer.echo(f"Previewing rollback to TetherChain commit ID: {commit_id}")
+    info(f"Previewing rollback to TetherChain commit ID: {commit_id}")
     # TODO: Implement rollback preview logic
-    typer.secho("TetherChain rollback preview logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "TetherChain rollback preview logic not yet implemented.")
 
 if __name__ == "__main__":
     app()
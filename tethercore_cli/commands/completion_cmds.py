@@ -0,0 +1,55 @@
+import os
+import shutil
+import typer
+from enum import Enum
+from pathlib import Path
+from typing_extensions import Annotated
+
+from ..utils.output import info
+
+app = typer.Typer(help="Install shell completion for tether-cli.", no_args_is_help=True, rich_markup_mode=None)
+
+# Pre-generated completion scripts shipped with the package. Unlike Typer's add_completion, which calls back
+# into tether-cli on every tab press, these complete from static word lists and never start Python.
+COMPLETIONS_DIR = Path(__file__).resolve().parent.parent / "completions"
+
+class Shell(str, Enum):
+    bash = "bash"
+    zsh = "zsh"
+    fish = "fish"
+
+# shell -> (script in COMPLETIONS_DIR, where that shell picks up per-user completions)
+_COMPLETION_FILES = {
+    Shell.bash: ("tether-cli.bash", "~/.local/share/bash-completion/completions/tether-cli"),
+    Shell.zsh: ("_tether-cli", "~/.zfunc/_tether-cli"),
+    Shell.fish: ("tether-cli.fish", "~/.config/fish/completions/tether-cli.fish"),
+}
+
+@app.command()
+def show(
+    shell: Annotated[Shell, typer.Argument(help="Shell to print the completion script for.")]
+):
+    """
+    Print the completion script for a shell (e.g., to source it or install it manually).
+    """
+    script_name, _ = _COMPLETION_FILES[shell]
+    typer.echo((COMPLETIONS_DIR / script_name).read_text(), nl=False)
+
+@app.command()
+def install(
+    shell: Annotated[Shell, typer.Argument(help="Shell to install completion for.")]
+):
+    """
+    Copy the completion script for a shell to where that shell loads user completions from.
+    """
+    script_name, install_path = _COMPLETION_FILES[shell]
+    target = Path(os.path.expanduser(install_path))
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(COMPLETIONS_DIR / script_name, target)
+    info(f"Installed {shell.value} completion to {target}")
+    if shell is Shell.zsh:
+        info("Make sure ~/.zfunc is on your fpath before compinit, e.g. add to ~/.zshrc: fpath=(~/.zfunc $fpath)")
+    info("Start a new shell for it to take effect.")
+
+if __name__ == "__main__":
+    app()
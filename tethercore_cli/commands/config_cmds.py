@@ -1,13 +1,14 @@
 import typer
+import yaml
 from typing_extensions import Annotated
 from typing import Optional
 import os
+from pathlib import Path
 
-app = typer.Typer(help="Manage TetherCore configuration.", no_args_is_help=True)
+from ..utils.config_file import config_path as _config_path, dump_yaml as _dump_yaml, load_config as _load_config
+from ..utils.output import RED, WARN_PREFIX, info
 
-# Assuming your config is loaded from a known path or via an environment variable
-# This path might be better managed by a central config loader in your core engine.
-DEFAULT_CONFIG_PATH = "config/tether_config.yaml" # Example
+app = typer.Typer(help="Manage TetherCore configuration.", no_args_is_help=True, rich_markup_mode=None)
 
 @app.command()
 def show(
@@ -16,18 +17,27 @@ def show(
     """
     Show the current TetherCore configuration.
     """
-    config_path = os.getenv("TETHER_CONFIG_PATH", DEFAULT_CONFIG_PATH)
-    typer.echo(f"Showing configuration (from {config_path}):")
-    # TODO: Implement logic to load and display configuration
-    # You would typically use PyYAML here to load the YAML file.
-    typer.secho(f"Configuration loading and display logic not yet implemented.", fg=typer.colors.YELLOW)
+    config_path = _config_path()
+    try:
+        config = _load_config(config_path)
+    except FileNotFoundError:
+        typer.secho(f"Configuration file not found: {os.path.abspath(config_path)}", fg=RED)
+        raise typer.Exit(code=1) from None
+    except yaml.YAMLError as e:
+        typer.secho(f"Error parsing configuration file {config_path}: {e}", fg=RED)
+        raise typer.Exit(code=1) from None
+
+    info(f"Showing configuration (from {config_path}):")
     if key:
-        typer.echo(f"Value for '{key}': <placeholder_value_for_{key}>")
+        value = config
+        for part in key.split('.'):
+            if not isinstance(value, dict) or part not in value:
+                typer.secho(f"Key '{key}' not found in configuration.", fg=RED)
+                raise typer.Exit(code=1)
+            value = value[part]
+        typer.echo(_dump_yaml({key: value}))
     else:
-        typer.echo("llm_router:")
-        typer.echo("  default_model: ollama/mistral")
-        typer.echo("memory_graph:")
-        typer.echo("  provider: weaviate")
+        typer.echo(_dump_yaml(config))
 
 
 @app.command()
@@ -39,12 +49,12 @@ def set_value( # Be very careful with commands that modify config files directly
     """
     Set a configuration value (use with caution, may require manual file editing for complex structures).
     """
-    config_path = os.getenv("TETHER_CONFIG_PATH", DEFAULT_CONFIG_PATH)
-    typer.secho(f"WARNING: Modifying configuration files directly via CLI can be risky.", fg=typer.colors.RED)
-    typer.echo(f"Attempting to set '{key}' to '{value}' in {config_path}")
+    config_path = _config_path()
+    typer.secho(f"WARNING: Modifying configuration files directly via CLI can be risky.", fg=RED)
+    info(f"Attempting to set '{key}' to '{value}' in {config_path}")
     # TODO: Implement logic to load, modify, and save configuration
-    typer.secho(f"Configuration setting logic not yet implemented.", fg=typer.colors.YELLOW)
-    typer.secho(f"Please consider editing '{config_path}' manually for complex changes.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Configuration setting logic not yet implemented.")
+    typer.echo(WARN_PREFIX + f"Please consider editing '{config_path}' manually for complex changes.")
 
 
 @app.command()
@@ -52,11 +62,11 @@ def locate():
     """
     Show the location of the currently used configuration file.
     """
-    config_path = os.getenv("TETHER_CONFIG_PATH", DEFAULT_CONFIG_PATH)
-    if os.path.exists(config_path):
-        typer.echo(f"Current configuration file location: {os.path.abspath(config_path)}")
+    config_path = Path(_config_path()).resolve() # Absolute path, resolved once for both branches
+    if config_path.is_file():
+        typer.echo(f"Current configuration file location: {config_path}")
     else:
-        typer.secho(f"Configuration file not found at default location: {os.path.abspath(config_path)}", fg=typer.colors.RED)
+        typer.secho(f"Configuration file not found at default location: {config_path}", fg=RED)
         typer.echo("Ensure TETHER_CONFIG_PATH is set or the file exists at the default path.")
 
 
@@ -1,40 +1,83 @@
+import json
+import re
 import typer
 from typing_extensions import Annotated
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-app = typer.Typer(help="Manage Echos (memories, thoughts, goals).", no_args_is_help=True)
+from ..utils.output import WARN_PREFIX, info
+
+app = typer.Typer(help="Manage Echos (memories, thoughts, goals).", no_args_is_help=True, rich_markup_mode=None)
+
+# Splits comma-separated tags and strips the whitespace around them in one pass
+_TAG_SEPARATOR = re.compile(r"\s*,\s*")
+
+def _parse_tags(tags: str) -> List[str]:
+    return _TAG_SEPARATOR.split(tags.strip())
+
+def _read_echo_records(batch_file: typer.FileText) -> Iterator[Dict[str, Any]]:
+    """Yields {content, tags} records from newline-delimited JSON, skipping blank lines."""
+    for line_number, line in enumerate(batch_file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise typer.BadParameter(f"line {line_number}: invalid JSON ({e.msg})", param_hint="'--from-file'") from e
+        if not isinstance(record, dict) or not record.get("content"):
+            raise typer.BadParameter(f"line {line_number}: expected an object with a 'content' field", param_hint="'--from-file'")
+        tags = record.get("tags") or []
+        if isinstance(tags, str): # Same comma-separated form as --tags
+            tags = _parse_tags(tags)
+        elif not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise typer.BadParameter(f"line {line_number}: 'tags' must be a list of strings or a comma-separated string", param_hint="'--from-file'")
+        yield {"content": record["content"], "tags": tags}
+
+def _create_echo_batch(batch_file: typer.FileText):
+    # Every record is read and checked up front so a bad line is reported before anything would be created
+    records = list(_read_echo_records(batch_file))
+    info(f"Read {len(records)} Echo(s) from {batch_file.name}.")
+    # TODO: Hand the records to the memory graph's add_echos in chunks once the CLI talks to the backend
 
 @app.command()
 def create(
-    content: Annotated[str, typer.Argument(help="The textual content of the Echo.")],
+    content: Annotated[Optional[str], typer.Argument(help="The textual content of the Echo (omit when using --from-file).")] = None,
     tags: Annotated[Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags for the Echo (e.g., 'work,idea,project-x').")] = None,
+    batch_file: Annotated[Optional[typer.FileText], typer.Option("--from-file", help="Create Echos in bulk from newline-delimited JSON records like {\"content\": \"...\", \"tags\": [\"...\"]}. Use '-' for stdin.")] = None,
 ):
     """
-    Create a new Echo in the Memory Graph.
+    Create a new Echo in the Memory Graph, or many at once with --from-file.
     """
-    typer.echo(f"Attempting to create Echo with content: '{content}'")
+    if batch_file is not None:
+        if content is not None or tags:
+            raise typer.BadParameter("CONTENT and --tags can't be combined with --from-file.", param_hint="'--from-file'")
+        _create_echo_batch(batch_file)
+        typer.echo(WARN_PREFIX + "Batch Echo creation logic not yet implemented; no Echos were created.")
+        return
+    if content is None:
+        raise typer.BadParameter("Provide the Echo content or use --from-file.", param_hint="'CONTENT'")
+    info(f"Attempting to create Echo with content: '{content}'")
     if tags:
-        tag_list = [tag.strip() for tag in tags.split(',')]
-        typer.echo(f"Tags: {tag_list}")
+        tag_list = _parse_tags(tags)
+        info(f"Tags: {tag_list}")
     else:
-        typer.echo("No tags provided.")
+        info("No tags provided.")
     # TODO: Implement actual Echo creation logic by calling the backend service
-    typer.secho("Echo creation logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Echo creation logic not yet implemented.")
 
-@app.command()
-def list(
+@app.command(name="list") # Not named `list`, which would shadow the builtin in this module
+def list_echos(
     tags: Annotated[Optional[str], typer.Option("--tags", "-t", help="Filter Echos by comma-separated tags.")] = None,
     limit: Annotated[int, typer.Option(help="Maximum number of Echos to list.")] = 10,
 ):
     """
     List existing Echos from the Memory Graph.
     """
-    typer.echo(f"Listing Echos (limit: {limit}):")
+    info(f"Listing Echos (limit: {limit}):")
     if tags:
-        tag_list = [tag.strip() for tag in tags.split(',')]
-        typer.echo(f"Filtering by tags: {tag_list}")
+        tag_list = _parse_tags(tags)
+        info(f"Filtering by tags: {tag_list}")
     # TODO: Implement actual Echo listing logic
-    typer.secho("Echo listing logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Echo listing logic not yet implemented.")
     typer.echo("1. Example Echo 1 (id: xyz123, tags: [work, important])")
     typer.echo("2. Example Echo 2 (id: abc987, tags: [personal, idea])")
 
@@ -45,9 +88,9 @@ def view(
     """
     View the details of a specific Echo.
     """
-    typer.echo(f"Viewing details for Echo ID: {echo_id}")
+    info(f"Viewing details for Echo ID: {echo_id}")
     # TODO: Implement actual Echo viewing logic
-    typer.secho("Echo viewing logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Echo viewing logic not yet implemented.")
     typer.echo(f"Content: This is the detailed content of Echo {echo_id}.")
     typer.echo("Tags: [example, detail]")
     typer.echo("Created: 2025-05-19T10:00:00Z")
@@ -62,16 +105,13 @@ def shatter(
     Shatter (permanently delete) an Echo from the Memory Graph.
     """
     if not force:
-        confirm = typer.confirm(f"Are you sure you want to shatter Echo ID: {echo_id}?", abort=True)
-        if not confirm: # Should be redundant due to abort=True, but good practice
-            typer.echo("Shatter operation cancelled.")
-            raise typer.Exit()
+        typer.confirm(f"Are you sure you want to shatter Echo ID: {echo_id}?", abort=True) # Raises typer.Abort on "no"
 
-    typer.echo(f"Shattering Echo ID: {echo_id}")
+    info(f"Shattering Echo ID: {echo_id}")
     if reason:
-        typer.echo(f"Reason: {reason}")
+        info(f"Reason: {reason}")
     # TODO: Implement actual Echo shattering logic
-    typer.secho("Echo shattering logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "Echo shattering logic not yet implemented.")
 
 if __name__ == "__main__":
     app()
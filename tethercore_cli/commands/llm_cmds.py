@@ -1,7 +1,14 @@
 import typer
+import yaml
 from typing_extensions import Annotated
 
-app = typer.Typer(help="Test LLM routing and interactions.", no_args_is_help=True)
+from ..utils.config_file import config_path, load_config
+from ..utils.output import RED, WARN_PREFIX, info
+
+app = typer.Typer(help="Test LLM routing and interactions.", no_args_is_help=True, rich_markup_mode=None)
+
+# Mirrors the llm_router.available_models default in tethercore_engine.core.config_loader
+DEFAULT_MODELS = ("ollama/mistral", "ollama/phi-3")
 
 @app.command()
 def query(
@@ -11,14 +18,14 @@ def query(
     """
     Send a query through LiteLLM to an LLM and get a response.
     """
-    typer.echo(f"Sending prompt to LLM: '{prompt}'")
+    info(f"Sending prompt to LLM: '{prompt}'")
     if model:
-        typer.echo(f"Attempting to use model: {model}")
+        info(f"Attempting to use model: {model}")
     else:
-        typer.echo("Using default LiteLLM routing.")
+        info("Using default LiteLLM routing.")
 
     # TODO: Implement actual LiteLLM query logic
-    typer.secho("LLM query logic not yet implemented.", fg=typer.colors.YELLOW)
+    typer.echo(WARN_PREFIX + "LLM query logic not yet implemented.")
     typer.echo("LLM Response: This is a placeholder response from the LLM.")
 
 @app.command()
@@ -26,13 +33,26 @@ def models():
     """
     List available models configured through LiteLLM.
     """
-    typer.echo("Listing available LLM models (via LiteLLM configuration):")
-    # TODO: Implement logic to fetch and display available models from LiteLLM config
-    typer.secho("LLM model listing logic not yet implemented.", fg=typer.colors.YELLOW)
-    typer.echo("- ollama/mistral (local)")
-    typer.echo("- ollama/phi-3 (local)")
-    typer.echo("- openai/gpt-3.5-turbo (cloud, if configured)")
+    # Read straight from the config file (parsed once per process, keyed on its mtime) rather than importing
+    # LiteLLM or the engine's config model just to print a list.
+    path = config_path()
+    try:
+        cfg = load_config(path)
+    except FileNotFoundError:
+        typer.echo(WARN_PREFIX + f"Configuration file not found at {path}; showing the default models.")
+        cfg = {}
+    except yaml.YAMLError as e:
+        typer.secho(f"Error parsing configuration file {path}: {e}", fg=RED)
+        raise typer.Exit(code=1) from e
+    # An empty file or a non-mapping top level (or llm_router section) just means nothing is configured
+    router_config = cfg.get("llm_router") if isinstance(cfg, dict) else None
+    if not isinstance(router_config, dict):
+        router_config = {}
 
+    default_model = router_config.get("default_model")
+    info("Listing available LLM models (via LiteLLM configuration):")
+    for model in router_config.get("available_models") or DEFAULT_MODELS:
+        typer.echo(f"- {model}" + (" (default)" if model == default_model else ""))
 
 if __name__ == "__main__":
     app()
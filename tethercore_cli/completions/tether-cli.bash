@@ -0,0 +1,21 @@
+# bash completion for tether-cli. Static on purpose: completing never starts Python.
+# Keep the word lists in sync with tethercore_cli/main.py and tethercore_cli/commands/*_cmds.py.
+_tether_cli() {
+    local cur=${COMP_WORDS[COMP_CWORD]} words=""
+    if (( COMP_CWORD == 1 )); then
+        words="echo chain agent llm config completion --version --quiet --help"
+    elif (( COMP_CWORD == 2 )); then
+        case ${COMP_WORDS[1]} in
+            echo) words="create list view shatter --help" ;;
+            chain) words="log commit-echo rollback-preview --help" ;;
+            agent) words="list deploy run status approve-permissions --help" ;;
+            llm) words="query models --help" ;;
+            config) words="show set-value locate --help" ;;
+            completion) words="show install --help" ;;
+        esac
+    elif (( COMP_CWORD == 3 )) && [[ ${COMP_WORDS[1]} == completion ]]; then
+        words="bash zsh fish"
+    fi
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}
+complete -o default -F _tether_cli tether-cli
@@ -0,0 +1,13 @@
+# fish completion for tether-cli. Static on purpose: completing never starts Python.
+# Keep the word lists in sync with tethercore_cli/main.py and tethercore_cli/commands/*_cmds.py.
+complete -c tether-cli -n __fish_use_subcommand -f -a "echo chain agent llm config completion"
+complete -c tether-cli -n __fish_use_subcommand -s v -l version -d "Show the application version and exit"
+complete -c tether-cli -n __fish_use_subcommand -s q -l quiet -d "Only print results, warnings and errors"
+complete -c tether-cli -n "__fish_seen_subcommand_from echo; and not __fish_seen_subcommand_from create list view shatter" -f -a "create list view shatter"
+complete -c tether-cli -n "__fish_seen_subcommand_from chain; and not __fish_seen_subcommand_from log commit-echo rollback-preview" -f -a "log commit-echo rollback-preview"
+complete -c tether-cli -n "__fish_seen_subcommand_from agent; and not __fish_seen_subcommand_from list deploy run status approve-permissions" -f -a "list deploy run status approve-permissions"
+complete -c tether-cli -n "__fish_seen_subcommand_from llm; and not __fish_seen_subcommand_from query models" -f -a "query models"
+complete -c tether-cli -n "__fish_seen_subcommand_from config; and not __fish_seen_subcommand_from show set-value locate" -f -a "show set-value locate"
+complete -c tether-cli -n "__fish_seen_subcommand_from completion; and not __fish_seen_subcommand_from show install" -f -a "show install"
+complete -c tether-cli -n "__fish_seen_subcommand_from completion; and __fish_seen_subcommand_from show install; and not __fish_seen_subcommand_from bash zsh fish" -f -a "bash zsh fish"
+complete -c tether-cli -l help -d "Show help and exit"
@@ -1,32 +1,57 @@
+import importlib
 import typer
+from typer.core import TyperGroup
 from typing_extensions import Annotated
 
-# Import command groups
-from .commands import echo_cmds
-from .commands import chain_cmds
-from .commands import agent_cmds
-from .commands import llm_cmds
-from .commands import config_cmds
+from .utils.output import set_quiet
+
+# Command groups: name -> (module defining its Typer `app`, help). A group's module is imported only when that
+# group is dispatched (or listed by --help), so e.g. `tether-cli chain log` doesn't load the other groups.
+_COMMAND_GROUPS = {
+    "echo": (".commands.echo_cmds", "Manage Echos (memories, thoughts, goals)."),
+    "chain": (".commands.chain_cmds", "Interact with TetherChain (memory log)."),
+    "agent": (".commands.agent_cmds", "Manage Mindscape Agents."),
+    "llm": (".commands.llm_cmds", "Test LLM routing and interactions."),
+    "config": (".commands.config_cmds", "Manage TetherCore configuration."),
+    "completion": (".commands.completion_cmds", "Install shell completion for tether-cli."),
+}
+
+class _LazyCommandGroups(TyperGroup):
+    """Root command that resolves the command groups in _COMMAND_GROUPS on demand."""
+    def list_commands(self, ctx):
+        return [*super().list_commands(ctx), *(name for name in _COMMAND_GROUPS if name not in self.commands)]
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in _COMMAND_GROUPS:
+            module_name, help_text = _COMMAND_GROUPS[cmd_name]
+            command = typer.main.get_group(importlib.import_module(module_name, __package__).app) # No per-group completion options
+            command.name, command.help = cmd_name, help_text
+            self.commands[cmd_name] = command # Later lookups skip the import and conversion
+        return command
 
 # Create the main Typer application instance
 app = typer.Typer(
     name="tether-cli",
     help="TetherCore: A Sovereign AI Companion - Command Line Interface.",
-    add_completion=False, # Disable shell completion for now, can be enabled later
+    cls=_LazyCommandGroups,
+    rich_markup_mode=None, # Plain click help/errors: skips loading Rich's formatter on --help and usage errors
+    add_completion=False, # Typer's completion calls back into Python per tab; `tether-cli completion` installs static scripts instead
     no_args_is_help=True   # Show help if no command is given
 )
 
-# Add subcommands (routers) from the command modules
-app.add_typer(echo_cmds.app, name="echo", help="Manage Echos (memories, thoughts, goals).")
-app.add_typer(chain_cmds.app, name="chain", help="Interact with TetherChain (memory log).")
-app.add_typer(agent_cmds.app, name="agent", help="Manage Mindscape Agents.")
-app.add_typer(llm_cmds.app, name="llm", help="Test LLM routing and interactions.")
-app.add_typer(config_cmds.app, name="config", help="Manage TetherCore configuration.")
 
+def _version_callback(value: bool):
+    # Eager option: runs while the root options are parsed, before any subcommand is resolved or imported,
+    # so `tether-cli --version` works on its own and returns without loading the command groups.
+    if value:
+        from . import __version__ # Import from the package __init__
+        typer.echo(f"tether-cli version: {__version__}")
+        raise typer.Exit()
 
 @app.callback()
 def main_callback(
-    ctx: typer.Context,
+    # Add `ctx: typer.Context` back once the callback needs ctx.obj (see the example at the end)
     # Example of a global option, e.g., for a config file path
     # config_file: Annotated[
     #     Optional[Path],
@@ -39,17 +64,18 @@ def main_callback(
     # ] = None,
     version: Annotated[
         bool,
-        typer.Option("--version", "-v", help="Show the application version and exit."),
+        typer.Option("--version", "-v", help="Show the application version and exit.",
+                     callback=_version_callback, is_eager=True),
+    ] = False,
+    quiet: Annotated[
+        bool,
+        typer.Option("--quiet", "-q", help="Only print results, warnings and errors (no progress messages)."),
     ] = False,
 ):
     """
     TetherCore CLI main entry point.
     """
-    if version:
-        from . import __version__ # Import from the package __init__
-        typer.echo(f"tether-cli version: {__version__}")
-        raise typer.Exit()
-
+    set_quiet(quiet)
     # You can load configuration or initialize services here if needed globally
     # For example:
     # if config_file:
@@ -58,7 +84,7 @@ def main_callback(
     # else:
     #     typer.echo("No config file specified. Using default settings.")
     #
-    # ctx.obj = {"config_file": config_file, "some_service": SomeService()}
+    # ctx.obj = {"config_file": config_file, "some_service": SomeService()} # Needs the ctx parameter
 
 
 if __name__ == "__main__":
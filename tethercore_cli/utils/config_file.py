@@ -0,0 +1,42 @@
+"""
+Reading the TetherCore YAML config file from CLI commands.
+Kept separate from tethercore_engine.core.config_loader so simple commands don't pay for the engine's
+pydantic-settings config model; this returns the file's raw parsed tree.
+"""
+import functools
+import os
+from typing import Any
+
+import yaml
+
+# Assuming your config is loaded from a known path or via an environment variable
+# This path might be better managed by a central config loader in your core engine.
+DEFAULT_CONFIG_PATH = "config/tether_config.yaml" # Example
+
+# libyaml-backed loader/dumper when PyYAML was built with it; same safe semantics, much faster.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+def dump_yaml(data: Any) -> str:
+    return yaml.dump(data, Dumper=_SafeDumper, sort_keys=False).rstrip()
+
+@functools.lru_cache(maxsize=1)
+def config_path() -> str:
+    # TETHER_CONFIG_PATH can't change during a CLI run, so it is read once
+    return os.getenv("TETHER_CONFIG_PATH", DEFAULT_CONFIG_PATH)
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int) -> Any:
+    # mtime_ns is only part of the cache key: editing the file yields a new key and a fresh parse.
+    # The cached tree is shared, so callers must not mutate it.
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
+
+def load_config(path: str) -> Any:
+    """
+    Parsed config file, re-parsed only when its modification time changes.
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+        yaml.YAMLError: If the file isn't valid YAML.
+    """
+    return _parse_config(path, os.stat(path).st_mtime_ns)
@@ -0,0 +1,23 @@
+"""
+Console output helpers shared by the CLI commands.
+"""
+import typer
+
+# Set from the root --quiet/-q option, before any command runs
+_QUIET = False
+# Styled once at import, so warning lines are a plain concatenation instead of a secho() styling call each
+WARN_PREFIX = typer.style("[WARN] ", fg=typer.colors.YELLOW)
+# Bound once so secho() calls skip the typer.colors attribute lookups
+RED = typer.colors.RED
+
+def set_quiet(quiet: bool):
+    global _QUIET
+    _QUIET = quiet
+
+def info(message: str):
+    """
+    Echoes an informational/progress line, unless --quiet was given.
+    Command results, warnings and errors go through typer.echo/secho directly and are always shown.
+    """
+    if not _QUIET:
+        typer.echo(message)